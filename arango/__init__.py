@@ -7,6 +7,8 @@ from arango.api import API
 from arango.exceptions import *
 from arango.constants import HTTP_OK, LOG_LEVELS, DEFAULT_DATABASE
 from arango.clients import DefaultClient
+from arango.endpoints import EndpointPool, endpoint_url
+from arango.serializers import get_serializer
 from arango.utils import uncamelify
 
 
@@ -20,9 +22,19 @@ class Arango(object):
     """
 
     def __init__(self, protocol="http", host="localhost", port=8529,
-                 username="root", password="", client=None):
+                 username="root", password="", client=None,
+                 pool_connections=10, pool_maxsize=10, pool_block=False,
+                 max_retries=0, keep_alive=True, idle_timeout=None,
+                 hosts=None, strategy="round_robin", probe_interval=10,
+                 serializer=None):
         """Initialize the wrapper object.
 
+        If ``hosts`` is given, the requests are spread over all of them (e.g.
+        the coordinators of a cluster) using the load balancing ``strategy``,
+        which must be one of 'round_robin', 'random' or 'least_outstanding'.
+        Hosts whose connections fail are ejected until a health probe on
+        ``HEAD /_api/version`` succeeds again.
+
         :param protocol: the internet transfer protocol (default: 'http')
         :type protocol: str
         :param host: ArangoDB host (default: 'localhost')
@@ -35,21 +47,64 @@ class Arango(object):
         :type password: str
         :param client: HTTP client for this wrapper to use
         :type client: arango.clients.base.BaseClient or None
-        :raises: ConnectionError
+        :param pool_connections: the number of per-host pools to cache
+        :type pool_connections: int
+        :param pool_maxsize: the max number of pooled connections per host
+        :type pool_maxsize: int
+        :param pool_block: block until a pooled connection is free
+        :type pool_block: bool
+        :param max_retries: the number of retries on failed connections
+        :type max_retries: int
+        :param keep_alive: whether or not to keep connections open
+        :type keep_alive: bool
+        :param idle_timeout: drop pooled connections idle for this many seconds
+        :type idle_timeout: int or float or None
+        :param hosts: 'host:port' strings, URLs or (host, port) tuples
+        :type hosts: list or None
+        :param strategy: the load balancing strategy across ``hosts``
+        :type strategy: str
+        :param probe_interval: seconds between probes of an ejected host
+        :type probe_interval: int or float
+        :param serializer: the JSON serializer for the request and response
+            payloads: 'json' (default), 'orjson', 'rapidjson', 'ujson', 'auto'
+            (the fastest one installed) or a serializer object
+        :type serializer: str or arango.serializers.BaseSerializer or None
+        :raises: ConnectionError, EndpointUnavailableError,
+            InvalidArgumentError
         """
         self.protocol = protocol
         self.host = host
         self.port = port
         self.username = username
         self.password = password
+        self.serializer = get_serializer(serializer)
 
         # Initialize the ArangoDB HTTP Client if not given
         if client is not None:
             self.client = client
         else:
-            client_init_data = {"auth": (self.username, self.password)}
+            client_init_data = {
+                "auth": (self.username, self.password),
+                "pool_connections": pool_connections,
+                "pool_maxsize": pool_maxsize,
+                "pool_block": pool_block,
+                "max_retries": max_retries,
+                "keep_alive": keep_alive,
+                "idle_timeout": idle_timeout,
+            }
             self.client = DefaultClient(client_init_data)
 
+        # Initialize the pool of endpoints if multiple hosts are given
+        if hosts:
+            self.endpoints = EndpointPool(
+                urls=[endpoint_url(h, protocol, port) for h in hosts],
+                client=self.client,
+                strategy=strategy,
+                probe_interval=probe_interval
+            )
+        else:
+            self.endpoints = None
+
         # Initialize the ArangoDB API wrapper object
         self.api = API(
             protocol=self.protocol,
@@ -58,6 +113,8 @@ class Arango(object):
             username=self.username,
             password=self.password,
             client=self.client,
+            endpoints=self.endpoints,
+            serializer=self.serializer,
         )
 
         # Check the connection by requesting a header
@@ -75,6 +132,10 @@ class Arango(object):
 
     def __repr__(self):
         """Return a descriptive string of this instance."""
+        if self.endpoints is not None:
+            return "<ArangoDB API driver pointing to {}>".format(
+                [endpoint.url for endpoint in self.endpoints.endpoints]
+            )
         return "<ArangoDB API driver pointing to '{}'>".format(self.host)
 
     def __getattr__(self, attr):
@@ -101,7 +162,9 @@ class Arango(object):
                     username=self.username,
                     password=self.password,
                     database=db_name,
-                    client=self.client
+                    client=self.client,
+                    endpoints=self.endpoints,
+                    serializer=self.serializer
                 )
             )
 
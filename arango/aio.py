@@ -0,0 +1,397 @@
+"""Asyncio wrappers for ArangoDB's database, collection and cursor APIs.
+
+The wrappers in this module reuse ``arango.api.API`` on top of the asyncio
+based ``arango.clients.aio.AsyncClient``. Since the API wrapper returns
+whatever its client returns, every call made through it here is a coroutine.
+"""
+
+from arango.api import API
+from arango.clients.aio import AsyncClient
+from arango.constants import DEFAULT_DATABASE, HTTP_OK
+from arango.exceptions import *
+from arango.serializers import get_serializer, raw_json
+
+
+class AsyncArango(object):
+    """Asyncio wrapper for ArangoDB's top-level APIs.
+
+    Unlike ``arango.Arango``, the connection is not checked on construction
+    since that requires a running event loop. Use ``verify`` (or the async
+    context manager) to check it instead.
+    """
+
+    def __init__(self, protocol="http", host="localhost", port=8529,
+                 username="root", password="", client=None, serializer=None):
+        """Initialize the wrapper object.
+
+        :param protocol: the internet transfer protocol (default: 'http')
+        :type protocol: str
+        :param host: ArangoDB host (default: 'localhost')
+        :type host: str
+        :param port: ArangoDB port (default: 8529)
+        :type port: int or str
+        :param username: ArangoDB username (default: 'root')
+        :type username: str
+        :param password: ArangoDB password (default: '')
+        :type password: str
+        :param client: asyncio HTTP client for this wrapper to use
+        :type client: arango.clients.aio.AsyncClient or None
+        :param serializer: the JSON serializer (name or object) for payloads
+        :type serializer: str or arango.serializers.BaseSerializer or None
+        """
+        self.protocol = protocol
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.serializer = get_serializer(serializer)
+
+        # Initialize the asyncio HTTP client if not given
+        if client is not None:
+            self.client = client
+        else:
+            client_init_data = {
+                "auth": (self.username, self.password),
+                "loads": self.serializer.loads,
+            }
+            self.client = AsyncClient(client_init_data)
+
+        # Cache for AsyncDatabase objects
+        self._database_cache = {}
+
+    def __repr__(self):
+        """Return a descriptive string of this instance."""
+        return "<ArangoDB asyncio API driver pointing to '{}'>".format(
+            self.host
+        )
+
+    async def __aenter__(self):
+        await self.verify()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def verify(self):
+        """Check the connection by requesting a header.
+
+        :raises: ConnectionError
+        """
+        res = await self.db(DEFAULT_DATABASE).api.head("/_api/version")
+        if res.status_code not in HTTP_OK:
+            raise ConnectionError(res)
+
+    async def close(self):
+        """Close the underlying HTTP session."""
+        await self.client.close()
+
+    def db(self, name=DEFAULT_DATABASE):
+        """Alias for self.database."""
+        return self.database(name)
+
+    def database(self, name=DEFAULT_DATABASE):
+        """Return the ``AsyncDatabase`` object of the specified name.
+
+        No request is sent to the server, so the existence of the database
+        is only verified by the first call made through the returned object.
+
+        :param name: the name of the database
+        :type name: str
+        :returns: the database object
+        :rtype: arango.aio.AsyncDatabase
+        """
+        if name not in self._database_cache:
+            self._database_cache[name] = AsyncDatabase(
+                name=name,
+                api=API(
+                    protocol=self.protocol,
+                    host=self.host,
+                    port=self.port,
+                    username=self.username,
+                    password=self.password,
+                    database=name,
+                    client=self.client,
+                    serializer=self.serializer
+                )
+            )
+        return self._database_cache[name]
+
+
+class AsyncDatabase(object):
+    """Asyncio wrapper for ArangoDB's database-specific APIs."""
+
+    def __init__(self, name, api):
+        """Initialize the wrapper object.
+
+        :param name: the name of this database
+        :type name: str
+        :param api: ArangoDB API object using an asyncio client
+        :type api: arango.api.API
+        """
+        self.name = name
+        self.api = api
+        self._collection_cache = {}
+
+    def __repr__(self):
+        """Return a descriptive string of this instance."""
+        return "<ArangoDB asyncio database '{}'>".format(self.name)
+
+    async def col(self, name):
+        """Alias for self.collection."""
+        return await self.collection(name)
+
+    async def collection(self, name):
+        """Return the AsyncCollection object of the specified name.
+
+        :param name: the name of the collection
+        :type name: str
+        :returns: the requested collection object
+        :rtype: arango.aio.AsyncCollection
+        :raises: CollectionNotFoundError, CollectionGetError
+        """
+        if name in self._collection_cache:
+            return self._collection_cache[name]
+        res = await self.api.get(
+            "/_api/collection/{}/properties".format(name)
+        )
+        if res.status_code == 404:
+            raise CollectionNotFoundError(name)
+        elif res.status_code not in HTTP_OK:
+            raise CollectionGetError(res)
+        collection = AsyncCollection(
+            name=name,
+            api=self.api,
+            is_edge=res.body["type"] == 3
+        )
+        self._collection_cache[name] = collection
+        return collection
+
+    async def execute_query(self, query, count=False, batch_size=None,
+                            ttl=None, bind_vars=None, full_count=None,
+                            max_plans=None, optimizer_rules=None):
+        """Execute the AQL query and return the result.
+
+        :param query: the AQL query to execute
+        :type query: str
+        :param count: whether or not the document count should be returned
+        :type count: bool
+        :param batch_size: maximum number of documents in one round trip
+        :type batch_size: int
+        :param ttl: time-to-live for the cursor (in seconds)
+        :type ttl: int
+        :param bind_vars: key-value pairs of bind parameters
+        :type bind_vars: dict
+        :param full_count: whether or not to include count before last LIMIT
+        :param max_plans: maximum number of plans the optimizer generates
+        :type max_plans: None or int
+        :param optimizer_rules: list of optimizer rules
+        :type optimizer_rules: list
+        :returns: the asynchronous cursor from executing the query
+        :rtype: arango.aio.AsyncCursor
+        :raises: AQLQueryExecuteError
+        """
+        options = {}
+        if full_count is not None:
+            options["fullCount"] = full_count
+        if max_plans is not None:
+            options["maxNumberOfPlans"] = max_plans
+        if optimizer_rules is not None:
+            options["optimizer"] = {"rules": optimizer_rules}
+
+        data = {
+            "query": query,
+            "count": count,
+        }
+        if batch_size is not None:
+            data["batchSize"] = batch_size
+        if ttl is not None:
+            data["ttl"] = ttl
+        if bind_vars is not None:
+            data["bindVars"] = bind_vars
+        if options:
+            data["options"] = options
+
+        res = await self.api.post("/_api/cursor", data=data)
+        if res.status_code not in HTTP_OK:
+            raise AQLQueryExecuteError(res)
+        return AsyncCursor(self.api, res)
+
+
+class AsyncCollection(object):
+    """Asyncio wrapper for ArangoDB's collection-specific APIs."""
+
+    def __init__(self, name, api, is_edge=False):
+        """Initialize the wrapper object.
+
+        :param name: the name of this collection
+        :type name: str
+        :param api: ArangoDB API object using an asyncio client
+        :type api: arango.api.API
+        :param is_edge: whether or not this is an edge collection
+        :type is_edge: bool
+        """
+        self.name = name
+        self.api = api
+        self.type = "edge" if is_edge else "document"
+
+    def __repr__(self):
+        """Return a descriptive string of this instance."""
+        return "<ArangoDB asyncio collection '{}'>".format(self.name)
+
+    async def document(self, key, rev=None, match=True):
+        """Return the document of the given key.
+
+        See ``arango.collection.Collection.document`` for details.
+
+        :param key: the key of the document to retrieve
+        :type key: str
+        :param rev: the document revision is compared against this value
+        :type rev: str or None
+        :param match: whether or not the revision should match
+        :type match: bool
+        :returns: the requested document or None if not found
+        :rtype: dict or None
+        :raises: DocumentRevisionError, DocumentGetError
+        """
+        res = await self.api.get(
+            "/_api/{}/{}/{}".format(self.type, self.name, key),
+            headers={
+                "If-Match" if match else "If-None-Match": rev
+            } if rev else {}
+        )
+        if res.status_code in {412, 304}:
+            raise DocumentRevisionError(res)
+        elif res.status_code == 404:
+            return None
+        elif res.status_code not in HTTP_OK:
+            raise DocumentGetError(res)
+        return res.body
+
+    async def create_document(self, data, wait_for_sync=False):
+        """Create a new document to this collection.
+
+        See ``arango.collection.Collection.create_document`` for details.
+
+        :param data: the body of the new document
+        :type data: dict or arango.serializers.RawJSON or bytes or str
+        :param wait_for_sync: wait for create to sync to disk
+        :type wait_for_sync: bool
+        :returns: the id, rev and key of the new document
+        :rtype: dict
+        :raises: DocumentInvalidError, DocumentCreateError
+        """
+        fields = data
+        raw = raw_json(data)
+        if raw is not None:
+            fields = {}
+            if self.type == "edge":
+                fields = self.api.serializer.loads(raw)
+        if self.type == "edge":
+            if "_to" not in fields:
+                raise DocumentInvalidError(
+                    "the new document data is missing the '_to' key")
+            if "_from" not in fields:
+                raise DocumentInvalidError(
+                    "the new document data is missing the '_from' key")
+        params = {
+            "collection": self.name,
+            "waitForSync": wait_for_sync,
+        }
+        if "_from" in fields:
+            params["from"] = fields["_from"]
+        if "_to" in fields:
+            params["to"] = fields["_to"]
+        res = await self.api.post(
+            "/_api/{}".format(self.type), data=data, params=params
+        )
+        if res.status_code not in HTTP_OK:
+            raise DocumentCreateError(res)
+        return res.body
+
+    async def import_documents(self, documents, complete=True, details=True):
+        """Import documents into this collection in bulk.
+
+        See ``arango.collection.Collection.import_documents`` for details.
+
+        :param documents: list of documents to import (dicts, or their
+            JSON serialized already as RawJSON, bytes or str)
+        :type documents: list
+        :param complete: entire import fails if any document is invalid
+        :type complete: bool
+        :param details: return details about invalid documents
+        :type details: bool
+        :returns: the import results
+        :rtype: dict
+        :raises: DocumentsImportError
+        """
+        encode = self.api.serializer.encode_document
+        res = await self.api.post(
+            "/_api/import",
+            data=b"\r\n".join([encode(d) for d in documents]),
+            params={
+                "type": "documents",
+                "collection": self.name,
+                "complete": complete,
+                "details": details
+            }
+        )
+        if res.status_code not in HTTP_OK:
+            raise DocumentsImportError(res)
+        del res.body["error"]
+        return res.body
+
+
+class AsyncCursor(object):
+    """Asynchronous iterator over the results of a server-side cursor.
+
+    The server frees the cursor once its last batch has been fetched. If the
+    iteration is stopped early, ``close`` must be awaited to delete it.
+
+    :param api: ArangoDB API object using an asyncio client
+    :type api: arango.api.API
+    :param response: ArangoDB response object
+    :type response: arango.response.Response
+    """
+
+    def __init__(self, api, response):
+        self.api = api
+        self.id = response.body.get("id")
+        self.count = response.body.get("count")
+        self.has_more = response.body["hasMore"]
+        self._batch = response.body["result"]
+        self._index = 0
+
+    def __repr__(self):
+        """Return a descriptive string of this instance."""
+        return "<ArangoDB asyncio cursor '{}'>".format(self.id)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._index == len(self._batch):
+            if not self.has_more:
+                raise StopAsyncIteration
+            res = await self.api.put("/_api/cursor/{}".format(self.id))
+            if res.status_code not in HTTP_OK:
+                raise CursorGetNextError(res)
+            self.has_more = res.body["hasMore"]
+            self._batch = res.body["result"]
+            self._index = 0
+            if not self._batch:
+                return await self.__anext__()
+        item = self._batch[self._index]
+        self._index += 1
+        return item
+
+    async def close(self):
+        """Delete the server-side cursor if it is still alive.
+
+        :raises: CursorDeleteError
+        """
+        if self.id is None or not self.has_more:
+            return
+        self.has_more = False
+        res = await self.api.delete("/_api/cursor/{}".format(self.id))
+        if res.status_code not in {404, 202}:
+            raise CursorDeleteError(res)
@@ -1,10 +1,10 @@
 """Wrapper for making REST API calls to ArangoDB."""
 
-import json
-
-from arango.constants import DEFAULT_DATABASE
+from arango.constants import DEFAULT_DATABASE, IDEMPOTENT_METHODS
 from arango.clients import DefaultClient
-from arango.utils import is_string
+from arango.response import Response
+from arango.serializers import RawJSON, get_serializer
+from arango.utils import is_string, is_stream
 
 
 class API(object):
@@ -24,28 +24,111 @@ class API(object):
     :type database: str
     :param client: HTTP client for this wrapper to use
     :type client: arango.clients.base.BaseClient or None
+    :param pool_connections: the number of per-host pools to cache
+    :type pool_connections: int
+    :param pool_maxsize: the max number of pooled connections per host
+    :type pool_maxsize: int
+    :param pool_block: block until a pooled connection is free
+    :type pool_block: bool
+    :param max_retries: the number of retries on failed connections
+    :type max_retries: int
+    :param keep_alive: whether or not to keep connections open
+    :type keep_alive: bool
+    :param idle_timeout: drop pooled connections idle for this many seconds
+    :type idle_timeout: int or float or None
+    :param endpoints: the pool of endpoints to spread the requests over
+        (``protocol``, ``host`` and ``port`` are ignored if given)
+    :type endpoints: arango.endpoints.EndpointPool or None
+    :param serializer: the JSON serializer (name or object) for the payloads
+    :type serializer: str or arango.serializers.BaseSerializer or None
     """
 
     def __init__(self, protocol="http", host="localhost", port=8529,
-                 username="root", password="", database=None, client=None):
+                 username="root", password="", database=None, client=None,
+                 pool_connections=10, pool_maxsize=10, pool_block=False,
+                 max_retries=0, keep_alive=True, idle_timeout=None,
+                 endpoints=None, serializer=None):
         self.protocol = protocol
         self.host = host
         self.port = port
         self.username = username
         self.password = password
         self.database = DEFAULT_DATABASE if database is None else database
-        self.url_prefix = "{protocol}://{host}:{port}/_db/{database}".format(
+        self.endpoints = endpoints
+        self.serializer = get_serializer(serializer)
+        self.db_path = "/_db/{}".format(self.database)
+        self.url_prefix = "{protocol}://{host}:{port}{db_path}".format(
             protocol=self.protocol,
             host=self.host,
             port=self.port,
-            database=self.database,
+            db_path=self.db_path,
         )
         if client is not None:
             self.client = client
         else:
-            client_init_data = {"auth": (self.username, self.password)}
+            client_init_data = {
+                "auth": (self.username, self.password),
+                "pool_connections": pool_connections,
+                "pool_maxsize": pool_maxsize,
+                "pool_block": pool_block,
+                "max_retries": max_retries,
+                "keep_alive": keep_alive,
+                "idle_timeout": idle_timeout,
+            }
             self.client = DefaultClient(client_init_data)
 
+    def _send(self, method, path, **kwargs):
+        """Send the request through the HTTP client.
+
+        If an endpoint pool is set, the request is sent to one of its
+        endpoints and fails over to the others on connection errors, unless
+        the payload is a stream which cannot be sent again (or the request
+        may have reached the server and its method is not idempotent).
+
+        :param method: the HTTP method (e.g. 'get')
+        :type method: str
+        :param path: the API path (e.g. '/_api/version')
+        :type path: str
+        :returns: the ArangoDB http response
+        :rtype: arango.response.Response
+        """
+        request = getattr(self.client, method)
+        kwargs["auth"] = (self.username, self.password)
+        if self.endpoints is None:
+            res = request(url=self.url_prefix + path, **kwargs)
+        else:
+            data = kwargs.get("data")
+            replayable = getattr(data, "replayable", False)
+            res = self.endpoints.send(
+                lambda base_url: request(
+                    url=base_url + self.db_path + path, **kwargs
+                ),
+                retry=not is_stream(data) or replayable,
+                idempotent=method in IDEMPOTENT_METHODS
+            )
+        # The body is decoded lazily, so the deserializer can be set here
+        if isinstance(res, Response) and res.loads is None:
+            res.loads = self.serializer.loads
+        return res
+
+    def _encode(self, data):
+        """Serialize the request payload unless it is a string or a stream.
+
+        Bytes and RawJSON objects are sent as they are, and streams (e.g.
+        generators of bytes) are sent with chunked transfer encoding.
+
+        :param data: the request payload
+        :type data: str or bytes or arango.serializers.RawJSON or dict or
+            list or collections.Iterable or None
+        :returns: the serialized request payload
+        :rtype: str or bytes or collections.Iterable
+        """
+        if is_string(data) or isinstance(data, bytes) or is_stream(data):
+            return data
+        elif isinstance(data, RawJSON):
+            return data.data
+        return self.serializer.dumps(data)
+
     def head(self, path, params=None, headers=None):
         """Call a HEAD method in ArangoDB's REST API.
 
@@ -58,11 +141,11 @@ class API(object):
         :returns: the ArangoDB http response
         :rtype: arango.response.Response
         """
-        return self.client.head(
-            url=self.url_prefix + path,
+        return self._send(
+            "head",
+            path,
             params=params,
             headers=headers,
-            auth=(self.username, self.password)
         )
 
     def get(self, path, params=None, headers=None):
@@ -77,11 +160,11 @@ class API(object):
         :returns: the ArangoDB http response
         :rtype: arango.response.Response
         """
-        return self.client.get(
-            url=self.url_prefix + path,
+        return self._send(
+            "get",
+            path,
             params=params,
             headers=headers,
-            auth=(self.username, self.password),
         )
 
     def put(self, path, data=None, params=None, headers=None):
@@ -90,7 +173,7 @@ class API(object):
         :param path: the API path (e.g. '/_api/version')
         :type path: str
         :param data: the request payload
-        :type data: str or dict or None
+        :type data: str or dict or collections.Iterable or None
         :param params: the request parameters
         :type params: dict or None
         :param headers: the request headers
@@ -98,12 +181,12 @@ class API(object):
         :returns: the ArangoDB http response
         :rtype: arango.response.Response
         """
-        return self.client.put(
-            url=self.url_prefix + path,
-            data=data if is_string(data) else json.dumps(data),
+        return self._send(
+            "put",
+            path,
+            data=self._encode(data),
             params=params,
             headers=headers,
-            auth=(self.username, self.password)
         )
 
     def post(self, path, data=None, params=None, headers=None):
@@ -112,7 +195,7 @@ class API(object):
         :param path: the API path (e.g. '/_api/version')
         :type path: str
         :param data: the request payload
-        :type data: str or dict or None
+        :type data: str or dict or collections.Iterable or None
         :param params: the request parameters
         :type params: dict or None
         :param headers: the request headers
@@ -120,12 +203,12 @@ class API(object):
         :returns: the ArangoDB http response
         :rtype: arango.response.Response
         """
-        return self.client.post(
-            url=self.url_prefix + path,
-            data=data if is_string(data) else json.dumps(data),
+        return self._send(
+            "post",
+            path,
+            data=self._encode(data),
             params=params,
             headers=headers,
-            auth=(self.username, self.password)
         )
 
     def patch(self, path, data=None, params=None, headers=None):
@@ -134,7 +217,7 @@ class API(object):
         :param path: the API path (e.g. '/_api/version')
         :type path: str
         :param data: the request payload
-        :type data: str or dict or None
+        :type data: str or dict or collections.Iterable or None
         :param params: the request parameters
         :type params: dict or None
         :param headers: the request headers
@@ -142,12 +225,12 @@ class API(object):
         :returns: the ArangoDB http response
         :rtype: arango.response.Response
         """
-        return self.client.patch(
-            url=self.url_prefix + path,
-            data=data if is_string(data) else json.dumps(data),
+        return self._send(
+            "patch",
+            path,
+            data=self._encode(data),
             params=params,
             headers=headers,
-            auth=(self.username, self.password)
         )
 
     def delete(self, path, params=None, headers=None):
@@ -162,11 +245,11 @@ class API(object):
         :returns: the ArangoDB http response
         :rtype: arango.response.Response
         """
-        return self.client.delete(
-            url=self.url_prefix + path,
+        return self._send(
+            "delete",
+            path,
             params=params,
             headers=headers,
-            auth=(self.username, self.password)
         )
 
     def options(self, path, data=None, params=None, headers=None):
@@ -175,7 +258,7 @@ class API(object):
         :param path: the API path (e.g. '/_api/version')
         :type path: str
         :param data: the request payload
-        :type data: str or dict or None
+        :type data: str or dict or collections.Iterable or None
         :param params: the request parameters
         :type params: dict or None
         :param headers: the request headers
@@ -183,10 +266,10 @@ class API(object):
         :returns: the ArangoDB http response
         :rtype: arango.response.Response
         """
-        return self.client.options(
-            url=self.url_prefix + path,
-            data=data if is_string(data) else json.dumps(data),
+        return self._send(
+            "options",
+            path,
+            data=self._encode(data),
             params=params,
             headers=headers,
-            auth=(self.username, self.password)
         )
\ No newline at end of file
@@ -0,0 +1,626 @@
+"""Multipart encoding and decoding of ArangoDB batch requests."""
+
+import inspect
+import re
+from uuid import uuid4
+
+from arango.constants import HTTP_OK
+from arango.exceptions import (
+    BatchExecuteError,
+    BatchInvalidError,
+    BatchPartError,
+    InvalidArgumentError,
+    RequestError,
+)
+from arango.response import Response
+from arango.serializers import raw_json
+from arango.utils import parallel_map, stringify_request
+
+# Matches the boundary parameter of a multipart Content-Type header
+BOUNDARY_PARAMETER = re.compile(r'boundary="?([^";]+)"?')
+
+
+def _to_bytes(string):
+    """Return the string encoded in UTF-8 unless it is bytes already.
+
+    :param string: the string
+    :type string: str or bytes
+    :returns: the encoded string
+    :rtype: bytes
+    """
+    return string if isinstance(string, bytes) else string.encode("utf-8")
+
+
+def _parse_headers(lines):
+    """Parse the header lines of a part or an HTTP message.
+
+    :param lines: the header lines
+    :type lines: list
+    :returns: the headers
+    :rtype: dict
+    """
+    headers = {}
+    for line in lines:
+        key, _, value = line.decode("utf-8").partition(":")
+        headers[key.strip()] = value.strip()
+    return headers
+
+
+def _get_header(headers, name):
+    """Return the value of the header regardless of the case of its name.
+
+    :param headers: the headers
+    :type headers: dict
+    :param name: the name of the header
+    :type name: str
+    :returns: the value of the header or None if it is missing
+    :rtype: str or None
+    """
+    name = name.lower()
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def supports_batch(func):
+    """Return True iff the method can be called with ``_batch=True``.
+
+    :param func: the method
+    :type func: callable
+    :returns: whether or not the method supports batch execution
+    :rtype: bool
+    """
+    try:
+        argspec = inspect.getfullargspec(func)
+    except AttributeError:  # Python 2
+        argspec = inspect.getargspec(func)
+    return "_batch" in argspec.args
+
+
+def new_boundary():
+    """Return a random multipart boundary.
+
+    :returns: the boundary
+    :rtype: str
+    """
+    return "XXXsubpartXXX{}".format(uuid4().hex)
+
+
+def encode_part(content_id, request, boundary, dumps):
+    """Encode a request into a part of the multipart body of a batch.
+
+    :param content_id: the Content-Id of the part
+    :type content_id: int
+    :param request: the request returned by a method called with
+        ``_batch=True``
+    :type request: dict
+    :param boundary: the multipart boundary
+    :type boundary: str
+    :param dumps: the JSON serializer for the request payload
+    :type dumps: callable
+    :returns: the encoded part
+    :rtype: bytes
+    """
+    data = request.get("data")
+    raw = raw_json(data)
+    return b"".join([
+        _to_bytes(
+            "--{}\r\n"
+            "Content-Type: application/x-arango-batchpart\r\n"
+            "Content-Id: {}\r\n\r\n".format(boundary, content_id)
+        ),
+        _to_bytes(stringify_request(
+            method=request["method"],
+            path=request["path"],
+            params=request.get("params"),
+            headers=request.get("headers"),
+            data=data if raw is None else None,
+            dumps=dumps
+        )),
+        b"\r\n\r\n" + raw if raw else b"",
+        b"\r\n"
+    ])
+
+
+def join_parts(parts, boundary):
+    """Join the encoded parts into the multipart body of a batch request.
+
+    The parts are joined once, so the time taken grows linearly with the
+    size of the batch.
+
+    :param parts: the parts encoded with ``encode_part``
+    :type parts: list
+    :param boundary: the multipart boundary
+    :type boundary: str
+    :returns: the multipart body
+    :rtype: bytes
+    """
+    return b"".join(parts + [_to_bytes("--{}--\r\n".format(boundary))])
+
+
+def group_parts(items, max_ops=None, max_bytes=None):
+    """Split the items of a batch into groups sent as separate batches.
+
+    :param items: the items of the batch, each a tuple ending with the
+        encoded part
+    :type items: list
+    :param max_ops: the max number of items per group
+    :type max_ops: int or None
+    :param max_bytes: the approximate max size of a group in bytes
+    :type max_bytes: int or None
+    :returns: the groups of items in their original order
+    :rtype: collections.Iterator
+    """
+    group = []
+    size = 0
+    for item in items:
+        part_size = len(item[-1])
+        if group and (
+            (max_ops is not None and len(group) >= max_ops) or
+            (max_bytes is not None and size + part_size > max_bytes)
+        ):
+            yield group
+            group = []
+            size = 0
+        group.append(item)
+        size += part_size
+    if group:
+        yield group
+
+
+def resolve_part(content_id, request, response):
+    """Return the result or the error of a request in the batch.
+
+    Requests of methods which decode their responses (e.g. ``document``)
+    carry a ``handler`` which turns the response into the same result, or
+    raises the same error, as calling the method outside of a batch. The
+    result of the other requests is the response body, and their error a
+    BatchPartError.
+
+    :param content_id: the Content-Id of the request
+    :type content_id: int
+    :param request: the request returned by the method called with
+        ``_batch=True``
+    :type request: dict
+    :param response: the response to the request
+    :type response: arango.response.Response
+    :returns: the result and the error (one of which is None)
+    :rtype: tuple
+    """
+    response.method = request["method"]
+    response.url = request["path"]
+    handler = request.get("handler")
+    if handler is None:
+        if response.status_code in HTTP_OK:
+            return response.body, None
+        return None, BatchPartError(response, content_id)
+    try:
+        return handler(response), None
+    except RequestError as error:
+        error.content_id = content_id
+        return None, error
+
+
+def send_batch(api, body, boundary):
+    """Send the multipart body to ``/_api/batch`` and decode the response.
+
+    :param api: ArangoDB API wrapper object
+    :type api: arango.api.API
+    :param body: the multipart body
+    :type body: bytes
+    :param boundary: the multipart boundary
+    :type boundary: str
+    :returns: the response of the batch request, and the responses of the
+        parts keyed by their Content-Id
+    :rtype: tuple
+    :raises: BatchExecuteError
+    """
+    res = api.post(
+        "/_api/batch",
+        headers={
+            "Content-Type": "multipart/form-data; boundary={}".format(
+                boundary
+            )
+        },
+        data=body,
+    )
+    if res.status_code not in HTTP_OK:
+        raise BatchExecuteError(res)
+    return res, decode_batch(res, boundary, api.serializer.loads)
+
+
+def decode_batch(response, boundary=None, loads=None):
+    """Decode the multipart body of a batch response into the responses.
+
+    :param response: the response of the batch request
+    :type response: arango.response.Response
+    :param boundary: the multipart boundary used if the response does not
+        specify one
+    :type boundary: str or None
+    :param loads: the JSON deserializer for the part responses
+    :type loads: callable or None
+    :returns: the responses of the parts keyed by their Content-Id
+    :rtype: dict
+    """
+    content_type = _get_header(response.headers, "Content-Type") or ""
+    match = BOUNDARY_PARAMETER.search(content_type)
+    if match is not None:
+        boundary = match.group(1)
+    content = _to_bytes(response.raw_body or b"")
+    delimiter = _to_bytes("--{}".format(boundary))
+
+    responses = {}
+    for part in content.split(delimiter)[1:]:
+        if part.startswith(b"--"):
+            break  # the closing delimiter
+        part_head, _, message = part.lstrip(b"\r\n").partition(b"\r\n\r\n")
+        part_headers = _parse_headers(part_head.split(b"\r\n"))
+        message_head, _, body = message.partition(b"\r\n\r\n")
+        lines = message_head.split(b"\r\n")
+        status = lines[0].decode("utf-8").split(" ", 2)
+        headers = _parse_headers(lines[1:])
+        length = _get_header(headers, "Content-Length")
+        if length is not None:
+            body = body[:int(length)]
+        elif body.endswith(b"\r\n"):
+            body = body[:-2]
+
+        content_id = _get_header(part_headers, "Content-Id")
+        if content_id is not None and content_id.isdigit():
+            content_id = int(content_id)
+        responses[content_id] = Response(
+            method=None,
+            url=None,
+            status_code=int(status[1]),
+            content=body,
+            headers=headers,
+            status_text=status[2] if len(status) > 2 else None,
+            loads=loads
+        )
+    return responses
+
+
+def execute_requests(api, requests, raise_errors=False, max_ops=None,
+                     max_bytes=None, workers=1):
+    """Execute the requests in one or more batches.
+
+    See ``arango.database.Database.execute_batch`` for the results and the
+    splitting into sub-batches.
+
+    :param api: ArangoDB API wrapper object
+    :type api: arango.api.API
+    :param requests: the requests returned by methods called with
+        ``_batch=True``
+    :type requests: list
+    :param raise_errors: raise the error of the first failed request
+    :type raise_errors: bool
+    :param max_ops: the max number of requests per sub-batch
+    :type max_ops: int or None
+    :param max_bytes: the approximate max size of a sub-batch in bytes
+    :type max_bytes: int or None
+    :param workers: the number of sub-batches sent concurrently
+    :type workers: int
+    :returns: the results or the errors of the requests
+    :rtype: list
+    :raises: BatchExecuteError, RequestError
+    """
+    boundary = new_boundary()
+    batch = [
+        (content_id, request, encode_part(
+            content_id, request, boundary, api.serializer.dumps
+        ))
+        for content_id, request in enumerate(requests, start=1)
+    ]
+
+    def send(sub_batch):
+        res, parts = send_batch(
+            api,
+            join_parts([part for _, _, part in sub_batch], boundary),
+            boundary
+        )
+        return sub_batch, res, parts
+
+    results = []
+    for sub_batch, res, parts in parallel_map(
+            send, group_parts(batch, max_ops, max_bytes), workers):
+        for content_id, request, _ in sub_batch:
+            part = parts.get(content_id)
+            if part is None:
+                raise BatchExecuteError(res)
+            result, error = resolve_part(content_id, request, part)
+            if error is None:
+                results.append(result)
+            elif raise_errors:
+                raise error
+            else:
+                results.append(error)
+    return results
+
+
+class BatchJob(object):
+    """The future result of a request queued in a batch.
+
+    :param batch: the batch the request is queued in
+    :type batch: arango.batch.Batch
+    :param request: the request returned by a method called with
+        ``_batch=True``
+    :type request: dict
+    """
+
+    def __init__(self, batch, request):
+        self.batch = batch
+        self.request = request
+        self.content_id = None
+        self.response = None
+        self._result = None
+        self._error = None
+        self._failed = False
+
+    def __repr__(self):
+        """Return a descriptive string of this instance."""
+        return "<ArangoDB batch job {} {} ({})>".format(
+            self.request["method"].upper(),
+            self.request["path"],
+            "done" if self.done else "pending"
+        )
+
+    @property
+    def done(self):
+        """Return True if the batch holding the request was sent.
+
+        The job is also done if sending the batch failed, its error being
+        that of the batch.
+
+        :returns: whether or not the request was executed (or failed)
+        :rtype: bool
+        """
+        return self.response is not None or self._failed
+
+    def resolve(self, response):
+        """Resolve the job with the response to its request.
+
+        :param response: the response to the request
+        :type response: arango.response.Response
+        """
+        self._result, self._error = resolve_part(
+            self.content_id, self.request, response
+        )
+        self.response = response
+
+    def fail(self, error):
+        """Resolve the job with the error which failed its batch.
+
+        :param error: the error raised while sending the batch
+        :type error: Exception
+        """
+        self._error = error
+        self._failed = True
+
+    def exception(self):
+        """Return the error of the request, sending the batch if necessary.
+
+        :returns: the error or None if the request succeeded
+        :rtype: Exception or None
+        :raises: BatchExecuteError
+        """
+        if not self.done:
+            self.batch.flush()
+        return self._error
+
+    def result(self):
+        """Return the result of the request, sending the batch if necessary.
+
+        :returns: the result of the method called (e.g. the document)
+        :rtype: object
+        :raises: RequestError, BatchExecuteError
+        """
+        error = self.exception()
+        if error is not None:
+            raise error
+        return self._result
+
+
+class BatchProxy(object):
+    """Proxy which queues the batch-capable method calls of an object.
+
+    :param target: the object (e.g. a collection or a graph)
+    :type target: object
+    :param batch: the batch to queue the calls in
+    :type batch: arango.batch.Batch
+    """
+
+    def __init__(self, target, batch):
+        self._target = target
+        self._batch = batch
+
+    def __repr__(self):
+        """Return a descriptive string of this instance."""
+        return "<ArangoDB batch proxy of {!r}>".format(self._target)
+
+    def __getattr__(self, name):
+        """Return the attribute of the target, wrapping batch methods.
+
+        :param name: the name of the attribute
+        :type name: str
+        :returns: the attribute or the method queueing the call
+        :rtype: object
+        """
+        attr = getattr(self._target, name)
+        if not callable(attr) or not supports_batch(attr):
+            return attr
+
+        def queue(*args, **kwargs):
+            return self._batch.queue(attr, *args, **kwargs)
+        queue.__name__ = name
+        queue.__doc__ = attr.__doc__
+        return queue
+
+
+class Batch(object):
+    """Queue of API calls sent through ``/_api/batch`` in few round trips.
+
+    The requests are queued by calling the batch-capable methods (e.g.
+    ``create_document``) of the proxies returned by ``collection`` and
+    ``graph``, or by passing the method to ``queue``. Each call returns a
+    BatchJob which is resolved when the batch is sent. The batch is sent
+    automatically as soon as it holds ``max_ops`` requests or
+    ``max_bytes`` bytes, and when leaving the ``with`` block without an
+    error. If the block raises an error, the requests still queued are
+    discarded instead.
+
+    :param database: the database to send the batches to
+    :type database: arango.database.Database
+    :param max_ops: the max number of requests per batch
+    :type max_ops: int
+    :param max_bytes: the approximate max size of a batch in bytes
+    :type max_bytes: int or None
+    :raises: InvalidArgumentError
+    """
+
+    def __init__(self, database, max_ops=500, max_bytes=None):
+        if max_ops < 1:
+            raise InvalidArgumentError("max_ops must be greater than 0")
+        self.database = database
+        self.api = database.api
+        self.max_ops = max_ops
+        self.max_bytes = max_bytes
+        self.boundary = new_boundary()
+        self._jobs = []
+        self._parts = []
+        self._size = 0
+
+    def __repr__(self):
+        """Return a descriptive string of this instance."""
+        return "<ArangoDB batch ({} queued)>".format(len(self._jobs))
+
+    def __len__(self):
+        """Return the number of requests queued."""
+        return len(self._jobs)
+
+    def __enter__(self):
+        """Return this batch for use in a ``with`` block."""
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        """Send the queued requests, or discard them if the block raised."""
+        if exc_type is None:
+            self.flush()
+        else:
+            self.discard()
+
+    def collection(self, name):
+        """Return the collection of the given name with its calls queued.
+
+        :param name: the name of the collection
+        :type name: str
+        :returns: the proxy of the collection
+        :rtype: arango.batch.BatchProxy
+        """
+        return BatchProxy(self.database.collection(name), self)
+
+    def col(self, name):
+        """Alias for self.collection."""
+        return self.collection(name)
+
+    def graph(self, name):
+        """Return the graph of the given name with its calls queued.
+
+        :param name: the name of the graph
+        :type name: str
+        :returns: the proxy of the graph
+        :rtype: arango.batch.BatchProxy
+        """
+        return BatchProxy(self.database.graph(name), self)
+
+    def queue(self, func, *args, **kwargs):
+        """Queue the call of a batch-capable method.
+
+        :param func: the method (e.g. ``my_col.create_document``)
+        :type func: callable
+        :returns: the future result of the call
+        :rtype: arango.batch.BatchJob
+        :raises: BatchInvalidError, BatchExecuteError
+        """
+        if not supports_batch(func):
+            raise BatchInvalidError(
+                "ArangoDB method '{}' does not support batch "
+                "execution".format(func.__name__)
+            )
+        kwargs["_batch"] = True
+        job = BatchJob(self, func(*args, **kwargs))
+        part = encode_part(
+            len(self._jobs) + 1,
+            job.request,
+            self.boundary,
+            self.api.serializer.dumps
+        )
+        if (self.max_bytes is not None and self._jobs and
+                self._size + len(part) > self.max_bytes):
+            self.flush()
+            part = encode_part(
+                1, job.request, self.boundary, self.api.serializer.dumps
+            )
+        job.content_id = len(self._jobs) + 1
+        self._jobs.append(job)
+        self._parts.append(part)
+        self._size += len(part)
+        if len(self._jobs) >= self.max_ops:
+            self.flush()
+        return job
+
+    def discard(self):
+        """Drop the queued requests without sending them.
+
+        The jobs of the requests fail with a BatchExecuteError, so reading
+        their results does not send them later on.
+
+        :returns: the number of requests discarded
+        :rtype: int
+        """
+        jobs = self._jobs
+        self._jobs, self._parts, self._size = [], [], 0
+        if jobs:
+            error = BatchExecuteError(Response(
+                method="post",
+                url="/_api/batch",
+                status_code=None,
+                content=b"",
+                headers={},
+                status_text="the batch was discarded without being sent"
+            ))
+            for job in jobs:
+                job.fail(error)
+        return len(jobs)
+
+    def flush(self):
+        """Send the queued requests and resolve their jobs.
+
+        :returns: the number of requests sent
+        :rtype: int
+        :raises: BatchExecuteError
+        """
+        if not self._jobs:
+            return 0
+        jobs, parts = self._jobs, self._parts
+        self._jobs, self._parts, self._size = [], [], 0
+
+        try:
+            res, responses = send_batch(
+                self.api, join_parts(parts, self.boundary), self.boundary
+            )
+        except Exception as error:
+            for job in jobs:
+                job.fail(error)
+            raise
+        error = None
+        for job in jobs:
+            response = responses.get(job.content_id)
+            if response is None:
+                error = error or BatchExecuteError(res)
+                job.fail(error)
+            else:
+                job.resolve(response)
+        if error is not None:
+            raise error
+        return len(jobs)
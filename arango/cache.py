@@ -0,0 +1,137 @@
+"""Client-side caches."""
+
+from collections import OrderedDict
+from threading import Lock
+from time import time
+
+from arango.exceptions import InvalidArgumentError
+
+
+class DocumentCache(object):
+    """LRU cache of documents validated against their revisions.
+
+    Documents younger than ``ttl`` seconds are served from the cache as
+    they are. Older ones are revalidated with ``If-None-Match: <_rev>``,
+    which costs a round trip but no body transfer if the document has not
+    changed. The least recently used documents are evicted once the cache
+    holds ``max_size`` of them.
+
+    The cached documents are shared between the callers and must not be
+    modified.
+
+    :param max_size: the max number of documents in the cache
+    :type max_size: int
+    :param ttl: the number of seconds a document is served without being
+        revalidated (0 to revalidate on every read)
+    :type ttl: int or float
+    :raises: InvalidArgumentError
+    """
+
+    def __init__(self, max_size=1000, ttl=0):
+        if max_size < 1:
+            raise InvalidArgumentError("max_size must be greater than 0")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def __repr__(self):
+        """Return a descriptive string of this instance."""
+        return "<ArangoDB document cache ({}/{})>".format(
+            len(self), self.max_size
+        )
+
+    def __len__(self):
+        """Return the number of documents in the cache."""
+        return len(self._entries)
+
+    def __contains__(self, key):
+        """Return True if the document of the given key is cached."""
+        return key in self._entries
+
+    @property
+    def stats(self):
+        """Return the cache counters.
+
+        ``hits`` counts the reads served from the cache, including those
+        revalidated by the server (also counted in ``revalidations``), and
+        ``misses`` the reads which transferred the document.
+
+        :returns: the hits, misses, revalidations, evictions and size
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+            }
+
+    def get(self, key):
+        """Return the cached document and whether it is still fresh.
+
+        :param key: the document key
+        :type key: str
+        :returns: the document and True if it is younger than ``ttl``, or
+            None if the document is not cached
+        :rtype: tuple or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.pop(key)
+            self._entries[key] = entry
+            document, cached_at = entry
+            return document, time() - cached_at < self.ttl
+
+    def put(self, key, document):
+        """Cache the document, evicting the least recently used if full.
+
+        :param key: the document key
+        :type key: str
+        :param document: the document
+        :type document: dict
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (document, time())
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def record(self, hit, revalidated=False):
+        """Count a read served from the cache or from the server.
+
+        :param hit: whether or not the document came from the cache
+        :type hit: bool
+        :param revalidated: whether or not the server confirmed it
+        :type revalidated: bool
+        """
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+            if revalidated:
+                self.revalidations += 1
+
+    def invalidate(self, key):
+        """Remove the document of the given key from the cache.
+
+        :param key: the document key
+        :type key: str
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove all documents from the cache."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,247 @@
+"""Asyncio based client using aiohttp."""
+
+import aiohttp
+
+from arango.response import Response
+from arango.clients.base import BaseClient
+
+
+def _stringify_params(params):
+    """Return the request parameters in a form aiohttp accepts.
+
+    Parameters with value None are dropped and booleans are lowercased, the
+    same way the requests library (used by the default client) sends them.
+
+    :param params: the request parameters
+    :type params: dict or None
+    :returns: the sanitized request parameters
+    :rtype: dict
+    """
+    if not params:
+        return {}
+    sanitized = {}
+    for key, value in params.items():
+        if value is None:
+            continue
+        elif isinstance(value, bool):
+            sanitized[key] = "true" if value else "false"
+        else:
+            sanitized[key] = str(value)
+    return sanitized
+
+
+class AsyncClient(BaseClient):
+    """Asyncio based HTTP client for ArangoDB.
+
+    Every method of this client is a coroutine which must be awaited from
+    within a running event loop. All requests share a single aiohttp session,
+    so one event loop can keep many requests in flight at once without a
+    thread per request.
+    """
+
+    def __init__(self, init_data):
+        """Initialize the client with the credentials.
+
+        The session is created lazily on the first request so that it is
+        bound to the event loop which actually runs the requests.
+
+        :param init_data: data for client initialization
+        :type init_data: dict
+        """
+        self.auth = aiohttp.BasicAuth(*init_data["auth"])
+        self.limit = init_data.get("limit", 100)
+        self.loads = init_data.get("loads")
+        self.session = None
+
+    def _get_session(self):
+        """Return the aiohttp session, creating it if necessary.
+
+        :returns: the aiohttp client session
+        :rtype: aiohttp.ClientSession
+        """
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                auth=self.auth,
+                connector=aiohttp.TCPConnector(limit=self.limit),
+            )
+        return self.session
+
+    async def _request(self, method, url, data=None, params=None,
+                       headers=None):
+        """Send the HTTP request and return the ArangoDB response.
+
+        :param method: the HTTP method
+        :type method: str
+        :param url: request URL
+        :type url: str
+        :param data: request payload
+        :type data: str or None
+        :param params: request parameters
+        :type params: dict or None
+        :param headers: request headers
+        :type headers: dict or None
+        :returns: ArangoDB http response object
+        :rtype: arango.response.Response
+        """
+        async with self._get_session().request(
+            method=method,
+            url=url,
+            data=data,
+            params=_stringify_params(params),
+            headers=headers,
+        ) as res:
+            content = await res.read()
+            return Response(
+                method=method,
+                url=url,
+                headers=res.headers,
+                status_code=res.status,
+                content=content,
+                status_text=res.reason,
+                loads=self.loads
+            )
+
+    async def head(self, url, params=None, headers=None, auth=None):
+        """HTTP HEAD method.
+
+        :param url: request URL
+        :type url: str
+        :param params: request parameters
+        :type params: dict or None
+        :param headers: request headers
+        :type headers: dict or None
+        :param auth: username and password tuple
+        :type auth: tuple or None
+        :returns: ArangoDB http response object
+        :rtype: arango.response.Response
+        """
+        return await self._request(
+            "head", url, params=params, headers=headers
+        )
+
+    async def get(self, url, params=None, headers=None, auth=None):
+        """HTTP GET method.
+
+        :param url: request URL
+        :type url: str
+        :param params: request parameters
+        :type params: dict or None
+        :param headers: request headers
+        :type headers: dict or None
+        :param auth: username and password tuple
+        :type auth: tuple or None
+        :returns: ArangoDB http response object
+        :rtype: arango.response.Response
+        """
+        return await self._request(
+            "get", url, params=params, headers=headers
+        )
+
+    async def put(self, url, data=None, params=None, headers=None,
+                  auth=None):
+        """HTTP PUT method.
+
+        :param url: request URL
+        :type url: str
+        :param data: request payload
+        :type data: str or dict or None
+        :param params: request parameters
+        :type params: dict or None
+        :param headers: request headers
+        :type headers: dict or None
+        :param auth: username and password tuple
+        :type auth: tuple or None
+        :returns: ArangoDB http response object
+        :rtype: arango.response.Response
+        """
+        return await self._request(
+            "put", url, data=data, params=params, headers=headers
+        )
+
+    async def post(self, url, data=None, params=None, headers=None,
+                   auth=None):
+        """HTTP POST method.
+
+        :param url: request URL
+        :type url: str
+        :param data: request payload
+        :type data: str or dict or None
+        :param params: request parameters
+        :type params: dict or None
+        :param headers: request headers
+        :type headers: dict or None
+        :param auth: username and password tuple
+        :type auth: tuple or None
+        :returns: ArangoDB http response object
+        :rtype: arango.response.Response
+        """
+        return await self._request(
+            "post", url, data="" if data is None else data,
+            params=params, headers=headers
+        )
+
+    async def patch(self, url, data=None, params=None, headers=None,
+                    auth=None):
+        """HTTP PATCH method.
+
+        :param url: request URL
+        :type url: str
+        :param data: request payload
+        :type data: str or dict or None
+        :param params: request parameters
+        :type params: dict or None
+        :param headers: request headers
+        :type headers: dict or None
+        :param auth: username and password tuple
+        :type auth: tuple or None
+        :returns: ArangoDB http response object
+        :rtype: arango.response.Response
+        """
+        return await self._request(
+            "patch", url, data=data, params=params, headers=headers
+        )
+
+    async def delete(self, url, params=None, headers=None, auth=None):
+        """HTTP DELETE method.
+
+        :param url: request URL
+        :type url: str
+        :param params: request parameters
+        :type params: dict or None
+        :param headers: request headers
+        :type headers: dict or None
+        :param auth: username and password tuple
+        :type auth: tuple or None
+        :returns: ArangoDB http response object
+        :rtype: arango.response.Response
+        """
+        return await self._request(
+            "delete", url, params=params, headers=headers
+        )
+
+    async def options(self, url, data=None, params=None, headers=None,
+                      auth=None):
+        """HTTP OPTIONS method.
+
+        :param url: request URL
+        :type url: str
+        :param data: request payload
+        :type data: str or dict or None
+        :param params: request parameters
+        :type params: dict or None
+        :param headers: request headers
+        :type headers: dict or None
+        :param auth: username and password tuple
+        :type auth: tuple or None
+        :returns: ArangoDB http response object
+        :rtype: arango.response.Response
+        """
+        return await self._request(
+            "options", url, data="" if data is None else data,
+            params=params, headers=headers
+        )
+
+    async def close(self):
+        """Close the HTTP session."""
+        if self.session is not None:
+            await self.session.close()
@@ -1,22 +1,162 @@
 """Session based client using requests."""
 
+from threading import Lock
+from time import time
+
 from requests import Session
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.connectionpool import (
+    HTTPConnectionPool,
+    HTTPSConnectionPool,
+)
 
 from arango.response import Response
 from arango.clients.base import BaseClient
 
 
+class ConnectionStats(object):
+    """Thread-safe counters for the connections used by a client."""
+
+    def __init__(self):
+        self._lock = Lock()
+        self.requests = 0
+        self.opened = 0
+
+    def add_request(self):
+        """Record a request sent over the connection pool."""
+        with self._lock:
+            self.requests += 1
+
+    def add_connection(self):
+        """Record a new connection (i.e. a new TCP handshake)."""
+        with self._lock:
+            self.opened += 1
+
+    @property
+    def reused(self):
+        """Return the number of requests served by a pooled connection.
+
+        :returns: the number of requests which did not open a connection
+        :rtype: int
+        """
+        return max(self.requests - self.opened, 0)
+
+    def to_dict(self):
+        """Return the counters as a dictionary.
+
+        :returns: the number of requests, opened and reused connections
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "opened": self.opened,
+                "reused": max(self.requests - self.opened, 0),
+            }
+
+
+def _counting_pool_class(pool_class, stats):
+    """Return a subclass of ``pool_class`` which counts new connections.
+
+    The connections themselves are counted (rather than the pool slots) as
+    urllib3 silently reconnects pooled connections dropped by the server.
+
+    :param pool_class: the urllib3 connection pool class
+    :type pool_class: type
+    :param stats: the counters to update
+    :type stats: arango.clients.default.ConnectionStats
+    :returns: the connection pool subclass
+    :rtype: type
+    """
+    class CountingConnection(pool_class.ConnectionCls):
+
+        def connect(self):
+            stats.add_connection()
+            return super(CountingConnection, self).connect()
+
+    class CountingConnectionPool(pool_class):
+        ConnectionCls = CountingConnection
+
+    return CountingConnectionPool
+
+
+class PoolAdapter(HTTPAdapter):
+    """HTTP adapter whose connection pools count the connections opened.
+
+    :param stats: the counters to update
+    :type stats: arango.clients.default.ConnectionStats
+    """
+
+    def __init__(self, stats, **kwargs):
+        self.stats = stats
+        super(PoolAdapter, self).__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super(PoolAdapter, self).init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool_class(HTTPConnectionPool, self.stats),
+            "https": _counting_pool_class(HTTPSConnectionPool, self.stats),
+        }
+
+
 class DefaultClient(BaseClient):
     """Session based HTTP (default) client for ArangoDB."""
 
     def __init__(self, init_data):
         """Initialize the session with the credentials.
 
+        Besides ``auth``, ``init_data`` may contain the following options
+        for the connection pool:
+
+        pool_connections: the number of per-host pools to cache (default: 10)
+        pool_maxsize: the max number of connections per host (default: 10)
+        pool_block: block when no connection is free instead of opening a
+                    throwaway one (default: False)
+        max_retries: the number of retries on failed connections (default: 0)
+        keep_alive: whether to keep connections open (default: True)
+        idle_timeout: drop pooled connections once the client has been idle
+                      for this many seconds (default: None)
+
         :param init_data: data for client initialization
         :type init_data: dict
         """
+        self.stats = ConnectionStats()
+        self.idle_timeout = init_data.get("idle_timeout")
+        self._last_request = time()
+        self.adapter = PoolAdapter(
+            stats=self.stats,
+            pool_connections=init_data.get("pool_connections", 10),
+            pool_maxsize=init_data.get("pool_maxsize", 10),
+            pool_block=init_data.get("pool_block", False),
+            max_retries=init_data.get("max_retries", 0),
+        )
         self.session = Session()
         self.session.auth = init_data["auth"]
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
+        if not init_data.get("keep_alive", True):
+            self.session.headers["Connection"] = "close"
+
+    @property
+    def connection_stats(self):
+        """Return the counters for the connections used by this client.
+
+        The number of ``reused`` connections is the number of requests which
+        were sent over an already open (pooled) connection.
+
+        :returns: the number of requests, opened and reused connections
+        :rtype: dict
+        """
+        return self.stats.to_dict()
+
+    def _prepare(self):
+        """Update the counters and drop connections which have gone idle."""
+        now = time()
+        if (self.idle_timeout is not None and
+                now - self._last_request > self.idle_timeout):
+            self.adapter.poolmanager.clear()
+        self._last_request = now
+        self.stats.add_request()
 
     def head(self, url, params=None, headers=None, auth=None):
         """HTTP HEAD method.
@@ -32,6 +172,7 @@ class DefaultClient(BaseClient):
         :returns: ArangoDB http response object
         :rtype: arango.response.Response
         """
+        self._prepare()
         res = self.session.head(
             url=url,
             params=params,
@@ -42,7 +183,7 @@ class DefaultClient(BaseClient):
             url=url,
             headers=res.headers,
             status_code=res.status_code,
-            content=res.text,
+            content=res.content,
             status_text=res.reason
         )
 
@@ -60,6 +201,7 @@ class DefaultClient(BaseClient):
         :returns: ArangoDB http response object
         :rtype: arango.response.Response
         """
+        self._prepare()
         res = self.session.get(
             url=url,
             params=params,
@@ -70,7 +212,7 @@ class DefaultClient(BaseClient):
             url=url,
             headers=res.headers,
             status_code=res.status_code,
-            content=res.text,
+            content=res.content,
             status_text=res.reason
         )
 
@@ -90,6 +232,7 @@ class DefaultClient(BaseClient):
         :returns: ArangoDB http response object
         :rtype: arango.response.Response
         """
+        self._prepare()
         res = self.session.put(
             url=url,
             data=data,
@@ -101,7 +244,7 @@ class DefaultClient(BaseClient):
             url=url,
             headers=res.headers,
             status_code=res.status_code,
-            content=res.text,
+            content=res.content,
             status_text=res.reason
         )
 
@@ -121,6 +264,7 @@ class DefaultClient(BaseClient):
         :returns: ArangoDB http response object
         :rtype: arango.response.Response
         """
+        self._prepare()
         res = self.session.post(
             url=url,
             data="" if data is None else data,
@@ -132,7 +276,7 @@ class DefaultClient(BaseClient):
             url=url,
             headers=res.headers,
             status_code=res.status_code,
-            content=res.text,
+            content=res.content,
             status_text=res.reason
         )
 
@@ -152,6 +296,7 @@ class DefaultClient(BaseClient):
         :returns: ArangoDB http response object
         :rtype: arango.response.Response
         """
+        self._prepare()
         res = self.session.patch(
             url=url,
             data=data,
@@ -163,7 +308,7 @@ class DefaultClient(BaseClient):
             url=url,
             headers=res.headers,
             status_code=res.status_code,
-            content=res.text,
+            content=res.content,
             status_text=res.reason
         )
 
@@ -181,6 +326,7 @@ class DefaultClient(BaseClient):
         :returns: ArangoDB http response object
         :rtype: arango.response.Response
         """
+        self._prepare()
         res = self.session.delete(
             url=url,
             params=params,
@@ -192,7 +338,7 @@ class DefaultClient(BaseClient):
             url=url,
             headers=res.headers,
             status_code=res.status_code,
-            content=res.text,
+            content=res.content,
             status_text=res.reason
         )
 
@@ -212,6 +358,7 @@ class DefaultClient(BaseClient):
         :returns: ArangoDB http response object
         :rtype: arango.response.Response
         """
+        self._prepare()
         res = self.session.options(
             url=url,
             data="" if data is None else data,
@@ -223,7 +370,7 @@ class DefaultClient(BaseClient):
             url=url,
             headers=res.headers,
             status_code=res.status_code,
-            content=res.text,
+            content=res.content,
             status_text=res.reason
         )
 
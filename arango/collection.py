@@ -1,11 +1,171 @@
 """ArangoDB Collection."""
 
-import json
-
-from arango.utils import camelify, uncamelify
+import gzip
+import os
+import re
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from itertools import islice
+from json import dumps, loads
+from time import time
+
+from arango.batch import execute_requests
+from arango.cache import DocumentCache
+from arango.utils import (
+    camelify,
+    uncamelify,
+    chunked,
+    interleave,
+    parallel_map,
+)
 from arango.exceptions import *
-from arango.cursor import cursor
+from arango.cursor import Cursor, split_documents
 from arango.constants import COLLECTION_STATUSES, HTTP_OK
+from arango.serializers import raw_json
+from arango.streams import (
+    JSONLinesStream,
+    csv_chunks,
+    file_line_chunks,
+    json_lines_chunks,
+)
+
+# Position prefix of the import error details (1-based within the request)
+IMPORT_ERROR_POSITION = re.compile(r"^at position (\d+): ")
+
+# Counters in the results of the import API
+IMPORT_COUNTS = ("created", "errors", "empty", "updated", "ignored")
+
+
+def merge_import_result(result, body, position_of):
+    """Add the results of an import request to the merged results.
+
+    The counts are summed up, and the error details are appended as dicts
+    with the ``position`` of the offending document in the input (or None
+    if the server did not specify it) and the error ``message``.
+
+    :param result: the merged results, with the ``IMPORT_COUNTS`` and the
+        ``details`` list if details are requested
+    :type result: dict
+    :param body: the response body of the import request
+    :type body: dict
+    :param position_of: callable mapping the 1-based position of a line in
+        the request to the position of its document in the input
+    :type position_of: callable
+    """
+    for key in IMPORT_COUNTS:
+        result[key] += body.get(key, 0)
+    for message in body.get("details", []):
+        match = IMPORT_ERROR_POSITION.match(message)
+        result["details"].append({
+            "position": position_of(int(match.group(1))) if match else None,
+            "message": message
+        })
+
+
+def split_key(document):
+    """Return the key of a document for the bulk write methods.
+
+    :param document: the document with its ``_key``, or a (key, data) tuple
+        (e.g. for documents serialized already)
+    :type document: dict or tuple
+    :returns: the key and the data of the document
+    :rtype: tuple
+    :raises: DocumentInvalidError
+    """
+    if isinstance(document, tuple):
+        if len(document) != 2:
+            raise DocumentInvalidError(
+                "the documents must be given as dicts or (key, data) tuples")
+        return document
+    if raw_json(document) is not None:
+        raise DocumentInvalidError(
+            "serialized documents must be given as (key, data) tuples")
+    if "_key" not in document:
+        raise DocumentInvalidError(
+            "the document data is missing the '_key' key")
+    return document["_key"], document
+
+
+def strip_errors(results):
+    """Remove the ``error`` flag from the bodies of the bulk write results.
+
+    :param results: the response bodies or the errors of the requests
+    :type results: list
+    :returns: the results, with the bodies as returned by the single
+        document methods
+    :rtype: list
+    """
+    for result in results:
+        if isinstance(result, dict):
+            result.pop("error", None)
+    return results
+
+
+def read_checkpoint(path):
+    """Return the number of input documents acknowledged by an import.
+
+    The checkpoint file holds a JSON line with the ``offset`` and ``count``
+    of each chunk acknowledged by the server, in input order. A line cut
+    short by a crash is ignored.
+
+    :param path: the path of the checkpoint file
+    :type path: str
+    :returns: the position in the input to resume the import from
+    :rtype: int
+    """
+    if not os.path.exists(path):
+        return 0
+    position = 0
+    with open(path) as checkpoint:
+        for line in checkpoint:
+            try:
+                record = loads(line)
+            except ValueError:
+                continue
+            if record["offset"] == position:
+                position += record["count"]
+    return position
+
+
+def encode_page_token(attribute, value, key):
+    """Return the continuation token pointing after the given document.
+
+    :param attribute: the attribute the pages are ordered by
+    :type attribute: str
+    :param value: the attribute value of the last document of the page
+    :type value: object
+    :param key: the key of the last document of the page
+    :type key: str
+    :returns: the opaque continuation token
+    :rtype: str
+    """
+    token = dumps([attribute, value, key]).encode("utf-8")
+    return urlsafe_b64encode(token).decode("ascii")
+
+
+def decode_page_token(token, attribute):
+    """Return the attribute value and key stored in the continuation token.
+
+    :param token: the continuation token
+    :type token: str
+    :param attribute: the attribute the pages are ordered by
+    :type attribute: str
+    :returns: the attribute value and key of the last document returned
+    :rtype: tuple
+    :raises: InvalidArgumentError
+    """
+    try:
+        token_attribute, value, key = loads(
+            urlsafe_b64decode(token.encode("ascii")).decode("utf-8")
+        )
+    except (TypeError, ValueError, AttributeError):
+        raise InvalidArgumentError("Invalid continuation token.")
+    if token_attribute != attribute:
+        raise InvalidArgumentError(
+            "The continuation token is for pages ordered by '{}'.".format(
+                token_attribute
+            )
+        )
+    return value, key
 
 
 class Collection(object):
@@ -18,17 +178,29 @@ class Collection(object):
     5. Index Management
     """
 
-    def __init__(self, name, api):
+    def __init__(self, name, api, type=None, properties_ttl=10):
         """Initialize the wrapper object.
 
+        No request is sent here: the type of the collection is looked up
+        on first use unless given (e.g. from the collection listing).
+
         :param name: the name of this collection
         :type name: str
         :param api: ArangoDB API object
         :type api: arango.api.API
+        :param type: the type of this collection ("document" or "edge")
+        :type type: str or None
+        :param properties_ttl: the number of seconds the properties are
+            cached for before they are fetched again (0 to disable)
+        :type properties_ttl: int or float
         """
         self.name = name
         self.api = api
-        self.type = "edge" if self.is_edge else "document"
+        self.cache = None
+        self.properties_ttl = properties_ttl
+        self._type = type
+        self._properties = None
+        self._properties_time = 0
 
     def __repr__(self):
         """Return a descriptive string of this instance."""
@@ -45,12 +217,7 @@ class Collection(object):
         :rtype: int
         :raises: CollectionGetError
         """
-        res = self.api.get(
-            "/_api/collection/{}/count".format(self.name)
-        )
-        if res.status_code not in HTTP_OK:
-            raise CollectionGetError(res)
-        return res.body["count"]
+        return self.count()
 
     def __setattr__(self, attr, value):
         """Update the properties of this collection.
@@ -64,6 +231,7 @@ class Collection(object):
             )
             if res.status_code not in HTTP_OK:
                 raise CollectionUpdateError(res)
+            self._properties = None
         else:
             super(Collection, self).__setattr__(attr, value)
 
@@ -89,20 +257,39 @@ class Collection(object):
         :rtype: bool
         :raises: DocumentGetError
         """
-        res = self.api.head(
-            "/_api/{}/{}/{}".format(self.type, self.name, key)
-        )
-        if res.status_code == 200:
-            return True
-        elif res.status_code == 404:
-            return False
-        else:
-            raise DocumentGetError(res)
+        return self.has_document(key)
+
+    @property
+    def type(self):
+        """Return the type of this collection.
+
+        :returns: "edge" or "document"
+        :rtype: str
+        :raises: CollectionGetError
+        """
+        if self._type is None:
+            self._type = "edge" if self.is_edge else "document"
+        return self._type
 
     @property
     def properties(self):
         """Return the properties of this collection.
 
+        The properties are cached for ``properties_ttl`` seconds. Use
+        ``refresh`` to fetch them again right away.
+
+        :returns: the collection's id, status, key_options etc.
+        :rtype: dict
+        :raises: CollectionGetError
+        """
+        if (self._properties is None or
+                time() - self._properties_time >= self.properties_ttl):
+            return self.refresh()
+        return dict(self._properties)
+
+    def refresh(self):
+        """Fetch the properties of this collection from the server.
+
         :returns: the collection's id, status, key_options etc.
         :rtype: dict
         :raises: CollectionGetError
@@ -112,7 +299,7 @@ class Collection(object):
         )
         if res.status_code not in HTTP_OK:
             raise CollectionGetError(res)
-        return {
+        self._properties = {
             "id": res.body["id"],
             "name": res.body["name"],
             "is_edge": res.body["type"] == 3,
@@ -127,6 +314,9 @@ class Collection(object):
             "wait_for_sync": res.body["waitForSync"],
             "key_options": uncamelify(res.body["keyOptions"])
         }
+        self._properties_time = time()
+        self._type = "edge" if self._properties["is_edge"] else "document"
+        return dict(self._properties)
 
     @property
     def id(self):
@@ -260,6 +450,7 @@ class Collection(object):
         )
         if res.status_code not in HTTP_OK:
             raise CollectionLoadError(res)
+        self._properties = None
         return COLLECTION_STATUSES.get(
             res.body["status"],
             "corrupted ({})".format(res.body["status"])
@@ -277,6 +468,7 @@ class Collection(object):
         )
         if res.status_code not in HTTP_OK:
             raise CollectionUnloadError(res)
+        self._properties = None
         return COLLECTION_STATUSES.get(
             res.body["status"],
             "corrupted ({})".format(res.body["status"])
@@ -323,16 +515,84 @@ class Collection(object):
         )
         if res.status_code not in HTTP_OK:
             raise CollectionTruncateError(res)
+        if self.cache is not None:
+            self.cache.clear()
 
     #######################
     # Document Management #
     #######################
 
+    def enable_cache(self, max_size=1000, ttl=0):
+        """Cache the documents read with ``document`` on the client side.
+
+        Cached documents younger than ``ttl`` seconds are returned without
+        a request, and older ones are revalidated with ``If-None-Match``
+        (so an unchanged document costs no body transfer). The updates,
+        replacements and deletions made through this object invalidate the
+        documents; changes made otherwise are picked up on revalidation.
+
+        :param max_size: the max number of documents in the cache
+        :type max_size: int
+        :param ttl: the number of seconds a document is served without being
+            revalidated (0 to revalidate on every read)
+        :type ttl: int or float
+        :returns: the document cache
+        :rtype: arango.cache.DocumentCache
+        :raises: InvalidArgumentError
+        """
+        self.cache = DocumentCache(max_size, ttl)
+        return self.cache
+
+    def disable_cache(self):
+        """Stop caching the documents and drop the cached ones."""
+        self.cache = None
+
     def doc(self, key, rev=None, match=True):
         """Alias for self.document."""
         return self.document(key, rev, match)
 
-    def document(self, key, rev=None, match=True):
+    def count(self, _batch=False):
+        """Return the number of documents present in this collection.
+
+        :returns: the number of documents
+        :rtype: int
+        :raises: CollectionGetError
+        """
+        path = "/_api/collection/{}/count".format(self.name)
+
+        def handler(res):
+            if res.status_code not in HTTP_OK:
+                raise CollectionGetError(res)
+            return res.body["count"]
+
+        if _batch:
+            return {"method": "get", "path": path, "handler": handler}
+        return handler(self.api.get(path))
+
+    def has_document(self, key, _batch=False):
+        """Return True if the document exists in this collection.
+
+        :param key: the document key
+        :type key: str
+        :returns: True if the document exists, else False
+        :rtype: bool
+        :raises: DocumentGetError
+        """
+        path = "/_api/{}/{}/{}".format(self.type, self.name, key)
+
+        def handler(res):
+            if res.status_code == 200:
+                return True
+            elif res.status_code == 404:
+                return False
+            else:
+                raise DocumentGetError(res)
+
+        if _batch:
+            return {"method": "head", "path": path, "handler": handler}
+        return handler(self.api.head(path))
+
+    def document(self, key, rev=None, match=True, _batch=False):
         """Return the document of the given key.
 
         If the document revision ``rev`` is specified, it is compared
@@ -350,20 +610,86 @@ class Collection(object):
         :rtype: dict or None
         :raises: DocumentRevisionError, DocumentGetError
         """
-        res = self.api.get(
-            "/_api/{}/{}/{}".format(self.type, self.name, key),
-            headers={
-                "If-Match" if match else "If-None-Match": rev
-            } if rev else {}
-        )
-        if res.status_code in {412, 304}:
-            raise DocumentRevisionError(res)
-        elif res.status_code == 404:
+        path = "/_api/{}/{}/{}".format(self.type, self.name, key)
+        if self.cache is not None and rev is None and not _batch:
+            return self._cached_document(key, path)
+        headers = {}
+        if rev is not None:
+            headers["If-Match" if match else "If-None-Match"] = rev
+
+        def handler(res):
+            if res.status_code in {412, 304}:
+                raise DocumentRevisionError(res)
+            elif res.status_code == 404:
+                return None
+            elif res.status_code not in HTTP_OK:
+                raise DocumentGetError(res)
+            return res.body
+
+        if _batch:
+            return {
+                "method": "get",
+                "path": path,
+                "headers": headers,
+                "handler": handler,
+            }
+        return handler(self.api.get(path, headers=headers))
+
+    def _cached_document(self, key, path):
+        """Return the document of the given key through the cache.
+
+        :param key: the key of the document to retrieve
+        :type key: str
+        :param path: the API path of the document
+        :type path: str
+        :returns: the requested document or None if not found
+        :rtype: dict or None
+        :raises: DocumentGetError
+        """
+        cached = self.cache.get(key)
+        if cached is not None:
+            document, fresh = cached
+            if fresh:
+                self.cache.record(hit=True)
+                return document
+            res = self.api.get(
+                path, headers={"If-None-Match": document["_rev"]}
+            )
+            if res.status_code == 304:
+                self.cache.put(key, document)
+                self.cache.record(hit=True, revalidated=True)
+                return document
+        else:
+            res = self.api.get(path)
+        self.cache.record(hit=False)
+        if res.status_code == 404:
+            self.cache.invalidate(key)
             return None
         elif res.status_code not in HTTP_OK:
             raise DocumentGetError(res)
+        self.cache.put(key, res.body)
         return res.body
 
+    def _invalidating_handler(self, key):
+        """Return the batch handler of a write to a cached document.
+
+        The document is removed from the cache once the write is executed,
+        so a read in between cannot cache the document as it was before.
+        The result (the response body) and the error (BatchPartError) are
+        those of the batch requests without a handler.
+
+        :param key: the key of the document written
+        :type key: str
+        :returns: the handler of the batch request
+        :rtype: callable
+        """
+        def handler(res):
+            self.cache.invalidate(key)
+            if res.status_code not in HTTP_OK:
+                raise BatchPartError(res)
+            return res.body
+        return handler
+
     def create_document(self, data, wait_for_sync=False, _batch=False):
         """Create a new document to this collection.
 
@@ -371,19 +697,29 @@ class Collection(object):
         If this collection is an edge collection, ``data`` must contain the
         ``_from`` and ``_to`` keys with valid vertex IDs as their values.
 
+        The document may be given as JSON serialized already (RawJSON, bytes
+        or str), which is sent as it is. Only the JSON of an edge is decoded,
+        as the edge API takes the vertex IDs as request parameters.
+
         :param data: the body of the new document
-        :type data: dict
+        :type data: dict or arango.serializers.RawJSON or bytes or str
         :param wait_for_sync: wait for create to sync to disk
         :type wait_for_sync: bool
         :returns: the id, rev and key of the new document
         :rtype: dict
         :raises: DocumentInvalidError, DocumentCreateError
         """
-        if self.type is "edge":
-            if "_to" not in data:
+        fields = data
+        raw = raw_json(data)
+        if raw is not None:
+            fields = {}
+            if self.type == "edge":
+                fields = self.api.serializer.loads(raw)
+        if self.type == "edge":
+            if "_to" not in fields:
                 raise DocumentInvalidError(
                     "the new document data is missing the '_to' key")
-            if "_from" not in data:
+            if "_from" not in fields:
                 raise DocumentInvalidError(
                     "the new document data is missing the '_from' key")
         path = "/_api/{}".format(self.type)
@@ -391,10 +727,10 @@ class Collection(object):
             "collection": self.name,
             "waitForSync": wait_for_sync,
         }
-        if "_from" in data:
-            params["from"] = data["_from"]
-        if "_to" in data:
-            params["to"] = data["_to"]
+        if "_from" in fields:
+            params["from"] = fields["_from"]
+        if "_to" in fields:
+            params["to"] = fields["_to"]
         if _batch:
             return {
                 "method": "post",
@@ -426,7 +762,7 @@ class Collection(object):
         :param key: the key of the document to be updated
         :type key: str
         :param data: the body to update the document with
-        :type data: dict
+        :type data: dict or arango.serializers.RawJSON or bytes or str
         :param rev: the document revision must match this value
         :type rev: str or None
         :param keep_none: whether or not to keep the items with value None
@@ -445,17 +781,24 @@ class Collection(object):
         if rev is not None:
             params["rev"] = rev
             params["policy"] = "error"
-        elif "_rev" in data:
+        elif raw_json(data) is None and "_rev" in data:
             params["rev"] = data["_rev"]
             params["policy"] = "error"
         if _batch:
-            return {
+            request = {
                 "method": "patch",
                 "path": path,
                 "data": data,
                 "params": params,
             }
-        res = self.api.patch(path=path, data=data, params=params)
+            if self.cache is not None:
+                request["handler"] = self._invalidating_handler(key)
+            return request
+        try:
+            res = self.api.patch(path=path, data=data, params=params)
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate(key)
         if res.status_code == 412:
             raise DocumentRevisionError(res)
         if res.status_code not in HTTP_OK:
@@ -479,7 +822,7 @@ class Collection(object):
         :param key: the key of the document to be replaced
         :type key: str
         :param data: the body to replace the document with
-        :type data: dict
+        :type data: dict or arango.serializers.RawJSON or bytes or str
         :param rev: the document revision must match this value
         :type rev: str or None
         :param wait_for_sync: wait for the replace to sync to disk
@@ -492,18 +835,25 @@ class Collection(object):
         if rev is not None:
             params["rev"] = rev
             params["policy"] = "error"
-        elif "_rev" in data:
+        elif raw_json(data) is None and "_rev" in data:
             params["rev"] = data["_rev"]
             params["policy"] = "error"
         path = "/_api/{}/{}/{}".format(self.type, self.name, key)
         if _batch:
-            return {
+            request = {
                 "method": "put",
                 "path": path,
                 "data": data,
                 "params": params,
             }
-        res = self.api.put(path=path, params=params, data=data)
+            if self.cache is not None:
+                request["handler"] = self._invalidating_handler(key)
+            return request
+        try:
+            res = self.api.put(path=path, params=params, data=data)
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate(key)
         if res.status_code == 412:
             raise DocumentRevisionError(res)
         elif res.status_code not in HTTP_OK:
@@ -531,12 +881,19 @@ class Collection(object):
             params["policy"] = "error"
         path = "/_api/{}/{}/{}".format(self.type, self.name, key)
         if _batch:
-            return {
+            request = {
                 "method": "delete",
                 "path": path,
                 "params": params
             }
-        res = self.api.delete(path=path, params=params)
+            if self.cache is not None:
+                request["handler"] = self._invalidating_handler(key)
+            return request
+        try:
+            res = self.api.delete(path=path, params=params)
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate(key)
         if res.status_code == 412:
             raise DocumentRevisionError(res)
         elif res.status_code not in {200, 202}:
@@ -544,13 +901,182 @@ class Collection(object):
         del res.body["error"]
         return res.body
 
+    def insert_many(self, documents, chunk_size=1000, chunk_bytes=None,
+                    workers=4, on_duplicate=None):
+        """Insert documents in bulk through the import API.
+
+        The documents are uploaded with ``import_bulk`` (in chunks of at
+        most ``chunk_size`` documents, ``workers`` at once), and an invalid
+        document does not fail the others. If the server rejects documents
+        without telling their positions, DocumentsInsertError is raised
+        rather than reporting them as written.
+
+        :param documents: the documents to insert (dicts, or their JSON
+            serialized already as RawJSON, bytes or str)
+        :type documents: collections.Iterable
+        :param chunk_size: the max number of documents per request
+        :type chunk_size: int
+        :param chunk_bytes: the approximate max size in bytes of a request
+        :type chunk_bytes: int or None
+        :param workers: the number of concurrent requests
+        :type workers: int
+        :param on_duplicate: the action on a unique key constraint violation
+            ("error", "update", "replace" or "ignore")
+        :type on_duplicate: str or None
+        :returns: True for each document written, or the error for each
+            document rejected, in the order of the documents
+        :rtype: list
+        :raises: DocumentsImportError, DocumentsInsertError
+        """
+        result = self.import_bulk(
+            documents,
+            chunk_size=chunk_size,
+            chunk_bytes=chunk_bytes,
+            workers=workers,
+            complete=False,
+            details=True,
+            on_duplicate=on_duplicate
+        )
+        results = [True] * sum(result[key] for key in IMPORT_COUNTS)
+        unplaced = []
+        for detail in result["details"]:
+            position = detail["position"]
+            if position is None or position >= len(results):
+                unplaced.append(detail)
+            else:
+                results[position] = DocumentRejectedError(
+                    detail["message"], position
+                )
+        rejected = sum(
+            isinstance(item, DocumentRejectedError) for item in results
+        )
+        if unplaced or rejected < result["errors"]:
+            raise DocumentsInsertError(results, unplaced)
+        return results
+
+    def update_many(self, documents, keep_none=True, wait_for_sync=False,
+                    chunk_size=500, chunk_bytes=None, workers=4):
+        """Update documents in bulk through batch requests.
+
+        The updates are sent with ``update_document`` in batches of at most
+        ``chunk_size`` requests (and roughly ``chunk_bytes`` bytes if
+        given), ``workers`` batches at once. The batches may be executed in
+        any order, so a key should appear only once.
+
+        :param documents: the documents with their ``_key`` (and ``_rev``
+            to check), or (key, data) tuples
+        :type documents: collections.Iterable
+        :param keep_none: whether or not to keep the items with value None
+        :type keep_none: bool
+        :param wait_for_sync: wait for the updates to sync to disk
+        :type wait_for_sync: bool
+        :param chunk_size: the max number of updates per batch
+        :type chunk_size: int
+        :param chunk_bytes: the approximate max size of a batch in bytes
+        :type chunk_bytes: int or None
+        :param workers: the number of batches sent concurrently
+        :type workers: int
+        :returns: the response body of each update or its error (a
+            BatchPartError), in the order of the documents
+        :rtype: list
+        :raises: DocumentInvalidError, BatchExecuteError
+        """
+        requests = []
+        for document in documents:
+            key, data = split_key(document)
+            requests.append(self.update_document(
+                key, data, keep_none=keep_none, wait_for_sync=wait_for_sync,
+                _batch=True
+            ))
+        return strip_errors(execute_requests(
+            self.api, requests, max_ops=chunk_size, max_bytes=chunk_bytes,
+            workers=workers
+        ))
+
+    def replace_many(self, documents, wait_for_sync=False, chunk_size=500,
+                     chunk_bytes=None, workers=4):
+        """Replace documents in bulk through batch requests.
+
+        The replacements are sent with ``replace_document`` in batches as
+        with ``update_many``.
+
+        :param documents: the documents with their ``_key`` (and ``_rev``
+            to check), or (key, data) tuples
+        :type documents: collections.Iterable
+        :param wait_for_sync: wait for the replacements to sync to disk
+        :type wait_for_sync: bool
+        :param chunk_size: the max number of replacements per batch
+        :type chunk_size: int
+        :param chunk_bytes: the approximate max size of a batch in bytes
+        :type chunk_bytes: int or None
+        :param workers: the number of batches sent concurrently
+        :type workers: int
+        :returns: the response body of each replacement or its error (a
+            BatchPartError), in the order of the documents
+        :rtype: list
+        :raises: DocumentInvalidError, BatchExecuteError
+        """
+        requests = []
+        for document in documents:
+            key, data = split_key(document)
+            requests.append(self.replace_document(
+                key, data, wait_for_sync=wait_for_sync, _batch=True
+            ))
+        return strip_errors(execute_requests(
+            self.api, requests, max_ops=chunk_size, max_bytes=chunk_bytes,
+            workers=workers
+        ))
+
+    def delete_many(self, keys, chunk_size=1000, workers=4, details=False):
+        """Delete documents in bulk.
+
+        By default, the keys are sent to ``remove_by_keys`` in chunks of at
+        most ``chunk_size`` keys, ``workers`` chunks at once, which only
+        tells how many documents were removed. With ``details`` set, the
+        documents are deleted with ``delete_document`` in batches instead,
+        which gives the result of each key at the cost of a request part
+        per document.
+
+        :param keys: the keys of the documents to delete
+        :type keys: collections.Iterable
+        :param chunk_size: the max number of keys per request or batch
+        :type chunk_size: int
+        :param workers: the number of concurrent requests
+        :type workers: int
+        :param details: return the result of each key
+        :type details: bool
+        :returns: the numbers of documents removed and ignored (missing), or
+            with ``details``, the response body of each deletion or its
+            error (a BatchPartError) in the order of the keys
+        :rtype: dict or list
+        :raises: SimpleQueryDeleteByKeysError, BatchExecuteError
+        """
+        if details:
+            return strip_errors(execute_requests(
+                self.api,
+                [self.delete_document(key, _batch=True) for key in keys],
+                max_ops=chunk_size,
+                workers=workers
+            ))
+        result = {"removed": 0, "ignored": 0}
+        for counts in parallel_map(
+                self.remove_by_keys, chunked(keys, chunk_size), workers):
+            result["removed"] += counts["removed"]
+            result["ignored"] += counts["ignored"]
+        return result
+
     ############################
     # Document Import & Export #
     ############################
 
-    def import_documents(self, documents, complete=True, details=True):
+    def import_documents(self, documents, complete=True, details=True,
+                         chunk_size=65536):
         """Import documents into this collection in bulk.
 
+        The documents are serialized as they are uploaded and streamed to
+        the server with chunked transfer encoding, so any iterable (e.g. a
+        generator reading from a file) can be imported in constant memory.
+
         If ``complete`` is set to a value other than True, valid documents
         will be imported while invalid ones are rejected, meaning only some of
         the uploaded documents might have been imported.
@@ -558,19 +1084,24 @@ class Collection(object):
         If ``details`` parameter is set to True, the response will also contain
         ``details`` attribute which is a list of detailed error messages.
 
-        :param documents: list of documents to import
-        :type documents: list
+        :param documents: the documents to import (dicts, or their JSON
+            serialized already as RawJSON, bytes or str)
+        :type documents: collections.Iterable
         :param complete: entire import fails if any document is invalid
         :type complete: bool
         :param details: return details about invalid documents
         :type details: bool
+        :param chunk_size: the approximate size in bytes of the streamed chunks
+        :type chunk_size: int
         :returns: the import results
         :rtype: dict
         :raises: DocumentsImportError
         """
         res = self.api.post(
             "/_api/import",
-            data="\r\n".join([json.dumps(d) for d in documents]),
+            data=JSONLinesStream(
+                documents, self.api.serializer.encode_document, chunk_size
+            ),
             params={
                 "type": "documents",
                 "collection": self.name,
@@ -583,9 +1114,206 @@ class Collection(object):
         del res.body["error"]
         return res.body
 
+    def import_bulk(self, documents, chunk_size=1000, chunk_bytes=None,
+                    workers=4, complete=True, details=True,
+                    on_duplicate=None, checkpoint=None):
+        """Import documents into this collection in concurrent chunks.
+
+        The documents are split into chunks of at most ``chunk_size``
+        documents (and roughly ``chunk_bytes`` bytes if given), which are
+        uploaded by ``workers`` threads at once. The input is consumed
+        lazily, so it may be a generator of any length.
+
+        Each chunk is imported in a separate request, so ``complete`` only
+        applies to the chunk holding the invalid document. Chunks uploaded
+        before an error is raised stay imported.
+
+        The results of the chunks are merged into one: the counts are
+        summed up and ``details`` lists the errors as dicts with the
+        ``position`` of the offending document in the input (0-based, or
+        None if the server did not specify it) and the error ``message``.
+
+        The connection pool should have at least ``workers`` connections
+        per host (see the ``pool_maxsize`` argument of Arango).
+
+        With a ``checkpoint`` file, the import can be resumed after a
+        failure: the chunks acknowledged by the server are recorded in the
+        file, and a later call with the same file (and the same documents
+        in the same order) skips the documents imported already. Chunks in
+        flight during the failure are sent again, which is harmless for
+        documents with a ``_key`` as ``on_duplicate`` defaults to "ignore"
+        in this mode. The file is kept after the import; delete it to start
+        over.
+
+        :param documents: the documents to import (dicts, or their JSON
+            serialized already as RawJSON, bytes or str)
+        :type documents: collections.Iterable
+        :param chunk_size: the max number of documents per request
+        :type chunk_size: int
+        :param chunk_bytes: the approximate max size in bytes of a request
+        :type chunk_bytes: int or None
+        :param workers: the number of concurrent requests
+        :type workers: int
+        :param complete: a chunk fails entirely if any document is invalid
+        :type complete: bool
+        :param details: return details about invalid documents
+        :type details: bool
+        :param on_duplicate: the action on a unique key constraint violation
+            ("error", "update", "replace" or "ignore")
+        :type on_duplicate: str or None
+        :param checkpoint: the path of the checkpoint file to resume from
+            and record the progress in
+        :type checkpoint: str or None
+        :returns: the merged import results (and the position the import
+            was ``resumed_from`` with a checkpoint)
+        :rtype: dict
+        :raises: DocumentsImportError
+        """
+        resumed_from = 0
+        if checkpoint is not None:
+            resumed_from = read_checkpoint(checkpoint)
+            documents = islice(documents, resumed_from, None)
+            if on_duplicate is None:
+                on_duplicate = "ignore"
+        chunks = (
+            (resumed_from + offset, count, data)
+            for offset, count, data in json_lines_chunks(
+                documents, self.api.serializer.encode_document, chunk_size,
+                chunk_bytes
+            )
+        )
+        params = {
+            "type": "documents",
+            "collection": self.name,
+            "complete": complete,
+            "details": details
+        }
+        if on_duplicate is not None:
+            params["onDuplicate"] = on_duplicate
+        result = self._import_chunks(chunks, params, workers, checkpoint)
+        if checkpoint is not None:
+            result["resumed_from"] = resumed_from
+        return result
+
+    def import_file(self, path, format="jsonl", chunk_bytes=1048576,
+                    workers=4, complete=True, details=True,
+                    encoding="utf-8", **fmtparams):
+        """Import the documents of a JSON lines or CSV file in bulk.
+
+        A JSON lines file (one document per line, UTF-8 encoded) is
+        memory-mapped and cut into chunks of whole lines of at most
+        ``chunk_bytes`` bytes, which are uploaded as they are without being
+        decoded on the client. The records of a CSV file (with a header
+        record) are converted into JSON arrays, one per line, and uploaded
+        in chunks starting with the header; the values are imported as
+        strings. ``workers`` chunks are uploaded at once.
+
+        As with ``import_bulk``, ``complete`` only applies to the chunk
+        holding the invalid document, and the ``position`` in the error
+        details is the 0-based line in the JSON lines file or record in the
+        CSV file (the header being record 0).
+
+        :param path: the path of the file
+        :type path: str
+        :param format: the format of the file ("jsonl" or "csv")
+        :type format: str
+        :param chunk_bytes: the approximate max size in bytes of a request
+        :type chunk_bytes: int
+        :param workers: the number of concurrent requests
+        :type workers: int
+        :param complete: a chunk fails entirely if any document is invalid
+        :type complete: bool
+        :param details: return details about invalid documents
+        :type details: bool
+        :param encoding: the encoding of the CSV file
+        :type encoding: str
+        :param fmtparams: the formatting parameters of the csv module (e.g.
+            delimiter)
+        :returns: the merged import results
+        :rtype: dict
+        :raises: InvalidArgumentError, DocumentsImportError
+        """
+        params = {
+            "collection": self.name,
+            "complete": complete,
+            "details": details
+        }
+        if format == "jsonl":
+            chunks = file_line_chunks(path, chunk_bytes)
+            params["type"] = "documents"
+        elif format == "csv":
+            chunks = csv_chunks(
+                path, self.api.serializer.encode, chunk_bytes, encoding,
+                **fmtparams
+            )
+        else:
+            raise InvalidArgumentError("Expecting 'jsonl' or 'csv'.")
+        return self._import_chunks(chunks, params, workers)
+
+    def _import_chunks(self, chunks, params, workers, checkpoint=None):
+        """Upload the chunks to the import API and merge the results.
+
+        :param chunks: the offset of the first document of each chunk in
+            the input, the number of documents in the chunk and its request
+            body
+        :type chunks: collections.Iterable
+        :param params: the request parameters of the import API
+        :type params: dict
+        :param workers: the number of concurrent requests
+        :type workers: int
+        :param checkpoint: the path of the file to append the acknowledged
+            chunks of JSON lines to (see ``read_checkpoint``)
+        :type checkpoint: str or None
+        :returns: the merged import results
+        :rtype: dict
+        :raises: DocumentsImportError
+        """
+        def upload(chunk):
+            res = self.api.post("/_api/import", data=chunk[2], params=params)
+            if res.status_code not in HTTP_OK:
+                raise DocumentsImportError(res)
+            return chunk, res.body
+
+        result = dict.fromkeys(IMPORT_COUNTS, 0)
+        if params["details"]:
+            result["details"] = []
+        log = None
+        if checkpoint is not None:
+            log = open(checkpoint, "a+b")
+            log.seek(0, os.SEEK_END)
+            if log.tell() > 0:
+                log.seek(log.tell() - 1)
+                if log.read(1) != b"\n":
+                    # Do not append to a line cut short by a crash
+                    log.write(b"\n")
+        try:
+            for chunk, body in parallel_map(upload, chunks, workers):
+                offset, count, data = chunk
+                merge_import_result(
+                    result, body, lambda index: offset + index - 1
+                )
+                if log is not None:
+                    # The chunks arrive in input order, so the file always
+                    # holds an unbroken run of acknowledged documents
+                    log.write(dumps({
+                        "offset": offset,
+                        "count": count
+                    }).encode("utf-8") + b"\n")
+                    log.flush()
+                    os.fsync(log.fileno())
+        finally:
+            if log is not None:
+                log.close()
+            # Documents overwritten by the import may be cached
+            if (self.cache is not None and
+                    params.get("onDuplicate") in {"update", "replace"}):
+                self.cache.clear()
+        return result
+
     # TODO look into this endpoint for better documentation and testing
     def export_documents(self, flush=None, flush_wait=None, count=None,
-                         batch_size=None, limit=None, ttl=None, restrict=None):
+                         batch_size=None, limit=None, ttl=None, restrict=None,
+                         prefetch=0):
         """"Export all documents from this collection using a cursor.
 
         :param flush: trigger a WAL flush operation prior to the export
@@ -602,8 +1330,11 @@ class Collection(object):
         :type ttl: int or None
         :param restrict: object with attributes to be excluded/included
         :type restrict: dict
-        :return: the generator of documents in this collection
-        :rtype: generator
+        :param prefetch: the number of batches to fetch ahead in the
+            background while the current one is consumed
+        :type prefetch: int
+        :returns: the cursor of the documents in this collection
+        :rtype: arango.cursor.Cursor
         :raises: DocumentsExportError
         """
         params = {"collection": self.name}
@@ -627,7 +1358,97 @@ class Collection(object):
         res = self.api.post("/_api/export", params=params, data=data)
         if res.status_code not in HTTP_OK:
             raise DocumentsExportError(res)
-        return cursor(self.api, res)
+        return Cursor(self.api, res, prefetch)
+
+    def export_to_file(self, target, batch_size=5000, compress=None,
+                       per_line="document", restrict=None, prefetch=1):
+        """Export all documents from this collection into a JSON lines file.
+
+        The batches are written as they arrive, so the memory used is
+        bounded by ``batch_size`` (times ``prefetch`` batches downloaded
+        ahead while the current one is written). The results of a batch
+        are sliced out of the response undecoded: with ``per_line`` set to
+        "batch" they are written to the file as they are, one JSON array
+        per batch per line, and with "document" (the default) the array is
+        split into its documents, written one per line still undecoded. A
+        batch holding an escaped quote cannot be split this way, so its
+        documents are decoded and encoded again.
+
+        :param target: the path of the file, or a file object opened for
+            writing bytes
+        :type target: str or file
+        :param batch_size: the max number of documents per batch
+        :type batch_size: int
+        :param compress: "gzip" to compress the file, or None
+        :type compress: str or None
+        :param per_line: write a "document" or a "batch" per line
+        :type per_line: str
+        :param restrict: object with attributes to be excluded/included
+        :type restrict: dict
+        :param prefetch: the number of batches to fetch ahead in the
+            background while the current one is written
+        :type prefetch: int
+        :returns: the number of documents and (uncompressed) bytes written,
+            the seconds taken and the documents and bytes per second
+        :rtype: dict
+        :raises: InvalidArgumentError, DocumentsExportError,
+            CursorGetNextError
+        """
+        if compress not in {None, "gzip"}:
+            raise InvalidArgumentError("Unsupported compression.")
+        if per_line not in {"document", "batch"}:
+            raise InvalidArgumentError("Expecting 'document' or 'batch'.")
+        start = time()
+        cursor = self.export_documents(
+            count=True,
+            batch_size=batch_size,
+            restrict=restrict,
+            prefetch=prefetch
+        )
+        serializer = self.api.serializer
+        documents = written = 0
+        output = target if hasattr(target, "write") else open(target, "wb")
+        sink = output
+        if compress == "gzip":
+            sink = gzip.GzipFile(fileobj=output, mode="wb")
+        try:
+            with cursor:
+                for batch in cursor.iter_batches(raw=True):
+                    if per_line == "batch":
+                        if batch == b"[]":
+                            continue
+                        chunk = batch + b"\n"
+                    else:
+                        lines = split_documents(batch)
+                        if lines is None:
+                            lines = [
+                                serializer.encode(doc)
+                                for doc in serializer.loads(batch)
+                            ]
+                        if not lines:
+                            continue
+                        documents += len(lines)
+                        chunk = b"\n".join(lines) + b"\n"
+                    sink.write(chunk)
+                    written += len(chunk)
+        finally:
+            if sink is not output:
+                sink.close()
+            if output is not target:
+                output.close()
+        if per_line == "batch":
+            documents = cursor.count
+        seconds = time() - start
+        return {
+            "documents": documents,
+            "bytes": written,
+            "seconds": seconds,
+            "documents_per_second": (
+                documents / seconds if seconds and documents is not None
+                else None
+            ),
+            "bytes_per_second": written / seconds if seconds else None,
+        }
 
     ##################
     # Simple Queries #
@@ -667,17 +1488,22 @@ class Collection(object):
             raise SimpleQueryLastError(res)
         return res.body["result"]
 
-    def all(self, skip=None, limit=None):
+    def all(self, skip=None, limit=None, prefetch=0):
         """Return all documents in this collection.
 
-        ``skip`` is applied before ``limit`` if both are provided.
+        ``skip`` is applied before ``limit`` if both are provided. The
+        server still reads the skipped documents, so use ``paginate`` to
+        page through large collections.
 
         :param skip: the number of documents to skip
         :type skip: int
         :param limit: maximum number of documents to return
         :type limit: int
+        :param prefetch: the number of batches to fetch ahead in the
+            background while the current one is consumed
+        :type prefetch: int
         :returns: the list of all documents
-        :rtype: list
+        :rtype: arango.cursor.Cursor
         :raises: SimpleQueryAllError
         """
         data = {"collection": self.name}
@@ -688,7 +1514,134 @@ class Collection(object):
         res = self.api.put("/_api/simple/all", data=data)
         if res.status_code not in HTTP_OK:
             raise SimpleQueryAllError(res)
-        return cursor(self.api, res)
+        return Cursor(self.api, res, prefetch)
+
+    def scan(self, partitions=4, batch_size=1000, attribute="_key",
+             samples=16, merge=True):
+        """Read all documents through several cursors at once.
+
+        The collection is split into ``partitions`` ranges of ``attribute``
+        (``_key`` or an attribute with a skiplist index) at the quantiles
+        of a random sample of its values, sampled and sorted by the server
+        so the bounds follow the AQL ordering (e.g. the collation of the
+        strings, and numbers before strings), and each range is read by its
+        own cursor, so the server and the client work on the ranges in
+        parallel. With ``merge`` set, the ranges are read by one thread
+        each and the documents are yielded in the order they arrive.
+        Otherwise an iterator per range is returned to be consumed as the
+        caller sees fit (e.g. by a pool of processes).
+
+        :param partitions: the number of ranges
+        :type partitions: int
+        :param batch_size: the number of documents per cursor batch
+        :type batch_size: int
+        :param attribute: the (top-level) attribute to split the ranges on
+        :type attribute: str
+        :param samples: the number of random documents sampled per range
+            to find the range boundaries
+        :type samples: int
+        :param merge: yield the documents of all ranges from one iterator
+        :type merge: bool
+        :returns: the documents, or the iterators of the ranges
+        :rtype: collections.Iterator or list
+        :raises: InvalidArgumentError, SimpleQueryScanError
+        """
+        if not isinstance(partitions, int) or partitions < 1:
+            raise InvalidArgumentError(
+                "The number of partitions must be a positive int."
+            )
+        values = []
+        if partitions > 1:
+            values = self._scan_sample(attribute, partitions * samples)
+        bounds = []
+        if values:
+            for i in range(1, partitions):
+                value = values[len(values) * i // partitions]
+                # The values are distinct, but may be fewer than partitions
+                if not bounds or bounds[-1] != value:
+                    bounds.append(value)
+        ranges = [
+            self._scan_range(low, high, attribute, batch_size)
+            for low, high in zip([None] + bounds, bounds + [None])
+        ]
+        if merge:
+            return (doc for batch in interleave(ranges) for doc in batch)
+        return [(doc for batch in batches for doc in batch)
+                for batches in ranges]
+
+    def _scan_sample(self, attribute, size):
+        """Return the distinct values of a random sample of the documents.
+
+        :param attribute: the attribute to sample
+        :type attribute: str
+        :param size: the number of documents sampled
+        :type size: int
+        :returns: the values sorted in the AQL order (empty if there are
+            no documents with the attribute)
+        :rtype: list
+        :raises: SimpleQueryScanError
+        """
+        res = self.api.post(
+            "/_api/cursor",
+            data={
+                "query": (
+                    "FOR doc IN @@collection "
+                    "FILTER doc.@attribute != null "
+                    "SORT RAND() LIMIT @size "
+                    "COLLECT value = doc.@attribute "
+                    "SORT value RETURN value"
+                ),
+                "bindVars": {
+                    "@collection": self.name,
+                    "attribute": attribute,
+                    "size": size
+                },
+                "batchSize": max(size, 1)
+            }
+        )
+        if res.status_code not in HTTP_OK:
+            raise SimpleQueryScanError(res)
+        return res.body["result"]
+
+    def _scan_range(self, low, high, attribute, batch_size):
+        """Yield the batches of documents with ``attribute`` in the range.
+
+        :param low: the lower bound (inclusive) or None for no bound
+        :type low: object
+        :param high: the upper bound (exclusive) or None for no bound
+        :type high: object
+        :param attribute: the attribute the range is on
+        :type attribute: str
+        :param batch_size: the number of documents per cursor batch
+        :type batch_size: int
+        :returns: the lists of documents
+        :rtype: collections.Iterator
+        :raises: SimpleQueryScanError
+        """
+        bind_vars = {"@collection": self.name, "attribute": attribute}
+        filters = []
+        if low is not None:
+            bind_vars["low"] = low
+            filters.append("FILTER doc.@attribute >= @low")
+        if high is not None:
+            bind_vars["high"] = high
+            filters.append("FILTER doc.@attribute < @high")
+        query = " ".join(
+            ["FOR doc IN @@collection"] + filters + ["RETURN doc"]
+        )
+        res = self.api.post(
+            "/_api/cursor",
+            data={
+                "query": query,
+                "bindVars": bind_vars,
+                "batchSize": batch_size
+            }
+        )
+        if res.status_code not in HTTP_OK:
+            raise SimpleQueryScanError(res)
+        with Cursor(self.api, res) as cursor:
+            for batch in cursor.iter_batches():
+                yield batch
 
     def any(self):
         """Return a random document from this collection.
@@ -734,7 +1687,7 @@ class Collection(object):
         :param limit: maximum number of documents to return
         :type limit: int
         :returns: the list of matching documents
-        :rtype: list
+        :rtype: arango.cursor.Cursor
         :raises: SimpleQueryGetByExampleError
         """
         data = {"collection": self.name, "example": example}
@@ -745,7 +1698,76 @@ class Collection(object):
         res = self.api.put("/_api/simple/by-example", data=data)
         if res.status_code not in HTTP_OK:
             raise SimpleQueryGetByExampleError(res)
-        return cursor(self.api, res)
+        return Cursor(self.api, res)
+
+    def paginate(self, limit=1000, token=None, attribute="_key",
+                 example=None):
+        """Return a page of documents and the token for the next page.
+
+        Unlike ``skip``, which makes the server read through every skipped
+        document, each page resumes right after the last document of the
+        previous one (seek pagination), so all pages cost the same no
+        matter how deep. The documents are ordered by ``attribute`` (with
+        the key breaking ties), which should be ``_key`` or an attribute
+        with a skiplist index.
+
+        :param limit: the max number of documents in the page
+        :type limit: int
+        :param token: the continuation token returned with the previous
+            page (None for the first page)
+        :type token: str or None
+        :param attribute: the (top-level) attribute to order the pages by
+        :type attribute: str
+        :param example: return only the documents matching the example
+            document body (as with ``get_by_example``)
+        :type example: dict or None
+        :returns: the documents and the token for the next page (None if
+            this is the last page)
+        :rtype: dict
+        :raises: InvalidArgumentError, SimpleQueryPaginateError
+        """
+        if not isinstance(limit, int) or limit < 1:
+            raise InvalidArgumentError("The limit must be a positive int.")
+        bind_vars = {"@collection": self.name, "limit": limit}
+        filters = []
+        if token is not None:
+            value, key = decode_page_token(token, attribute)
+            bind_vars["key"] = key
+            if attribute == "_key":
+                filters.append("FILTER doc._key > @key")
+            else:
+                bind_vars["value"] = value
+                filters.append("FILTER doc.@attribute >= @value")
+                filters.append(
+                    "FILTER doc.@attribute != @value || doc._key > @key"
+                )
+        if example is not None:
+            bind_vars["example"] = example
+            filters.append("FILTER MATCHES(doc, @example)")
+        if attribute == "_key":
+            sort = "SORT doc._key"
+        else:
+            bind_vars["attribute"] = attribute
+            sort = "SORT doc.@attribute, doc._key"
+        query = " ".join(
+            ["FOR doc IN @@collection"] + filters +
+            [sort, "LIMIT @limit", "RETURN doc"]
+        )
+        res = self.api.post(
+            "/_api/cursor",
+            data={"query": query, "bindVars": bind_vars, "batchSize": limit}
+        )
+        if res.status_code not in HTTP_OK:
+            raise SimpleQueryPaginateError(res)
+        documents = list(Cursor(self.api, res))
+        if len(documents) < limit:
+            token = None
+        else:
+            last = documents[-1]
+            token = encode_page_token(
+                attribute, last.get(attribute), last["_key"]
+            )
+        return {"documents": documents, "token": token}
 
     def update_by_example(self, example, new_value, keep_none=True, limit=None,
                           wait_for_sync=False):
@@ -855,7 +1877,7 @@ class Collection(object):
         :param limit: maximum number of documents to return
         :type limit: int
         :returns: the list of documents
-        :rtype: list
+        :rtype: arango.cursor.Cursor
         :raises: SimpleQueryRangeError
         """
         data = {
@@ -872,7 +1894,7 @@ class Collection(object):
         res = self.api.put("/_api/simple/range", data=data)
         if res.status_code not in HTTP_OK:
             raise SimpleQueryRangeError(res)
-        return cursor(self.api, res)
+        return Cursor(self.api, res)
 
     def near(self, latitude, longitude, distance=None, radius=None, skip=None,
              limit=None, geo=None):
@@ -902,7 +1924,7 @@ class Collection(object):
         :param geo: the identifier of the geo-index to use
         :type geo: str
         :returns: the list of documents that are near the coordinate
-        :rtype: list
+        :rtype: arango.cursor.Cursor
         :raises: SimpleQueryNearError
         """
         data = {
@@ -924,7 +1946,7 @@ class Collection(object):
         res = self.api.put("/_api/simple/near", data=data)
         if res.status_code not in HTTP_OK:
             raise SimpleQueryNearError(res)
-        return cursor(self.api, res)
+        return Cursor(self.api, res)
 
     # TODO this endpoint does not seem to work
     def within(self, latitude, longitude, radius, distance=None, skip=None,
@@ -954,7 +1976,7 @@ class Collection(object):
         :param geo: the identifier of the geo-index to use
         :type geo: str
         :returns: the list of documents are within the radius
-        :rtype: list
+        :rtype: arango.cursor.Cursor
         :raises: SimpleQueryWithinError
         """
         data = {
@@ -975,7 +1997,7 @@ class Collection(object):
         res = self.api.put("/_api/simple/within", data=data)
         if res.status_code not in HTTP_OK:
             raise SimpleQueryWithinError(res)
-        return cursor(self.api, res)
+        return Cursor(self.api, res)
 
     def fulltext(self, attribute, query, skip=None, limit=None, index=None):
         """Return all documents that match the specified fulltext ``query``.
@@ -995,7 +2017,7 @@ class Collection(object):
         :param limit: maximum number of documents to return
         :type limit: int
         :returns: the list of documents
-        :rtype: list
+        :rtype: arango.cursor.Cursor
         :raises: SimpleQueryFullTextError
         """
         data = {
@@ -1012,7 +2034,7 @@ class Collection(object):
         res = self.api.put("/_api/simple/fulltext", data=data)
         if res.status_code not in HTTP_OK:
             raise SimpleQueryFullTextError(res)
-        return cursor(self.api, res)
+        return Cursor(self.api, res)
 
     def lookup_by_keys(self, keys):
         """Return all documents whose key is in ``keys``.
@@ -1032,6 +2054,32 @@ class Collection(object):
             raise SimpleQueryLookupByKeysError(res)
         return res.body["documents"]
 
+    def get_many(self, keys, chunk_size=1000, workers=4):
+        """Return the documents of the given keys in the order of the keys.
+
+        The keys are looked up in chunks of ``chunk_size`` keys, fetched by
+        ``workers`` threads at once. The returned list is aligned with
+        ``keys``, holding None for the keys of missing documents.
+
+        :param keys: the keys of the documents
+        :type keys: collections.Iterable
+        :param chunk_size: the max number of keys per request
+        :type chunk_size: int
+        :param workers: the number of concurrent requests
+        :type workers: int
+        :returns: the documents (or None) in the order of the keys
+        :rtype: list
+        :raises: SimpleQueryLookupByKeysError
+        """
+        def lookup(chunk):
+            found = {doc["_key"]: doc for doc in self.lookup_by_keys(chunk)}
+            return [found.get(key) for key in chunk]
+
+        documents = []
+        for chunk in parallel_map(lookup, chunked(keys, chunk_size), workers):
+            documents.extend(chunk)
+        return documents
+
     def remove_by_keys(self, keys):
         """Remove all documents whose key is in ``keys``.
 
@@ -1045,7 +2093,12 @@ class Collection(object):
             "collection": self.name,
             "keys": keys,
         }
-        res = self.api.put("/_api/simple/remove-by-keys", data=data)
+        try:
+            res = self.api.put("/_api/simple/remove-by-keys", data=data)
+        finally:
+            if self.cache is not None:
+                for key in keys:
+                    self.cache.invalidate(key)
         if res.status_code not in HTTP_OK:
             raise SimpleQueryDeleteByKeysError(res)
         return {
@@ -37,3 +37,9 @@ LOG_LEVELS = {
 
 # ArangoDB specific log sorting types
 LOG_SORTING_TYPES = {"asc", "desc"}
+
+# Load balancing strategies across multiple endpoints
+ENDPOINT_STRATEGIES = {"round_robin", "random", "least_outstanding"}
+
+# HTTP methods safe to send again to another endpoint after any failure
+IDEMPOTENT_METHODS = {"head", "get"}
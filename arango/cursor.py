@@ -1,33 +1,339 @@
 """ArangoDB Cursor."""
 
+from collections import deque
+from threading import Event, Thread
+try:
+    from queue import Queue, Full
+except ImportError:
+    from Queue import Queue, Full
+
 from arango.constants import HTTP_OK
 from arango.exceptions import (
     CursorGetNextError,
     CursorDeleteError,
 )
+from arango.utils import uncamelify
+
+
+def split_batch(content, serializer):
+    """Split a cursor batch into the raw JSON array of results and the rest.
+
+    The server writes the ``result`` attribute first, so the array can be
+    sliced out of the raw bytes without decoding the results. The body is
+    decoded in full (and the results encoded again) only if it is laid out
+    differently.
+
+    :param content: the raw response content of the batch
+    :type content: bytes or str
+    :param serializer: the JSON serializer
+    :type serializer: arango.serializers.BaseSerializer
+    :returns: the JSON array of results and the other attributes decoded
+    :rtype: tuple
+    """
+    if not isinstance(content, bytes):
+        content = content.encode("utf-8")
+    prefix = b'{"result":'
+    end = content.rfind(b'],"hasMore":')
+    if content.startswith(prefix) and end != -1:
+        try:
+            return (
+                content[len(prefix):end + 1],
+                serializer.loads(b"{" + content[end + 2:])
+            )
+        except ValueError:
+            pass
+    body = serializer.loads(content)
+    return serializer.encode(body.pop("result")), body
+
+# Whitespace allowed between the tokens of a JSON text
+JSON_WHITESPACE = (b" ", b"\n", b"\r", b"\t")
+
+
+def split_documents(array):
+    """Split a raw JSON array of objects into the raw JSON objects.
+
+    The array is cut at the ``},{`` separators which lie outside of any
+    string and nested value, without decoding the objects. The strings are
+    told apart by their quotes, so the array is not split (None is
+    returned) if it holds an escaped quote, or if it is not laid out
+    compactly as the server writes it.
+
+    :param array: the JSON array of objects
+    :type array: bytes
+    :returns: the JSON objects, or None if the array could not be split
+    :rtype: list or None
+    """
+    if array == b"[]":
+        return []
+    if (b'\\"' in array or not array.startswith(b"[{") or
+            not array.endswith(b"}]")):
+        return None
+    objects = []
+    current = None
+    for part in array[2:-2].split(b"},{"):
+        current = part if current is None else current + b"},{" + part
+        segments = current.split(b'"')
+        if not len(segments) % 2:
+            continue  # The separator is inside a string
+        outside = b"".join(segments[::2])
+        if (outside.count(b"{") == outside.count(b"}") and
+                outside.count(b"[") == outside.count(b"]")):
+            if any(space in outside for space in JSON_WHITESPACE):
+                return None  # The separators may hold whitespace too
+            objects.append(b"{" + current + b"}")
+            current = None
+    return None if current is not None else objects
+
 
+class BatchPrefetcher(object):
+    """Fetch the next batches of a server cursor in a background thread.
 
-def cursor(api, response):
-    """Continuously read from the server cursor and yield the result.
+    Up to ``depth`` batches are downloaded and decoded ahead of the
+    consumer, so the round trip for the next batch overlaps with the
+    processing of the current one.
 
     :param api: ArangoDB API wrapper object
     :type api: arango.api.API
-    :param response: ArangoDB response object
+    :param cursor_id: the ID of the server cursor
+    :type cursor_id: str
+    :param depth: the max number of batches fetched ahead
+    :type depth: int
+    :param raw: leave the results of the batches undecoded
+    :type raw: bool
+    """
+
+    def __init__(self, api, cursor_id, depth, raw=False):
+        self.api = api
+        self.cursor_id = cursor_id
+        self.raw = raw
+        self._queue = Queue(depth)
+        self._stopped = Event()
+        self._thread = Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self):
+        """Fetch the batches until the cursor is exhausted or stopped."""
+        while not self._stopped.is_set():
+            try:
+                response = self.api.put(
+                    "/_api/cursor/{}".format(self.cursor_id)
+                )
+                if response.status_code not in HTTP_OK:
+                    done = True
+                elif self.raw:
+                    done = not split_batch(
+                        response.raw_body, self.api.serializer
+                    )[1]["hasMore"]
+                else:
+                    # Decode the batch here rather than in the consumer
+                    done = not response.body["hasMore"]
+            except Exception as exception:
+                response = exception
+                done = True
+            while not self._stopped.is_set():
+                try:
+                    self._queue.put(response, timeout=0.1)
+                    break
+                except Full:
+                    continue
+            if done:
+                return
+
+    def next(self):
+        """Return the response of the next batch.
+
+        :returns: the ArangoDB response object
+        :rtype: arango.response.Response
+        :raises: Exception raised while fetching the batch
+        """
+        response = self._queue.get()
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def stop(self):
+        """Stop fetching batches ahead."""
+        self._stopped.set()
+
+
+class Cursor(object):
+    """ArangoDB cursor which iterates through the results of a query.
+
+    The server cursor is deleted when the cursor is closed explicitly, when
+    leaving the ``with`` block, or when the object is garbage collected, so
+    consumers which stop early do not leave it alive on the server until its
+    TTL expires. Exhausted cursors are freed by the server on its own.
+
+    :param api: ArangoDB API wrapper object
+    :type api: arango.api.API
+    :param response: ArangoDB response object holding the first batch
     :type response: arango.response.Response
-    :raises: CursorExecuteError, CursorDeleteError
+    :param prefetch: the number of batches to fetch ahead in a background
+        thread while the current one is consumed (0 to disable)
+    :type prefetch: int
     """
-    for item in response.body["result"]:
-        yield item
-    cursor_id = None
-    while response.body["hasMore"]:
-        if cursor_id is None:
-            cursor_id = response.body["id"]
-        response = api.put("/_api/cursor/{}".format(cursor_id))
+
+    def __init__(self, api, response, prefetch=0):
+        self.api = api
+        self.prefetch = prefetch
+        self.id = response.body.get("id")
+        self.count = response.body.get("count")
+        self.extra = response.body.get("extra", {})
+        self.closed = False
+        self._prefetcher = None
+        self._update(response)
+
+    def __repr__(self):
+        """Return a descriptive string of this instance."""
+        return "<ArangoDB cursor {}>".format(self.id)
+
+    def __iter__(self):
+        """Return this cursor as the iterator of its results."""
+        return self
+
+    def __next__(self):
+        """Return the next result, fetching the next batch if necessary.
+
+        :returns: the next result
+        :rtype: dict or object
+        :raises: StopIteration, CursorGetNextError
+        """
+        if not self.batch and self.has_more:
+            self._fetch()
+        if not self.batch:
+            raise StopIteration
+        return self.batch.popleft()
+
+    next = __next__  # Python 2
+
+    def __enter__(self):
+        """Return this cursor for use in a ``with`` block."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Delete the server cursor when leaving the ``with`` block."""
+        self.close()
+
+    def __del__(self):
+        """Delete the server cursor when garbage collected."""
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    @property
+    def stats(self):
+        """Return the query statistics (e.g. writes executed, scanned).
+
+        :returns: the query statistics or None if not available
+        :rtype: dict or None
+        """
+        stats = self.extra.get("stats")
+        return None if stats is None else uncamelify(stats)
+
+    @property
+    def full_count(self):
+        """Return the number of results before the last LIMIT of the query.
+
+        Only available if the query was executed with ``full_count`` set.
+
+        :returns: the full count or None if not available
+        :rtype: int or None
+        """
+        return self.extra.get("stats", {}).get("fullCount")
+
+    def _update(self, response):
+        """Store the batch and cursor state from the response.
+
+        :param response: ArangoDB response object
+        :type response: arango.response.Response
+        """
+        self.batch = deque(response.body["result"])
+        self.has_more = response.body["hasMore"]
+
+    def _next_response(self, raw=False):
+        """Return the response holding the next batch.
+
+        :param raw: the results of the batch are not going to be decoded
+        :type raw: bool
+        :returns: ArangoDB response object
+        :rtype: arango.response.Response
+        :raises: CursorGetNextError
+        """
+        if self.prefetch > 0 and self._prefetcher is None:
+            self._prefetcher = BatchPrefetcher(
+                self.api, self.id, self.prefetch, raw
+            )
+        if self._prefetcher is not None:
+            response = self._prefetcher.next()
+        else:
+            response = self.api.put("/_api/cursor/{}".format(self.id))
         if response.status_code not in HTTP_OK:
             raise CursorGetNextError(response)
-        for item in response.body["result"]:
-            yield item
-    if cursor_id is not None:
-        response = api.delete("/api/cursor/{}".format(cursor_id))
-        if response.status_code not in {404, 202}:
-            raise CursorDeleteError(response)
+        return response
+
+    def _fetch(self):
+        """Fetch the next batch from the server.
+
+        :raises: CursorGetNextError
+        """
+        self._update(self._next_response())
+        if not self.has_more and self._prefetcher is not None:
+            self._prefetcher.stop()
+
+    def iter_batches(self, raw=False):
+        """Yield the remaining results one batch at a time.
+
+        Each batch is yielded as a list, or with ``raw`` set, as the JSON
+        array of the results in UTF-8 bytes sliced straight out of the
+        response without decoding the results (e.g. to hand them over to a
+        writer or a dataframe library as is). The results of the current
+        batch not read yet come first.
+
+        :param raw: yield the batches as undecoded JSON arrays
+        :type raw: bool
+        :returns: the batches of results
+        :rtype: collections.Iterator
+        :raises: CursorGetNextError
+        """
+        if self.batch:
+            batch = list(self.batch)
+            self.batch.clear()
+            yield self.api.serializer.encode(batch) if raw else batch
+        while self.has_more:
+            if raw:
+                content, body = split_batch(
+                    self._next_response(raw).raw_body, self.api.serializer
+                )
+                self.has_more = body["hasMore"]
+                yield content
+            else:
+                self._fetch()
+                batch = list(self.batch)
+                self.batch.clear()
+                yield batch
+        if self._prefetcher is not None:
+            self._prefetcher.stop()
+
+    def close(self):
+        """Delete the server cursor unless it is exhausted already.
+
+        The results of the current batch can still be read after closing.
+
+        :returns: True if the server cursor was deleted, False otherwise
+        :rtype: bool
+        :raises: CursorDeleteError
+        """
+        if self._prefetcher is not None:
+            self._prefetcher.stop()
+        if self.closed:
+            return False
+        self.closed = True
+        if self.id is None or not self.has_more:
+            return False
+        self.has_more = False
+        res = self.api.delete("/_api/cursor/{}".format(self.id))
+        if res.status_code not in {200, 202, 404}:
+            raise CursorDeleteError(res)
+        return res.status_code != 404
@@ -1,13 +1,10 @@
 """ArangoDB Database."""
 
-import json
-import inspect
-
-
-from arango.utils import uncamelify, stringify_request
+from arango.batch import Batch, execute_requests, supports_batch
+from arango.utils import uncamelify
 from arango.graph import Graph
 from arango.collection import Collection
-from arango.cursor import cursor
+from arango.cursor import Cursor
 from arango.constants import HTTP_OK
 from arango.exceptions import *
 
@@ -42,14 +39,21 @@ class Database(object):
         return "<ArangoDB database '{}'>".format(self.name)
 
     def _refresh_collection_cache(self):
-        """Invalidate the collection cache."""
-        real_cols = set(self.collections["all"])
+        """Invalidate the collection cache.
+
+        The types of the collections are taken from the listing, so no
+        request is sent per collection.
+        """
+        real_cols = {
+            col["name"]: "edge" if col["type"] == 3 else "document"
+            for col in self._list_collections()
+        }
         cached_cols = set(self._collection_cache)
-        for col_name in cached_cols - real_cols:
+        for col_name in cached_cols - set(real_cols):
             del self._collection_cache[col_name]
-        for col_name in real_cols - cached_cols:
+        for col_name in set(real_cols) - cached_cols:
             self._collection_cache[col_name] = Collection(
-                name=col_name, api=self.api
+                name=col_name, api=self.api, type=real_cols[col_name]
             )
 
     def _refresh_graph_cache(self):
@@ -163,7 +167,7 @@ class Database(object):
 
     def execute_query(self, query, count=False, batch_size=None, ttl=None,
                       bind_vars=None, full_count=None, max_plans=None,
-                      optimizer_rules=None):
+                      optimizer_rules=None, prefetch=0):
         """Execute the AQL query and return the result.
 
         For more information on ``full_count`` please refer to:
@@ -184,7 +188,11 @@ class Database(object):
         :type max_plans: None or int
         :param optimizer_rules: list of optimizer rules
         :type optimizer_rules: list
+        :param prefetch: the number of batches to fetch ahead in the
+            background while the current one is consumed
+        :type prefetch: int
         :returns: the cursor from executing the query
+        :rtype: arango.cursor.Cursor
         :raises: AQLQueryExecuteError, CursorDeleteError
         """
         options = {}
@@ -211,12 +219,24 @@ class Database(object):
         res = self.api.post("/_api/cursor", data=data)
         if res.status_code not in HTTP_OK:
             raise AQLQueryExecuteError(res)
-        return cursor(self.api, res)
+        return Cursor(self.api, res, prefetch)
 
     #########################
     # Collection Management #
     #########################
 
+    def _list_collections(self):
+        """Return the descriptions of the collections in this database.
+
+        :returns: the name, type, status etc. of each collection
+        :rtype: list
+        :raises: CollectionListError
+        """
+        res = self.api.get("/_api/collection")
+        if res.status_code not in HTTP_OK:
+            raise CollectionListError(res)
+        return res.body["collections"]
+
     @property
     def collections(self):
         """Return the names of the collections in this database.
@@ -225,13 +245,9 @@ class Database(object):
         :rtype: dict
         :raises: CollectionListError
         """
-        res = self.api.get("/_api/collection")
-        if res.status_code not in HTTP_OK:
-            raise CollectionListError(res)
-
         user_collections = []
         system_collections = []
-        for collection in res.body["collections"]:
+        for collection in self._list_collections():
             if collection["isSystem"]:
                 system_collections.append(collection["name"])
             else:
@@ -395,15 +411,40 @@ class Database(object):
     # Batch Requests #
     ##################
 
-    def execute_batch(self, requests):
+    def execute_batch(self, requests, raise_errors=False, max_ops=None,
+                      max_bytes=None, workers=1):
         """Execute ArangoDB API calls in a batch.
 
-        :param requests: ArangoDB requests
+        The results are returned in the order of the requests. Read methods
+        (e.g. ``document``) give the same results as outside of a batch, and
+        the other methods give the response body. The result of a failed
+        request is the error the method raises (a BatchPartError if it has
+        none), with the ``content_id`` of the request (its 1-based position
+        in ``requests``) set, unless ``raise_errors`` is set, in which case
+        the first one is raised.
+
+        If ``max_ops`` or ``max_bytes`` is given, the requests are split into
+        sub-batches of at most that many requests or (encoded) bytes, which
+        are sent by ``workers`` threads at once. With a single worker, the
+        sub-batches are sent one after another, so the requests are executed
+        in their original order. With more workers, the sub-batches may be
+        executed in any order.
+
+        :param requests: ArangoDB requests as (method, args, kwargs) tuples
         :type requests: list
-        :raises: BatchInvalidError, BatchExecuteError
+        :param raise_errors: raise the error of the first failed request
+        :type raise_errors: bool
+        :param max_ops: the max number of requests per sub-batch
+        :type max_ops: int or None
+        :param max_bytes: the approximate max size of a sub-batch in bytes
+        :type max_bytes: int or None
+        :param workers: the number of sub-batches sent concurrently
+        :type workers: int
+        :returns: the results or the errors of the requests
+        :rtype: list
+        :raises: BatchInvalidError, BatchExecuteError, RequestError
         """
-
-        data = ""
+        batch = []
         for content_id, request in enumerate(requests, start=1):
             try:
                 func, args, kwargs = request
@@ -411,33 +452,33 @@ class Database(object):
                 raise BatchInvalidError(
                     "pos {}: malformed request".format(content_id)
                 )
-            if "_batch" not in inspect.getargspec(func)[0]:
+            if not supports_batch(func):
                 raise BatchInvalidError(
                     "pos {}: ArangoDB method '{}' does not support "
                     "batch execution".format(content_id, func.__name__)
                 )
-            kwargs["_batch"] = True
-            res = func(*args, **kwargs)
-            data += "--XXXsubpartXXX\r\n"
-            data += "Content-Type: application/x-arango-batchpart\r\n"
-            data += "Content-Id: {}\r\n\r\n".format(content_id)
-            data += "{}\r\n".format(stringify_request(**res))
-        data += "--XXXsubpartXXX--\r\n\r\n"
-        res = self.api.post(
-            "/_api/batch",
-            headers={
-                "Content-Type": "multipart/form-data; boundary=XXXsubpartXXX"
-            },
-            data=data,
+            batch.append(func(*args, **dict(kwargs, _batch=True)))
+        return execute_requests(
+            self.api, batch, raise_errors, max_ops, max_bytes, workers
         )
-        if res.status_code not in HTTP_OK:
-            raise BatchExecuteError(res)
-        if res.body is None:
-            return []
-        return [
-            json.loads(string) for string in res.body.split("\r\n") if
-            string.startswith("{") and string.endswith("}")
-        ]
+
+    def batch(self, max_ops=500, max_bytes=None):
+        """Return a batch which queues API calls into ``/_api/batch``.
+
+        Use it as a context manager, calling the batch-capable methods of
+        its collections and graphs. Every call returns a future result
+        (BatchJob), and the queued calls are sent automatically once the
+        batch is full and when leaving the ``with`` block.
+
+        :param max_ops: the max number of requests per batch
+        :type max_ops: int
+        :param max_bytes: the approximate max size of a batch in bytes
+        :type max_bytes: int or None
+        :returns: the batch
+        :rtype: arango.batch.Batch
+        :raises: InvalidArgumentError
+        """
+        return Batch(self, max_ops, max_bytes)
 
     #################
     # AQL Functions #
@@ -0,0 +1,260 @@
+"""Load balancing and failover across multiple ArangoDB endpoints."""
+
+import errno
+import random
+from threading import Lock, Thread
+from time import time
+
+from requests.exceptions import ConnectTimeout
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.packages.urllib3.exceptions import ConnectTimeoutError
+
+from arango.constants import ENDPOINT_STRATEGIES, HTTP_OK
+from arango.exceptions import EndpointUnavailableError, InvalidArgumentError
+
+
+def endpoint_url(host, protocol="http", port=8529):
+    """Return the base URL of an ArangoDB endpoint.
+
+    :param host: 'host', 'host:port', a full URL, or a (host, port) tuple
+    :type host: str or tuple
+    :param protocol: the protocol used if ``host`` does not specify one
+    :type protocol: str
+    :param port: the port used if ``host`` does not specify one
+    :type port: int or str
+    :returns: the base URL (e.g. 'http://localhost:8529')
+    :rtype: str
+    """
+    if isinstance(host, (tuple, list)):
+        host, port = host
+    elif "://" in host:
+        protocol, host = host.split("://", 1)
+        host = host.rstrip("/")
+    if ":" in host:
+        host, port = host.rsplit(":", 1)
+    return "{}://{}:{}".format(protocol, host, port)
+
+
+def is_connect_error(error):
+    """Return True if the request failed while connecting to the endpoint.
+
+    Such a request never reached the server, so it can be sent again to
+    another endpoint whatever its method.
+
+    :param error: the error raised by the HTTP client
+    :type error: IOError
+    :returns: whether or not the error happened before the request was sent
+    :rtype: bool
+    """
+    if isinstance(error, ConnectTimeout):
+        return True
+    if isinstance(error, RequestsConnectionError):
+        reason = getattr(error.args[0] if error.args else None, "reason", None)
+        return isinstance(reason, ConnectTimeoutError)
+    return getattr(error, "errno", None) in {
+        errno.ECONNREFUSED, errno.EHOSTUNREACH, errno.ENETUNREACH
+    }
+
+
+class Endpoint(object):
+    """A single ArangoDB endpoint (e.g. a cluster coordinator).
+
+    :param url: the base URL of the endpoint
+    :type url: str
+    """
+
+    def __init__(self, url):
+        self.url = url
+        self.available = True
+        self.outstanding = 0
+        self.failures = 0
+        self.retry_at = None
+
+    def __repr__(self):
+        """Return a descriptive string of this instance."""
+        return "<ArangoDB endpoint '{}'{}>".format(
+            self.url, "" if self.available else " (ejected)"
+        )
+
+
+class EndpointPool(object):
+    """Spread requests over multiple ArangoDB endpoints.
+
+    The supported strategies for picking the endpoint of each request are:
+
+    round_robin:       cycle through the available endpoints in order
+    random:            pick an available endpoint at random
+    least_outstanding: pick the endpoint with the fewest requests in flight
+
+    An endpoint whose connection fails is ejected from the pool, and the
+    request is retried on the next one. Only requests which failed while
+    connecting, or whose method is idempotent (GET and HEAD), are retried,
+    as any other request may have been applied by the server already.
+    Ejected endpoints are re-probed with ``HEAD /_api/version`` in a
+    background thread at most every ``probe_interval`` seconds, and are put
+    back into rotation as soon as the probe succeeds.
+
+    Only clients which return their responses synchronously are supported.
+
+    :param urls: the base URLs of the endpoints
+    :type urls: list
+    :param client: the HTTP client used to send the requests and probes
+    :type client: arango.clients.base.BaseClient
+    :param strategy: the load balancing strategy (default: 'round_robin')
+    :type strategy: str
+    :param probe_interval: seconds between probes of an ejected endpoint
+    :type probe_interval: int or float
+    :raises: InvalidArgumentError
+    """
+
+    def __init__(self, urls, client, strategy="round_robin",
+                 probe_interval=10):
+        if not urls:
+            raise InvalidArgumentError("at least one endpoint is required")
+        if strategy not in ENDPOINT_STRATEGIES:
+            raise InvalidArgumentError(
+                "invalid endpoint strategy '{}'".format(strategy)
+            )
+        self.endpoints = [Endpoint(url) for url in urls]
+        self.client = client
+        self.strategy = strategy
+        self.probe_interval = probe_interval
+        self._lock = Lock()
+        self._counter = 0
+
+    def __repr__(self):
+        """Return a descriptive string of this instance."""
+        return "<ArangoDB endpoint pool {}>".format(
+            [endpoint.url for endpoint in self.endpoints]
+        )
+
+    def __len__(self):
+        """Return the number of endpoints in this pool."""
+        return len(self.endpoints)
+
+    def probe(self, endpoint):
+        """Return True if the endpoint answers ``HEAD /_api/version``.
+
+        :param endpoint: the endpoint to probe
+        :type endpoint: arango.endpoints.Endpoint
+        :returns: True if the endpoint is healthy, False otherwise
+        :rtype: bool
+        """
+        try:
+            res = self.client.head(endpoint.url + "/_api/version")
+        except IOError:
+            return False
+        return res.status_code in HTTP_OK
+
+    def _reinstate(self, endpoint):
+        """Probe an ejected endpoint and put it back into rotation if healthy.
+
+        :param endpoint: the ejected endpoint
+        :type endpoint: arango.endpoints.Endpoint
+        """
+        if self.probe(endpoint):
+            with self._lock:
+                endpoint.available = True
+                endpoint.failures = 0
+                endpoint.retry_at = None
+
+    def _reprobe(self):
+        """Start probing the ejected endpoints which are due.
+
+        The probes run in background threads, so an unresponsive endpoint
+        does not hold up the requests sent meanwhile.
+        """
+        now = time()
+        with self._lock:
+            due = [
+                endpoint for endpoint in self.endpoints
+                if not endpoint.available and endpoint.retry_at <= now
+            ]
+            # Push back the next probe so that other threads skip these
+            for endpoint in due:
+                endpoint.retry_at = now + self.probe_interval
+        for endpoint in due:
+            thread = Thread(target=self._reinstate, args=(endpoint,))
+            thread.daemon = True
+            thread.start()
+
+    def acquire(self, exclude=()):
+        """Pick an endpoint for the next request and mark it in use.
+
+        :param exclude: endpoints which must not be picked
+        :type exclude: set or list or tuple
+        :returns: the endpoint to send the request to
+        :rtype: arango.endpoints.Endpoint
+        :raises: EndpointUnavailableError
+        """
+        self._reprobe()
+        with self._lock:
+            candidates = [
+                endpoint for endpoint in self.endpoints
+                if endpoint.available and endpoint not in exclude
+            ]
+            if not candidates:
+                raise EndpointUnavailableError(
+                    "no ArangoDB endpoint available out of {}".format(
+                        [endpoint.url for endpoint in self.endpoints]
+                    )
+                )
+            if self.strategy == "random":
+                endpoint = random.choice(candidates)
+            elif self.strategy == "least_outstanding":
+                endpoint = min(candidates, key=lambda e: e.outstanding)
+            else:
+                endpoint = candidates[self._counter % len(candidates)]
+                self._counter += 1
+            endpoint.outstanding += 1
+            return endpoint
+
+    def release(self, endpoint):
+        """Mark a request sent to the endpoint as finished.
+
+        :param endpoint: the endpoint the request was sent to
+        :type endpoint: arango.endpoints.Endpoint
+        """
+        with self._lock:
+            endpoint.outstanding -= 1
+
+    def eject(self, endpoint):
+        """Take the endpoint out of rotation until a probe succeeds.
+
+        :param endpoint: the endpoint which failed
+        :type endpoint: arango.endpoints.Endpoint
+        """
+        with self._lock:
+            endpoint.available = False
+            endpoint.failures += 1
+            endpoint.retry_at = time() + self.probe_interval
+
+    def send(self, request, retry=True, idempotent=False):
+        """Send a request to an endpoint, failing over on connection errors.
+
+        A request is sent again to another endpoint only if it failed while
+        connecting, or if it is idempotent (e.g. a read timing out).
+
+        :param request: callable sending the request to the given base URL
+        :type request: callable
+        :param retry: retry on the other endpoints if the connection fails
+            (must be False if the request cannot be sent twice)
+        :type retry: bool
+        :param idempotent: the request can be sent again after any failure
+        :type idempotent: bool
+        :returns: the ArangoDB http response
+        :rtype: arango.response.Response
+        :raises: EndpointUnavailableError, IOError
+        """
+        tried = set()
+        while True:
+            endpoint = self.acquire(exclude=tried)
+            try:
+                return request(endpoint.url)
+            except IOError as error:
+                self.eject(endpoint)
+                if not (retry and (idempotent or is_connect_error(error))):
+                    raise
+                tried.add(endpoint)
+            finally:
+                self.release(endpoint)
@@ -50,6 +50,10 @@ class InvalidArgumentError(Exception):
     """The given argument(s) are invalid."""
 
 
+class EndpointUnavailableError(Exception):
+    """None of the ArangoDB endpoints could be reached."""
+
+
 ###########################
 # Miscellaneous Functions #
 ###########################
@@ -219,6 +223,38 @@ class DocumentsImportError(RequestError):
     """Failed to bulk import documents/edges."""
 
 
+class DocumentRejectedError(Exception):
+    """The document was rejected by a bulk import.
+
+    :param message: the error message of the server
+    :type message: str
+    :param position: the position of the document in the input
+    :type position: int
+    """
+
+    def __init__(self, message, position):
+        super(DocumentRejectedError, self).__init__(message)
+        self.position = position
+
+
+class DocumentsInsertError(Exception):
+    """The bulk insert rejected documents at unknown positions.
+
+    :param results: the results of the documents placed (True for those
+        not known to be rejected)
+    :type results: list
+    :param details: the error details which could not be placed
+    :type details: list
+    """
+
+    def __init__(self, results, details):
+        super(DocumentsInsertError, self).__init__(
+            "documents were rejected at unknown positions"
+        )
+        self.results = results
+        self.details = details
+
+
 class DocumentsExportError(RequestError):
     """Failed to bulk export documents/edges."""
 
@@ -422,6 +458,14 @@ class SimpleQueryAllError(RequestError):
     """Failed to execute the `all`` simple query."""
 
 
+class SimpleQueryPaginateError(RequestError):
+    """Failed to fetch the page of documents."""
+
+
+class SimpleQueryScanError(RequestError):
+    """Failed to scan the range of documents."""
+
+
 class SimpleQueryAnyError(RequestError):
     """Failed to execute the ``any`` simple query."""
 
@@ -476,6 +520,20 @@ class BatchExecuteError(RequestError):
     """Failed to execute a batch request."""
 
 
+class BatchPartError(RequestError):
+    """A request in the batch failed.
+
+    :param response: the Response object of the failed request
+    :type response: arango.response.Response
+    :param content_id: the Content-Id of the failed request in the batch
+    :type content_id: int
+    """
+
+    def __init__(self, response, content_id=None):
+        super(BatchPartError, self).__init__(response)
+        self.content_id = content_id
+
+
 ####################
 # Graph Exceptions #
 ####################
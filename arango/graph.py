@@ -3,6 +3,7 @@
 from arango.utils import uncamelify
 from arango.exceptions import *
 from arango.constants import HTTP_OK
+from arango.serializers import raw_json
 
 
 class Graph(object):
@@ -225,7 +226,7 @@ class Graph(object):
     # Vertex Management #
     #####################
 
-    def get_vertex(self, vertex_id, rev=None):
+    def get_vertex(self, vertex_id, rev=None, _batch=False):
         """Return the vertex of the specified ID in this graph.
 
         If the vertex revision ``rev`` is specified, it must match against
@@ -239,17 +240,26 @@ class Graph(object):
         :rtype: dict or None
         :raises: VertexRevisionError, VertexGetError
         """
-        res = self.api.get(
-            "/_api/gharial/{}/vertex/{}".format(self.name, vertex_id),
-            params={"rev": rev} if rev is not None else {}
-        )
-        if res.status_code == 412:
-            raise VertexRevisionError(res)
-        elif res.status_code == 404:
-            return None
-        elif res.status_code not in HTTP_OK:
-            raise VertexGetError(res)
-        return res.body["vertex"]
+        path = "/_api/gharial/{}/vertex/{}".format(self.name, vertex_id)
+        params = {} if rev is None else {"rev": rev}
+
+        def handler(res):
+            if res.status_code == 412:
+                raise VertexRevisionError(res)
+            elif res.status_code == 404:
+                return None
+            elif res.status_code not in HTTP_OK:
+                raise VertexGetError(res)
+            return res.body["vertex"]
+
+        if _batch:
+            return {
+                "method": "get",
+                "path": path,
+                "params": params,
+                "handler": handler,
+            }
+        return handler(self.api.get(path, params=params))
 
     def create_vertex(self, collection, data, wait_for_sync=False,
                       _batch=False):
@@ -261,7 +271,7 @@ class Graph(object):
         :param collection: the name of the vertex collection
         :type collection: str
         :param data: the body of the new vertex
-        :type data: dict
+        :type data: dict or arango.serializers.RawJSON or bytes or str
         :param wait_for_sync: wait for the create to sync to disk
         :type wait_for_sync: bool
         :return: the id, rev and key of the new vertex
@@ -298,7 +308,7 @@ class Graph(object):
         :param vertex_id: the ID of the vertex to be updated
         :type vertex_id: str
         :param data: the body to update the vertex with
-        :type data: dict
+        :type data: dict or arango.serializers.RawJSON or bytes or str
         :param rev: the vertex revision must match this value
         :type rev: str or None
         :param keep_none: whether or not to keep the keys with value None
@@ -316,7 +326,7 @@ class Graph(object):
         }
         if rev is not None:
             params["rev"] = rev
-        elif "_rev" in data:
+        elif raw_json(data) is None and "_rev" in data:
             params["rev"] = data["_rev"]
         if _batch:
             return {
@@ -345,7 +355,7 @@ class Graph(object):
         :param vertex_id: the ID of the vertex to be replaced
         :type vertex_id: str
         :param data: the body to replace the vertex with
-        :type data: dict
+        :type data: dict or arango.serializers.RawJSON or bytes or str
         :param rev: the vertex revision must match this value
         :type rev: str or None
         :param wait_for_sync: wait for replace to sync to disk
@@ -358,7 +368,7 @@ class Graph(object):
         params = {"waitForSync": wait_for_sync}
         if rev is not None:
             params["rev"] = rev
-        if "_rev" in data:
+        if raw_json(data) is None and "_rev" in data:
             params["rev"] = data["_rev"]
         if _batch:
             return {
@@ -404,7 +414,7 @@ class Graph(object):
     # Edge Management #
     ###################
 
-    def get_edge(self, edge_id, rev=None):
+    def get_edge(self, edge_id, rev=None, _batch=False):
         """Return the edge of the specified ID in this graph.
 
         If the edge revision ``rev`` is specified, it must match against
@@ -418,17 +428,26 @@ class Graph(object):
         :rtype: dict or None
         :raises: EdgeRevisionError, EdgeGetError
         """
-        res = self.api.get(
-            "/_api/gharial/{}/edge/{}".format(self.name, edge_id),
-            params={} if rev is None else {"rev": rev}
-        )
-        if res.status_code == 412:
-            raise EdgeRevisionError(res)
-        elif res.status_code == 404:
-            return None
-        elif res.status_code not in HTTP_OK:
-            raise EdgeGetError(res)
-        return res.body["edge"]
+        path = "/_api/gharial/{}/edge/{}".format(self.name, edge_id)
+        params = {} if rev is None else {"rev": rev}
+
+        def handler(res):
+            if res.status_code == 412:
+                raise EdgeRevisionError(res)
+            elif res.status_code == 404:
+                return None
+            elif res.status_code not in HTTP_OK:
+                raise EdgeGetError(res)
+            return res.body["edge"]
+
+        if _batch:
+            return {
+                "method": "get",
+                "path": path,
+                "params": params,
+                "handler": handler,
+            }
+        return handler(self.api.get(path, params=params))
 
     def create_edge(self, collection, data, wait_for_sync=False, _batch=False):
         """Create an edge to the specified edge collection of this graph.
@@ -440,19 +459,20 @@ class Graph(object):
         :param collection: the name of the edge collection
         :type collection: str
         :param data: the body of the new edge
-        :type data: dict
+        :type data: dict or arango.serializers.RawJSON or bytes or str
         :param wait_for_sync: wait for the create to sync to disk
         :type wait_for_sync: bool
         :return: the id, rev and key of the new edge
         :rtype: dict
         :raises: DocumentInvalidError, EdgeCreateError
         """
-        if "_to" not in data:
-            raise DocumentInvalidError(
-                "the new edge data is missing the '_to' key")
-        if "_from" not in data:
-            raise DocumentInvalidError(
-                "the new edge data is missing the '_from' key")
+        if raw_json(data) is None:
+            if "_to" not in data:
+                raise DocumentInvalidError(
+                    "the new edge data is missing the '_to' key")
+            if "_from" not in data:
+                raise DocumentInvalidError(
+                    "the new edge data is missing the '_from' key")
         path = "/_api/gharial/{}/edge/{}".format(self.name, collection)
         params = {"waitForSync": wait_for_sync}
         if _batch:
@@ -486,7 +506,7 @@ class Graph(object):
         :param edge_id: the ID of the edge to be deleted
         :type edge_id: str
         :param data: the body to update the edge with
-        :type data: dict
+        :type data: dict or arango.serializers.RawJSON or bytes or str
         :param rev: the edge revision must match this value
         :type rev: str or None
         :param keep_none: whether or not to keep the keys with value None
@@ -504,7 +524,7 @@ class Graph(object):
         }
         if rev is not None:
             params["rev"] = rev
-        elif "_rev" in data:
+        elif raw_json(data) is None and "_rev" in data:
             params["rev"] = data["_rev"]
         if _batch:
             return {
@@ -536,7 +556,7 @@ class Graph(object):
         :param edge_id: the ID of the edge to be deleted
         :type edge_id: str
         :param data: the body to replace the edge with
-        :type data: dict
+        :type data: dict or arango.serializers.RawJSON or bytes or str
         :param rev: the edge revision must match this value
         :type rev: str or None
         :param wait_for_sync: wait for the replace to sync to disk
@@ -549,7 +569,7 @@ class Graph(object):
         params = {"waitForSync": wait_for_sync}
         if rev is not None:
             params["rev"] = rev
-        elif "_rev" in data:
+        elif raw_json(data) is None and "_rev" in data:
             params["rev"] = data["_rev"]
         if _batch:
             return {
@@ -0,0 +1,227 @@
+"""Multi-process import pipeline."""
+
+from collections import deque
+from multiprocessing import Pool, cpu_count
+from time import time
+
+from arango.collection import IMPORT_COUNTS, merge_import_result
+from arango.constants import HTTP_OK
+from arango.exceptions import DocumentsImportError, InvalidArgumentError
+from arango.utils import chunked, parallel_map
+
+
+def _rate(amount, seconds):
+    """Return the amount per second, or None if no time was measured."""
+    return amount / seconds if seconds else None
+
+
+def _transform_and_encode(task):
+    """Transform and encode a chunk of documents in a worker process.
+
+    :param task: the transform function (or None), the serializer, the
+        position of the first document in the input and the documents
+    :type task: tuple
+    :returns: the position of the first document in the input, the input
+        positions of the documents kept (None if all were kept), the JSON
+        lines, the number of documents in and out and the seconds spent on
+        the transform and on the encoding
+    :rtype: dict
+    """
+    transform, serializer, offset, documents = task
+    start = time()
+    size = len(documents)
+    positions = None
+    if transform is not None:
+        documents = [transform(document) for document in documents]
+        if any(document is None for document in documents):
+            positions = [
+                offset + index
+                for index, document in enumerate(documents)
+                if document is not None
+            ]
+            documents = [doc for doc in documents if doc is not None]
+    transformed_at = time()
+    data = b"\r\n".join(
+        serializer.encode_document(doc) for doc in documents
+    )
+    return {
+        "offset": offset,
+        "positions": positions,
+        "data": data,
+        "size": size,
+        "count": len(documents),
+        "transform_seconds": transformed_at - start,
+        "encode_seconds": time() - transformed_at
+    }
+
+
+def _position_mapper(chunk):
+    """Return the mapping of the positions in an import request to the input.
+
+    :param chunk: the result of ``_transform_and_encode`` for the request
+    :type chunk: dict
+    :returns: callable mapping the 1-based position of a line in the
+        request to the position of its document in the input, skipping the
+        documents dropped by the transform
+    :rtype: callable
+    """
+    if chunk["positions"] is None:
+        return lambda index: chunk["offset"] + index - 1
+    return lambda index: chunk["positions"][index - 1]
+
+
+class ParallelImporter(object):
+    """Import documents through a transform running in worker processes.
+
+    The input is split into chunks which a pool of ``processes`` transforms
+    (with the user function) and encodes into JSON lines, so neither step
+    is bound to the one core of the calling process. The encoded chunks
+    are handed back and uploaded to the import API by ``uploaders``
+    threads sharing the connection pool of the collection. At most twice
+    ``processes`` chunks are in the pool at a time, so the input may be a
+    generator of any length.
+
+    The transform must be picklable (a function defined at the top level
+    of a module) and may return None to drop a document. On platforms
+    starting the workers with spawn (e.g. Windows), the import must run
+    under ``if __name__ == "__main__":``.
+
+    :param collection: the collection to import into
+    :type collection: arango.collection.Collection
+    :param transform: the function applied to each document, or None
+    :type transform: callable or None
+    :param processes: the number of worker processes (defaults to the
+        number of CPUs)
+    :type processes: int or None
+    :param uploaders: the number of concurrent uploads
+    :type uploaders: int
+    :param chunk_size: the max number of documents per request
+    :type chunk_size: int
+    :param complete: a chunk fails entirely if any document is invalid
+    :type complete: bool
+    :param details: return details about invalid documents
+    :type details: bool
+    :raises: InvalidArgumentError
+    """
+
+    def __init__(self, collection, transform=None, processes=None,
+                 uploaders=4, chunk_size=1000, complete=True, details=True):
+        if transform is not None and not callable(transform):
+            raise InvalidArgumentError("The transform must be callable.")
+        self.collection = collection
+        self.transform = transform
+        self.processes = processes
+        self.uploaders = uploaders
+        self.chunk_size = chunk_size
+        self.complete = complete
+        self.details = details
+
+    def __repr__(self):
+        """Return a descriptive string of this instance."""
+        return "<ArangoDB parallel importer for '{}'>".format(
+            self.collection.name
+        )
+
+    def _encoded_chunks(self, pool, documents):
+        """Yield the chunks as they are transformed and encoded by the pool.
+
+        :param pool: the pool of worker processes
+        :type pool: multiprocessing.pool.Pool
+        :param documents: the documents to import
+        :type documents: collections.Iterable
+        :returns: the results of ``_transform_and_encode`` in input order
+        :rtype: collections.Iterator
+        """
+        serializer = self.collection.api.serializer
+        window = 2 * (self.processes or cpu_count())
+        pending = deque()
+        offset = 0
+        for chunk in chunked(documents, self.chunk_size):
+            pending.append(pool.apply_async(
+                _transform_and_encode,
+                ((self.transform, serializer, offset, chunk),)
+            ))
+            offset += len(chunk)
+            if len(pending) >= window:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+
+    def run(self, documents):
+        """Import the documents.
+
+        The results of the chunks are merged as with ``import_bulk``, the
+        ``position`` in the error details referring to the input, plus the
+        number of input ``documents``, the number ``dropped`` by the
+        transform and the throughput ``stats`` of the run and of each
+        stage. The seconds of a stage are summed over its workers, so its
+        throughput is that of a single worker (e.g. a transform much slower
+        than the upload calls for more processes).
+
+        :param documents: the documents to import
+        :type documents: collections.Iterable
+        :returns: the merged import results and the stats
+        :rtype: dict
+        :raises: DocumentsImportError
+        """
+        api = self.collection.api
+        params = {
+            "type": "documents",
+            "collection": self.collection.name,
+            "complete": self.complete,
+            "details": self.details
+        }
+
+        def upload(chunk):
+            if not chunk["count"]:
+                return chunk, {}, 0
+            start = time()
+            res = api.post("/_api/import", data=chunk["data"], params=params)
+            if res.status_code not in HTTP_OK:
+                raise DocumentsImportError(res)
+            return chunk, res.body, time() - start
+
+        result = dict.fromkeys(IMPORT_COUNTS, 0)
+        if self.details:
+            result["details"] = []
+        busy = dict.fromkeys(("transform", "encode", "upload"), 0)
+        size = count = encoded = 0
+        start = time()
+        pool = Pool(self.processes)
+        try:
+            chunks = self._encoded_chunks(pool, documents)
+            for chunk, body, seconds in parallel_map(
+                    upload, chunks, self.uploaders):
+                size += chunk["size"]
+                count += chunk["count"]
+                encoded += len(chunk["data"])
+                busy["transform"] += chunk["transform_seconds"]
+                busy["encode"] += chunk["encode_seconds"]
+                busy["upload"] += seconds
+                merge_import_result(result, body, _position_mapper(chunk))
+            pool.close()
+        finally:
+            pool.terminate()
+        seconds = time() - start
+        result["documents"] = size
+        result["dropped"] = size - count
+        result["stats"] = {
+            "seconds": seconds,
+            "documents_per_second": _rate(size, seconds),
+            "bytes_per_second": _rate(encoded, seconds),
+            "transform": {
+                "seconds": busy["transform"],
+                "documents_per_second": _rate(size, busy["transform"])
+            },
+            "encode": {
+                "seconds": busy["encode"],
+                "documents_per_second": _rate(count, busy["encode"]),
+                "bytes_per_second": _rate(encoded, busy["encode"])
+            },
+            "upload": {
+                "seconds": busy["upload"],
+                "documents_per_second": _rate(count, busy["upload"]),
+                "bytes_per_second": _rate(encoded, busy["upload"])
+            }
+        }
+        return result
@@ -1,6 +1,6 @@
 """ArangoDB HTTP response."""
 
-from json import loads
+from json import loads as json_loads
 
 
 class Response(object):
@@ -8,26 +8,72 @@ class Response(object):
 
     The clients in arango.clients must return an instance of this class.
 
+    The response content is kept as is in ``raw_body``, and only decoded into
+    ``body`` (using ``loads``) the first time it is accessed. Callers which
+    only look at the status code (e.g. existence checks) never pay for the
+    JSON decoding.
+
     :param method: the HTTP method
     :type method: str
     :param url: the request URL
     :type url: str
     :param status_code: the HTTP status code
     :type status_code: int
-    :param content: the HTTP response content
-    :type content: basestring or str
+    :param content: the HTTP response content (preferably the raw bytes)
+    :type content: bytes or basestring or str
     :param status_text: the HTTP status description if any
     :type status_text: str or None
+    :param loads: the JSON deserializer (default: json.loads)
+    :type loads: callable or None
     """
 
     def __init__(self, method, url, status_code, content, headers,
-                 status_text=None):
+                 status_text=None, loads=None):
         self.method = method
         self.url = url
         self.status_code = status_code
         self.headers = headers
         self.status_text = status_text
+        self.raw_body = content
+        self.loads = loads
+        self._body = None
+        self._decoded = False
+
+    @property
+    def body(self):
+        """Return the decoded JSON content, or None if it is not JSON.
+
+        :returns: the decoded response content
+        :rtype: dict or list or str or int or float or bool or None
+        """
+        if not self._decoded:
+            self._body = self._decode(self.raw_body, self.loads or json_loads)
+            self._decoded = True
+        return self._body
+
+    @body.setter
+    def body(self, value):
+        """Replace the decoded JSON content."""
+        self._body = value
+        self._decoded = True
+
+    @staticmethod
+    def _decode(content, loads):
+        """Decode the JSON content straight from the raw bytes.
+
+        :param content: the HTTP response content
+        :type content: bytes or basestring or str
+        :param loads: the JSON deserializer
+        :type loads: callable
+        :returns: the decoded content or None if it is empty or invalid
+        :rtype: dict or list or str or int or float or bool or None
+        """
+        if not content:
+            return None
         try:
-            self.body = loads(content) if content else None
+            return loads(content)
+        except TypeError:
+            # Python 3.5 and below only decode JSON from text
+            return Response._decode(content.decode("utf-8"), loads)
         except ValueError:
-            self.body = None
+            return None
@@ -0,0 +1,229 @@
+"""JSON serializers for the ArangoDB request and response payloads."""
+
+import json
+from abc import ABCMeta, abstractmethod
+
+from arango.exceptions import DocumentInvalidError, InvalidArgumentError
+from arango.utils import is_string
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import rapidjson
+except ImportError:
+    rapidjson = None
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+class BaseSerializer(object):
+    """Base class for the JSON serializers."""
+
+    __metaclass__ = ABCMeta
+
+    name = None
+
+    def __repr__(self):
+        """Return a descriptive string of this instance."""
+        return "<ArangoDB JSON serializer '{}'>".format(self.name)
+
+    @abstractmethod
+    def dumps(self, obj):
+        """Serialize the object into a JSON string.
+
+        :param obj: the object to serialize
+        :type obj: object
+        :returns: the JSON string
+        :rtype: str
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def loads(self, data):
+        """Deserialize the JSON string or UTF-8 bytes into an object.
+
+        :param data: the JSON string or bytes
+        :type data: str or bytes
+        :returns: the deserialized object
+        :rtype: object
+        """
+        raise NotImplementedError
+
+    def encode(self, obj):
+        """Serialize the object into UTF-8 encoded JSON bytes.
+
+        :param obj: the object to serialize
+        :type obj: object
+        :returns: the JSON bytes
+        :rtype: bytes
+        """
+        return self.dumps(obj).encode("utf-8")
+
+    def encode_document(self, document):
+        """Serialize the document unless it is serialized already.
+
+        The document is written as a JSON line, so its JSON must not hold
+        any line breaks (e.g. pretty-printed JSON).
+
+        :param document: the document, or its JSON (see ``raw_json``)
+        :type document: dict or arango.serializers.RawJSON or bytes or str
+        :returns: the JSON bytes
+        :rtype: bytes
+        :raises: DocumentInvalidError
+        """
+        raw = raw_json(document)
+        if raw is None:
+            return self.encode(document)
+        if b"\n" in raw or b"\r" in raw:
+            raise DocumentInvalidError(
+                "the serialized document must not contain line breaks")
+        return raw
+
+
+class RawJSON(object):
+    """A payload serialized into JSON already (e.g. consumed from a queue).
+
+    The document write methods send it as it is in place of a document,
+    saving a decode and encode round trip on the client.
+
+    :param data: the JSON text
+    :type data: bytes or str
+    """
+
+    def __init__(self, data):
+        self.data = data if isinstance(data, bytes) else data.encode("utf-8")
+
+    def __repr__(self):
+        """Return a descriptive string of this instance."""
+        return "<ArangoDB raw JSON of {} bytes>".format(len(self.data))
+
+
+def raw_json(obj):
+    """Return the JSON of a payload serialized already.
+
+    RawJSON objects, bytes and strings are taken as serialized JSON.
+
+    :param obj: the payload
+    :type obj: object
+    :returns: the UTF-8 JSON bytes, or None if the payload is an object to
+        serialize
+    :rtype: bytes or None
+    """
+    if isinstance(obj, RawJSON):
+        return obj.data
+    elif isinstance(obj, bytes):
+        return obj
+    elif is_string(obj):
+        return obj.encode("utf-8")
+    return None
+
+
+class JSONSerializer(BaseSerializer):
+    """Serializer using the json module from the standard library."""
+
+    name = "json"
+
+    def dumps(self, obj):
+        return json.dumps(obj)
+
+    def loads(self, data):
+        try:
+            return json.loads(data)
+        except TypeError:
+            # Python 3.5 and below only decode JSON from text
+            return json.loads(data.decode("utf-8"))
+
+
+class OrjsonSerializer(BaseSerializer):
+    """Serializer using the orjson library."""
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("orjson is not installed")
+
+    def dumps(self, obj):
+        return orjson.dumps(obj).decode("utf-8")
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+    def encode(self, obj):
+        return orjson.dumps(obj)
+
+
+class RapidjsonSerializer(BaseSerializer):
+    """Serializer using the python-rapidjson library."""
+
+    name = "rapidjson"
+
+    def __init__(self):
+        if rapidjson is None:
+            raise ImportError("python-rapidjson is not installed")
+
+    def dumps(self, obj):
+        return rapidjson.dumps(obj)
+
+    def loads(self, data):
+        return rapidjson.loads(data)
+
+
+class UjsonSerializer(BaseSerializer):
+    """Serializer using the ujson library."""
+
+    name = "ujson"
+
+    def __init__(self):
+        if ujson is None:
+            raise ImportError("ujson is not installed")
+
+    def dumps(self, obj):
+        return ujson.dumps(obj, escape_forward_slashes=False)
+
+    def loads(self, data):
+        return ujson.loads(data)
+
+
+# The serializers in order of preference (fastest first)
+SERIALIZERS = [
+    ("orjson", OrjsonSerializer),
+    ("rapidjson", RapidjsonSerializer),
+    ("ujson", UjsonSerializer),
+    ("json", JSONSerializer),
+]
+
+
+def get_serializer(serializer=None):
+    """Return the serializer object for the given name.
+
+    The name 'auto' picks the fastest JSON library installed, falling back
+    to the standard library. None returns the standard library serializer,
+    and serializer objects are returned as is.
+
+    :param serializer: the serializer name or object
+    :type serializer: str or arango.serializers.BaseSerializer or None
+    :returns: the serializer object
+    :rtype: arango.serializers.BaseSerializer
+    :raises: InvalidArgumentError, ImportError
+    """
+    if serializer is None:
+        return JSONSerializer()
+    elif isinstance(serializer, BaseSerializer):
+        return serializer
+    elif serializer == "auto":
+        for _, serializer_class in SERIALIZERS:
+            try:
+                return serializer_class()
+            except ImportError:
+                continue
+    for name, serializer_class in SERIALIZERS:
+        if name == serializer:
+            return serializer_class()
+    raise InvalidArgumentError(
+        "unknown JSON serializer '{}'".format(serializer)
+    )
@@ -0,0 +1,193 @@
+"""Request bodies streamed or split into chunks for bulk uploads."""
+
+import csv
+import io
+import mmap
+
+
+class JSONLinesStream(object):
+    """Request body which streams documents as JSON lines.
+
+    Iterating over the stream serializes the documents one by one and
+    yields UTF-8 encoded chunks of roughly ``chunk_size`` bytes. The HTTP
+    client sends it with chunked transfer encoding, so only one chunk is
+    held in memory regardless of the number of documents.
+
+    :param documents: the documents to stream (any iterable or generator)
+    :type documents: collections.Iterable
+    :param encode: callable serializing a document into UTF-8 JSON bytes
+    :type encode: callable
+    :param chunk_size: the approximate size of the chunks in bytes
+    :type chunk_size: int
+    """
+
+    def __init__(self, documents, encode, chunk_size=65536):
+        self.documents = documents
+        self.encode = encode
+        self.chunk_size = chunk_size
+
+    def __repr__(self):
+        """Return a descriptive string of this instance."""
+        return "<ArangoDB JSON lines stream>"
+
+    @property
+    def replayable(self):
+        """Return True if the body can be sent again (e.g. on failover).
+
+        Only documents in a container (e.g. a list) can be iterated over
+        more than once, iterators and generators are consumed when sent.
+
+        :returns: whether or not the body can be sent again
+        :rtype: bool
+        """
+        return iter(self.documents) is not self.documents
+
+    def __iter__(self):
+        """Yield the JSON lines in chunks of about ``chunk_size`` bytes.
+
+        :returns: the UTF-8 encoded chunks of the request body
+        :rtype: collections.Iterator
+        """
+        separator = b""
+        lines = []
+        size = 0
+        for document in self.documents:
+            line = self.encode(document)
+            lines.append(line)
+            size += len(line) + 2
+            if size >= self.chunk_size:
+                yield separator + b"\r\n".join(lines)
+                separator = b"\r\n"
+                lines = []
+                size = 0
+        if lines:
+            yield separator + b"\r\n".join(lines)
+
+
+def json_lines_chunks(documents, encode, max_count=1000, max_bytes=None):
+    """Split the documents into JSON lines bodies of bounded size.
+
+    :param documents: the documents to split (any iterable or generator)
+    :type documents: collections.Iterable
+    :param encode: callable serializing a document into UTF-8 JSON bytes
+    :type encode: callable
+    :param max_count: the max number of documents per chunk
+    :type max_count: int
+    :param max_bytes: the approximate max size of a chunk in bytes
+    :type max_bytes: int or None
+    :returns: the position of the first document of each chunk in the
+        input, the number of documents in the chunk and its JSON lines
+    :rtype: collections.Iterator
+    """
+    offset = 0
+    lines = []
+    size = 0
+    for document in documents:
+        line = encode(document)
+        lines.append(line)
+        size += len(line) + 2
+        if len(lines) >= max_count or (max_bytes and size >= max_bytes):
+            yield offset, len(lines), b"\r\n".join(lines)
+            offset += len(lines)
+            lines = []
+            size = 0
+    if lines:
+        yield offset, len(lines), b"\r\n".join(lines)
+
+
+def file_line_chunks(path, chunk_bytes=1048576):
+    """Split a file into chunks of whole lines without decoding them.
+
+    The file is memory-mapped and cut at the last line break before each
+    ``chunk_bytes`` boundary (or after the first line if it is longer), so
+    the chunks are copied straight out of the page cache.
+
+    :param path: the path of the file
+    :type path: str
+    :param chunk_bytes: the max size of a chunk in bytes (unless a single
+        line is longer)
+    :type chunk_bytes: int
+    :returns: the 0-based line number of the first line of each chunk, the
+        number of lines in the chunk and its bytes
+    :rtype: collections.Iterator
+    """
+    with open(path, "rb") as source:
+        source.seek(0, io.SEEK_END)
+        size = source.tell()
+        if size == 0:
+            return
+        mapped = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            line = 0
+            start = 0
+            while start < size:
+                end = start + chunk_bytes
+                if end >= size:
+                    end = size
+                else:
+                    cut = mapped.rfind(b"\n", start, end)
+                    if cut == -1:
+                        cut = mapped.find(b"\n", end)
+                    end = size if cut == -1 else cut + 1
+                chunk = mapped[start:end]
+                count = chunk.count(b"\n") + (not chunk.endswith(b"\n"))
+                yield line, count, chunk
+                line += count
+                start = end
+        finally:
+            mapped.close()
+
+
+def csv_chunks(path, encode, chunk_bytes=1048576, encoding="utf-8",
+               **fmtparams):
+    """Convert a CSV file into chunks of JSON arrays, one record per line.
+
+    Each chunk starts with the header record, the layout the import API
+    expects when no ``type`` is given. The values are left as strings.
+
+    :param path: the path of the CSV file (with a header record)
+    :type path: str
+    :param encode: callable serializing a list into UTF-8 JSON bytes
+    :type encode: callable
+    :param chunk_bytes: the approximate max size of a chunk in bytes
+    :type chunk_bytes: int
+    :param encoding: the encoding of the file (ASCII-compatible on Python
+        2, e.g. UTF-8 or Latin-1)
+    :type encoding: str
+    :param fmtparams: the formatting parameters of the csv module (e.g.
+        delimiter)
+    :returns: the 0-based record number (the header being 0) preceding the
+        first record of each chunk, the number of records in the chunk and
+        its bytes
+    :rtype: collections.Iterator
+    """
+    if str is bytes:
+        # The csv module of Python 2 only reads bytes, so the fields are
+        # decoded one by one (the encoding must be ASCII-compatible)
+        source = open(path, "rb")
+        records = (
+            [field.decode(encoding) for field in record]
+            for record in csv.reader(source, **fmtparams)
+        )
+    else:
+        source = io.open(path, "r", newline="", encoding=encoding)
+        records = csv.reader(source, **fmtparams)
+    with source:
+        try:
+            header = encode(next(records))
+        except StopIteration:
+            return
+        offset = 0
+        lines = [header]
+        size = len(header)
+        for record in records:
+            line = encode(record)
+            lines.append(line)
+            size += len(line) + 2
+            if size >= chunk_bytes:
+                yield offset, len(lines) - 1, b"\r\n".join(lines)
+                offset += len(lines) - 1
+                lines = [header]
+                size = len(header)
+        if len(lines) > 1:
+            yield offset, len(lines) - 1, b"\r\n".join(lines)
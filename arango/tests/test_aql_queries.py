@@ -1,5 +1,6 @@
 """Tests for ArangoDB AQL queries."""
 
+import json
 import unittest
 
 from arango import Arango
@@ -102,6 +103,62 @@ class ArangoDBQueryTest(unittest.TestCase):
             ["doc01"]
         )
 
+    def test_execute_query_prefetch(self):
+        collection = self.db.collection(self.col_name)
+        collection.import_documents([{"value": i} for i in range(100)])
+        res = self.db.execute_query(
+            "FOR d IN {} SORT d.value RETURN d.value".format(self.col_name),
+            batch_size=7,
+            prefetch=3
+        )
+        self.assertEqual(list(res), list(range(100)))
+
+    def test_cursor(self):
+        collection = self.db.collection(self.col_name)
+        collection.import_documents([{"value": i} for i in range(10)])
+        query = "FOR d IN {} LIMIT 5 RETURN d.value".format(self.col_name)
+        cursor = self.db.execute_query(
+            query, count=True, batch_size=2, full_count=True
+        )
+        self.assertIsNotNone(cursor.id)
+        self.assertTrue(cursor.has_more)
+        self.assertEqual(cursor.count, 5)
+        self.assertEqual(cursor.full_count, 10)
+        self.assertIn("scanned_full", cursor.stats)
+        next(cursor)
+        self.assertTrue(cursor.close())
+        self.assertFalse(cursor.close())
+        self.assertFalse(cursor.has_more)
+
+        # The server cursor is deleted when leaving the with block
+        with self.db.execute_query(query, batch_size=2) as cursor:
+            next(cursor)
+        self.assertTrue(cursor.closed)
+
+        # Exhausted cursors have nothing left to delete
+        cursor = self.db.execute_query(query, batch_size=2)
+        self.assertEqual(len(list(cursor)), 5)
+        self.assertFalse(cursor.close())
+
+    def test_cursor_iter_batches(self):
+        collection = self.db.collection(self.col_name)
+        collection.import_documents([{"value": i} for i in range(10)])
+        query = "FOR d IN {} SORT d.value RETURN d.value".format(
+            self.col_name
+        )
+        cursor = self.db.execute_query(query, batch_size=4)
+        self.assertEqual(
+            list(cursor.iter_batches()),
+            [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+        )
+        cursor = self.db.execute_query(query, batch_size=4)
+        self.assertEqual(next(cursor), 0)
+        self.assertEqual(
+            [json.loads(batch.decode("utf-8"))
+             for batch in cursor.iter_batches(raw=True)],
+            [[1, 2, 3], [4, 5, 6, 7], [8, 9]]
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,106 @@
+"""Tests for the asyncio ArangoDB wrappers."""
+
+import sys
+import unittest
+
+# The asyncio wrappers need Python 3.5+ (kept parsable by Python 2 so the
+# module is skipped rather than failing to import)
+if sys.version_info < (3, 5):
+    raise unittest.SkipTest("the asyncio wrappers need Python 3.5+")
+
+import asyncio
+
+from arango import Arango
+from arango.aio import AsyncArango
+from arango.exceptions import (
+    CollectionNotFoundError,
+)
+from arango.tests.utils import (
+    generate_col_name,
+    generate_db_name,
+)
+
+
+class AsyncArangoTest(unittest.TestCase):
+    """Tests for the asyncio ArangoDB wrappers."""
+
+    def setUp(self):
+        self.arango = Arango()
+        self.db_name = generate_db_name(self.arango)
+        self.db = self.arango.create_database(self.db_name)
+        self.col_name = generate_col_name(self.db)
+        self.col = self.db.create_collection(self.col_name)
+        self.loop = asyncio.new_event_loop()
+        self.async_arango = AsyncArango()
+
+        # Test database cleanup
+        self.addCleanup(self.arango.delete_database,
+                        name=self.db_name, safe_delete=True)
+        self.addCleanup(self.loop.close)
+        self.addCleanup(self._run, self.async_arango.close())
+
+    def _run(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def test_verify(self):
+        self._run(self.async_arango.verify())
+
+    def test_collection(self):
+        async_db = self.async_arango.db(self.db_name)
+        async_col = self._run(async_db.collection(self.col_name))
+        self.assertEqual(async_col.name, self.col_name)
+        self.assertEqual(async_col.type, "document")
+        self.assertRaises(
+            CollectionNotFoundError,
+            self._run,
+            async_db.collection("no_such_collection")
+        )
+
+    def test_create_document(self):
+        async_db = self.async_arango.db(self.db_name)
+        async_col = self._run(async_db.collection(self.col_name))
+        self._run(async_col.create_document({"_key": "doc01", "value": 1}))
+        self.assertEqual(self.col.document("doc01")["value"], 1)
+        doc = self._run(async_col.document("doc01"))
+        self.assertEqual(doc["value"], 1)
+        self.assertIsNone(self._run(async_col.document("doc02")))
+
+    def test_concurrent_documents(self):
+        self.col.import_documents(
+            [{"_key": "doc{:02d}".format(i), "value": i} for i in range(20)]
+        )
+        async_db = self.async_arango.db(self.db_name)
+        async_col = self._run(async_db.collection(self.col_name))
+        docs = self._run(asyncio.gather(*[
+            async_col.document("doc{:02d}".format(i)) for i in range(20)
+        ]))
+        self.assertEqual([doc["value"] for doc in docs], list(range(20)))
+
+    def test_import_documents(self):
+        async_db = self.async_arango.db(self.db_name)
+        async_col = self._run(async_db.collection(self.col_name))
+        res = self._run(async_col.import_documents(
+            [{"_key": "doc01"}, {"_key": "doc02"}]
+        ))
+        self.assertEqual(res["created"], 2)
+        self.assertEqual(len(self.col), 2)
+
+    def test_execute_query(self):
+        self.col.import_documents([{"value": i} for i in range(10)])
+        async_db = self.async_arango.db(self.db_name)
+
+        cursor = self._run(async_db.execute_query(
+            "FOR d IN {} SORT d.value RETURN d.value".format(self.col_name),
+            batch_size=3
+        ))
+        values = []
+        while True:
+            try:
+                values.append(self._run(cursor.__anext__()))
+            except StopAsyncIteration:
+                break
+        self.assertEqual(values, list(range(10)))
+
+
+if __name__ == "__main__":
+    unittest.main()
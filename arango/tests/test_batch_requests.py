@@ -2,6 +2,7 @@
 
 import unittest
 from arango import Arango
+from arango.exceptions import BatchExecuteError, BatchPartError
 from arango.tests.utils import (
     generate_db_name,
     generate_col_name,
@@ -148,6 +149,126 @@ class BatchRequestTest(unittest.TestCase):
         self.assertEqual(self.col.document("doc04")["value"], 1)
         self.assertEqual(self.col.document("doc05")["value"], 5)
 
+    def test_batch_results(self):
+        self.col.import_documents([{"_key": "doc01", "value": 1}])
+        results = self.db.execute_batch([
+            (self.col.create_document, [{"_key": "doc02"}], {}),
+            (self.col.delete_document, ["no_such_doc"], {}),
+            (self.col.update_document, ["doc01", {"value": 2}], {}),
+        ])
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0]["_key"], "doc02")
+        self.assertIsInstance(results[1], BatchPartError)
+        self.assertEqual(results[1].http_code, 404)
+        self.assertEqual(results[1].content_id, 2)
+        self.assertEqual(results[2]["_key"], "doc01")
+        self.assertEqual(self.col.document("doc01")["value"], 2)
+        self.assertRaises(
+            BatchPartError,
+            self.db.execute_batch,
+            [(self.col.delete_document, ["no_such_doc"], {})],
+            raise_errors=True
+        )
+
+    def test_batch_split(self):
+        requests = [
+            (self.col.create_document, [{"_key": "doc{:03d}".format(i)}], {})
+            for i in range(100)
+        ]
+        results = self.db.execute_batch(requests, max_ops=15, workers=4)
+        self.assertEqual(
+            [result["_key"] for result in results],
+            ["doc{:03d}".format(i) for i in range(100)]
+        )
+        self.assertEqual(len(self.col), 100)
+
+        # Sub-batches sent by one worker are executed in order
+        requests = [
+            (self.col.update_document, ["doc000", {"value": i}], {})
+            for i in range(20)
+        ]
+        self.db.execute_batch(requests, max_bytes=1000)
+        self.assertEqual(self.col.document("doc000")["value"], 19)
+
+    def test_batch_reads(self):
+        self.col.import_documents([
+            {"_key": "doc01", "value": 1},
+            {"_key": "doc02", "value": 2},
+        ])
+        self.vertex_col.import_documents([{"_key": "v01", "value": 3}])
+        results = self.db.execute_batch([
+            (self.col.document, ["doc01"], {}),
+            (self.col.document, ["no_such_doc"], {}),
+            (self.col.has_document, ["doc02"], {}),
+            (self.col.has_document, ["no_such_doc"], {}),
+            (self.col.count, [], {}),
+            (
+                self.graph.get_vertex,
+                ["{}/{}".format(self.vertex_col_name, "v01")],
+                {}
+            ),
+            (
+                self.graph.get_edge,
+                ["{}/{}".format(self.edge_col_name, "no_such_edge")],
+                {}
+            ),
+        ])
+        self.assertEqual(results[0]["value"], 1)
+        self.assertIsNone(results[1])
+        self.assertTrue(results[2])
+        self.assertFalse(results[3])
+        self.assertEqual(results[4], 2)
+        self.assertEqual(results[5]["value"], 3)
+        self.assertIsNone(results[6])
+
+    def test_batch_context_manager(self):
+        with self.db.batch(max_ops=4) as batch:
+            col = batch.collection(self.col_name)
+            jobs = [
+                col.create_document({"_key": "doc{:02d}".format(i)})
+                for i in range(10)
+            ]
+            missing = col.delete_document("no_such_doc")
+            self.assertTrue(jobs[0].done)
+            self.assertFalse(jobs[9].done)
+        self.assertTrue(jobs[9].done)
+        self.assertEqual(len(self.col), 10)
+        self.assertEqual(jobs[9].result()["_key"], "doc09")
+        self.assertIsNone(jobs[9].exception())
+        self.assertRaises(BatchPartError, missing.result)
+
+        # Pending jobs are sent when their result is requested
+        batch = self.db.batch()
+        job = batch.graph(self.graph_name).create_vertex(
+            self.vertex_col_name, {"_key": "v01"}
+        )
+        self.assertEqual(len(batch), 1)
+        self.assertEqual(job.result()["_key"], "v01")
+        self.assertEqual(len(batch), 0)
+
+    def test_batch_send_failure(self):
+        batch = self.db.batch()
+        job = batch.collection(self.col_name).create_document({"_key": "a"})
+        # The batch request fails once the database is gone
+        self.arango.delete_database(self.db_name)
+        self.assertRaises(BatchExecuteError, batch.flush)
+        self.assertTrue(job.done)
+        self.assertIsInstance(job.exception(), BatchExecuteError)
+        self.assertRaises(BatchExecuteError, job.result)
+        self.assertEqual(batch.flush(), 0)
+
+    def test_batch_discarded_on_error(self):
+        try:
+            with self.db.batch() as batch:
+                job = batch.collection(self.col_name).create_document(
+                    {"_key": "doc01"}
+                )
+                raise ValueError("abandon the batch")
+        except ValueError:
+            self.assertRaises(BatchExecuteError, job.result)
+        self.assertEqual(len(batch), 0)
+        self.assertEqual(len(self.col), 0)
+
     def test_batch_vertex_create(self):
         self.db.execute_batch([
             (
@@ -108,6 +108,27 @@ class CollectionManagementTest(unittest.TestCase):
         self.assertTrue(col.wait_for_sync)
         self.assertEqual(col.journal_size, 8884208)
 
+    def test_collection_type_and_properties_cache(self):
+        col_name = generate_col_name(self.db)
+        self.db.create_collection(col_name, is_edge=True)
+        col = self.db.collection(col_name)
+        # The type comes from the collection listing
+        self.assertEqual(col.type, "edge")
+        # The properties are served from the cache within the TTL
+        col.properties_ttl = 60
+        properties = col.refresh()
+        self.assertTrue(properties["is_edge"])
+        self.db.api.put(
+            "/_api/collection/{}/properties".format(col_name),
+            data={"waitForSync": True}
+        )
+        self.assertFalse(col.wait_for_sync)
+        self.assertTrue(col.refresh()["wait_for_sync"])
+        self.assertTrue(col.wait_for_sync)
+        # Updates through the collection invalidate the cache
+        col.wait_for_sync = False
+        self.assertFalse(col.wait_for_sync)
+
     def test_collection_load_unload(self):
         col = self.db.create_collection(generate_col_name(self.db))
         self.assertIn(col.unload(), {"unloaded", "unloading"})
@@ -0,0 +1,66 @@
+"""Tests for the ArangoDB HTTP connections."""
+
+import unittest
+
+from arango import Arango
+from arango.exceptions import (
+    EndpointUnavailableError,
+    InvalidArgumentError,
+)
+
+
+class ConnectionTest(unittest.TestCase):
+    """Tests for the ArangoDB HTTP connections."""
+
+    def test_connection_reuse(self):
+        arango = Arango(pool_connections=2, pool_maxsize=2, pool_block=True)
+        for _ in range(10):
+            arango.version
+        stats = arango.client.connection_stats
+        self.assertEqual(stats["requests"], 11)
+        self.assertEqual(stats["opened"], 1)
+        self.assertEqual(stats["reused"], 10)
+
+    def test_connection_no_keep_alive(self):
+        arango = Arango(keep_alive=False)
+        for _ in range(3):
+            arango.version
+        stats = arango.client.connection_stats
+        self.assertEqual(stats["requests"], 4)
+        self.assertEqual(stats["opened"], 4)
+        self.assertEqual(stats["reused"], 0)
+
+    def test_multiple_hosts(self):
+        arango = Arango(
+            hosts=["localhost:8529", "http://127.0.0.1:8529"],
+            strategy="least_outstanding"
+        )
+        self.assertEqual(len(arango.endpoints), 2)
+        self.assertIn("server-version", arango.version)
+        for endpoint in arango.endpoints.endpoints:
+            self.assertTrue(endpoint.available)
+            self.assertEqual(endpoint.outstanding, 0)
+
+    def test_multiple_hosts_failover(self):
+        arango = Arango(hosts=["localhost:8529", "localhost:1"])
+        for _ in range(4):
+            arango.version
+        available = [e.available for e in arango.endpoints.endpoints]
+        self.assertEqual(available, [True, False])
+
+    def test_multiple_hosts_unavailable(self):
+        self.assertRaises(
+            EndpointUnavailableError,
+            Arango,
+            hosts=["localhost:1", "localhost:2"]
+        )
+        self.assertRaises(
+            InvalidArgumentError,
+            Arango,
+            hosts=["localhost:8529"],
+            strategy="no_such_strategy"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
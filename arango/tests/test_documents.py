@@ -1,10 +1,21 @@
 """Tests for ArangoDB Document Management."""
 
+import gzip
+import io
+import json
+import os
+import tempfile
 import unittest
 
 from arango import Arango
+from arango.collection import read_checkpoint
+from arango.importer import ParallelImporter
+from arango.serializers import RawJSON
 from arango.exceptions import (
+    BatchPartError,
     DocumentDeleteError,
+    DocumentInvalidError,
+    DocumentRejectedError,
     DocumentReplaceError,
     DocumentUpdateError,
     DocumentsImportError,
@@ -15,6 +26,13 @@ from arango.tests.utils import (
 )
 
 
+def double_value(document):
+    """Transform for the parallel import test (dropping odd values)."""
+    if document["value"] % 2:
+        return None
+    return dict(document, value=document["value"] * 2)
+
+
 class DocumentManagementTest(unittest.TestCase):
     """Tests for ArangoDB document management."""
 
@@ -35,6 +53,17 @@ class DocumentManagementTest(unittest.TestCase):
         self.assertEqual(len(self.col), 1)
         self.assertIn("test_doc", self.col)
 
+    def test_create_document_raw_json(self):
+        self.col.create_document(RawJSON(b'{"_key": "raw", "value": 1}'))
+        self.col.create_document('{"_key": "text", "value": 2}')
+        self.col.update_document("raw", b'{"value": 3}')
+        self.assertEqual(self.col.document("raw")["value"], 3)
+        self.assertEqual(self.col.document("text")["value"], 2)
+        res = self.col.import_documents(
+            [{"_key": "dict"}, b'{"_key": "bytes"}', RawJSON('{"_key": "r"}')]
+        )
+        self.assertEqual(res["created"], 3)
+
     def test_delete_document(self):
         rev = self.col.create_document({"_key": "test_doc"})["_rev"]
         self.assertEqual(len(self.col), 1)
@@ -94,6 +123,43 @@ class DocumentManagementTest(unittest.TestCase):
         self.col.truncate()
         self.assertEqual(len(self.col), 0)
 
+    def test_document_cache(self):
+        self.col.create_document({"_key": "test_doc", "value": 1})
+        cache = self.col.enable_cache(max_size=10)
+        self.assertEqual(self.col.document("test_doc")["value"], 1)
+        self.assertEqual(self.col.document("test_doc")["value"], 1)
+        self.assertEqual(cache.stats["misses"], 1)
+        self.assertEqual(cache.stats["hits"], 1)
+        self.assertEqual(cache.stats["revalidations"], 1)
+
+        # Own writes invalidate the cached document
+        self.col.update_document("test_doc", {"value": 2})
+        self.assertNotIn("test_doc", cache)
+        self.assertEqual(self.col.document("test_doc")["value"], 2)
+        self.col.delete_document("test_doc")
+        self.assertIsNone(self.col.document("test_doc"))
+        self.assertEqual(cache.stats["misses"], 3)
+
+        # Batched writes invalidate the document once they are executed
+        self.col.create_document({"_key": "batch_doc", "value": 1})
+        with self.db.batch() as batch:
+            batch.collection(self.col_name).update_document(
+                "batch_doc", {"value": 2}
+            )
+            self.assertEqual(self.col.document("batch_doc")["value"], 1)
+        self.assertNotIn("batch_doc", cache)
+        self.assertEqual(self.col.document("batch_doc")["value"], 2)
+
+        # Imports overwriting documents clear the cache
+        self.col.create_document({"_key": "test_doc", "value": 3})
+        self.assertEqual(self.col.document("test_doc")["value"], 3)
+        self.col.import_bulk(
+            [{"_key": "test_doc", "value": 4}], on_duplicate="update"
+        )
+        self.assertNotIn("test_doc", cache)
+        self.assertEqual(self.col.document("test_doc")["value"], 4)
+        self.col.disable_cache()
+
     def test_import_documents(self):
         documents = [
             {"_key": "test_doc_01"},
@@ -123,9 +189,177 @@ class DocumentManagementTest(unittest.TestCase):
         self.assertEqual(res["errors"], 0)
         self.assertEqual(res["created"], 2)
 
+    def test_import_documents_stream(self):
+        documents = (
+            {"_key": "test_doc_{:04d}".format(i), "value": i}
+            for i in range(1000)
+        )
+        res = self.col.import_documents(documents, chunk_size=1024)
+        self.assertEqual(res["created"], 1000)
+        self.assertEqual(len(self.col), 1000)
+        self.assertEqual(self.col.document("test_doc_0999")["value"], 999)
+
+    def test_import_bulk(self):
+        documents = [{"_key": "test_doc_{:04d}".format(i)} for i in range(500)]
+        documents[123] = {"_key": 1}  # invalid key
+        documents[456] = {"_key": 2}  # invalid key
+        res = self.col.import_bulk(
+            iter(documents), chunk_size=50, workers=4, complete=False
+        )
+        self.assertEqual(res["created"], 498)
+        self.assertEqual(res["errors"], 2)
+        self.assertEqual(len(self.col), 498)
+        self.assertEqual(
+            [detail["position"] for detail in res["details"]], [123, 456]
+        )
+
+    def test_import_bulk_checkpoint(self):
+        handle, checkpoint = tempfile.mkstemp()
+        os.close(handle)
+        self.addCleanup(os.remove, checkpoint)
+        documents = [{"_key": "doc{:03d}".format(i)} for i in range(300)]
+
+        def failing():
+            for document in documents[:250]:
+                yield document
+            raise IOError("interrupted")
+
+        self.assertRaises(
+            IOError, self.col.import_bulk, failing(), chunk_size=50,
+            workers=1, checkpoint=checkpoint
+        )
+        self.assertEqual(len(self.col), 250)
+        res = self.col.import_bulk(
+            iter(documents), chunk_size=50, workers=2, checkpoint=checkpoint
+        )
+        self.assertEqual(res["resumed_from"], 250)
+        self.assertEqual(res["errors"], 0)
+        self.assertEqual(len(self.col), 300)
+        self.assertEqual(read_checkpoint(checkpoint), 300)
+
+    def test_bulk_write_many(self):
+        documents = [{"_key": "doc{:03d}".format(i)} for i in range(100)]
+        documents[42] = {"_key": 1}  # invalid key
+        res = self.col.insert_many(iter(documents), chunk_size=30, workers=2)
+        self.assertEqual(len(res), 100)
+        self.assertIsInstance(res[42], DocumentRejectedError)
+        self.assertEqual(res[42].position, 42)
+        self.assertEqual(res.count(True), 99)
+
+        res = self.col.update_many(
+            [{"_key": "doc000", "value": 1}, {"_key": "missing"}],
+            chunk_size=1
+        )
+        self.assertEqual(res[0]["_key"], "doc000")
+        self.assertNotIn("error", res[0])
+        self.assertIsInstance(res[1], BatchPartError)
+        self.assertEqual(self.col.document("doc000")["value"], 1)
+        self.assertRaises(
+            DocumentInvalidError, self.col.update_many, [("doc000",)]
+        )
+
+        res = self.col.replace_many([("doc001", b'{"value": 2}')])
+        self.assertEqual(res[0]["_key"], "doc001")
+        self.assertEqual(self.col.document("doc001")["value"], 2)
+
+        res = self.col.delete_many(
+            ["doc{:03d}".format(i) for i in range(50)], chunk_size=20
+        )
+        self.assertEqual(res, {"removed": 49, "ignored": 1})
+        res = self.col.delete_many(["doc050", "doc042"], details=True)
+        self.assertEqual(res[0]["_key"], "doc050")
+        self.assertIsInstance(res[1], BatchPartError)
+        self.assertEqual(len(self.col), 49)
+
+    def test_import_file(self):
+        handle, path = tempfile.mkstemp()
+        self.addCleanup(os.remove, path)
+        with os.fdopen(handle, "w") as output:
+            for i in range(300):
+                key = 1 if i == 123 else "doc{:03d}".format(i)
+                output.write(json.dumps({"_key": key, "value": i}) + "\n")
+        res = self.col.import_file(
+            path, chunk_bytes=1024, workers=4, complete=False
+        )
+        self.assertEqual(res["created"], 299)
+        self.assertEqual(
+            [detail["position"] for detail in res["details"]], [123]
+        )
+        self.col.truncate()
+        with open(path, "w") as output:
+            output.write("_key,value\n")
+            for i in range(300):
+                output.write("csv{:03d},{}\n".format(i, i))
+        res = self.col.import_file(path, format="csv", chunk_bytes=1024)
+        self.assertEqual(res["created"], 300)
+        self.assertEqual(self.col.document("csv042")["value"], "42")
+
+        # The position of a bad record counts the header as record 0
+        self.col.truncate()
+        with io.open(path, "w", encoding="utf-8") as output:
+            output.write(u"_key,value\n")
+            for i in range(300):
+                key = u"bad/key" if i == 200 else u"csv{:03d}".format(i)
+                output.write(u"{},caf\u00e9 {}\n".format(key, i))
+        res = self.col.import_file(
+            path, format="csv", chunk_bytes=1024, complete=False
+        )
+        self.assertEqual(res["created"], 299)
+        self.assertEqual(
+            [detail["position"] for detail in res["details"]], [201]
+        )
+        self.assertEqual(
+            self.col.document("csv042")["value"], u"caf\u00e9 42"
+        )
+
+    def test_parallel_importer(self):
+        documents = [
+            {"_key": "doc{:03d}".format(i), "value": i} for i in range(300)
+        ]
+        documents[100]["_key"] = 1  # invalid key
+        importer = ParallelImporter(
+            self.col, transform=double_value, processes=2, uploaders=2,
+            chunk_size=40, complete=False
+        )
+        res = importer.run(iter(documents))
+        self.assertEqual(res["documents"], 300)
+        self.assertEqual(res["dropped"], 150)
+        self.assertEqual(res["created"], 149)
+        self.assertEqual(
+            [detail["position"] for detail in res["details"]], [100]
+        )
+        self.assertEqual(self.col.document("doc042")["value"], 84)
+        self.assertIn("upload", res["stats"])
+
     def test_export_documents(self):
         pass
 
+    def test_export_to_file(self):
+        documents = [
+            {"_key": "doc{:03d}".format(i), "tags": [{"id": i}], "s": "},{"}
+            for i in range(250)
+        ]
+        documents[200]["s"] = '"quoted"'  # exported decoded and re-encoded
+        self.col.import_documents(documents)
+        output = io.BytesIO()
+        res = self.col.export_to_file(
+            output, batch_size=100, compress="gzip"
+        )
+        self.assertEqual(res["documents"], 250)
+        self.assertGreater(res["bytes"], 0)
+        with gzip.GzipFile(fileobj=io.BytesIO(output.getvalue())) as lines:
+            exported = [json.loads(line.decode("utf-8")) for line in lines]
+        self.assertEqual(
+            sorted((doc["_key"], doc["tags"], doc["s"]) for doc in exported),
+            [(doc["_key"], doc["tags"], doc["s"]) for doc in documents]
+        )
+        output = io.BytesIO()
+        res = self.col.export_to_file(
+            output, batch_size=100, per_line="batch"
+        )
+        self.assertEqual(res["documents"], 250)
+        self.assertEqual(len(output.getvalue().splitlines()), 3)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,39 @@
+"""Tests for the ArangoDB HTTP responses."""
+
+import unittest
+
+from arango.response import Response
+
+
+class ResponseTest(unittest.TestCase):
+    """Tests for the ArangoDB HTTP responses."""
+
+    def test_lazy_body(self):
+        res = Response(
+            method="get",
+            url="http://localhost:8529/_api/version",
+            status_code=200,
+            content=b'{"version": "2.7.0"}',
+            headers={},
+        )
+        self.assertFalse(res._decoded)
+        self.assertEqual(res.raw_body, b'{"version": "2.7.0"}')
+        self.assertEqual(res.body, {"version": "2.7.0"})
+        self.assertTrue(res._decoded)
+        res.body["server"] = "arango"
+        self.assertEqual(res.body["server"], "arango")
+
+    def test_empty_or_invalid_body(self):
+        for content in (b"", None, b"not json", "not json"):
+            res = Response(
+                method="head",
+                url="http://localhost:8529/_api/version",
+                status_code=200,
+                content=content,
+                headers={},
+            )
+            self.assertIsNone(res.body)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""Tests for the JSON serializers."""
+
+import unittest
+
+from arango.batch import encode_part
+from arango.exceptions import DocumentInvalidError, InvalidArgumentError
+from arango.response import Response
+from arango.serializers import (
+    SERIALIZERS,
+    JSONSerializer,
+    RawJSON,
+    get_serializer,
+    raw_json,
+)
+
+DOCUMENT = {
+    "_key": "doc01",
+    "value": 1,
+    "nested": {"list": [1, 2.5, None, True], "text": u"café / bar"},
+}
+
+
+class SerializersTest(unittest.TestCase):
+    """Tests for the JSON serializers."""
+
+    def installed_serializers(self):
+        serializers = []
+        for _, serializer_class in SERIALIZERS:
+            try:
+                serializers.append(serializer_class())
+            except ImportError:
+                continue
+        return serializers
+
+    def test_round_trip(self):
+        for serializer in self.installed_serializers():
+            self.assertEqual(
+                serializer.loads(serializer.dumps(DOCUMENT)), DOCUMENT
+            )
+            self.assertEqual(
+                serializer.loads(serializer.encode(DOCUMENT)), DOCUMENT
+            )
+            self.assertIsInstance(serializer.encode(DOCUMENT), bytes)
+
+    def test_get_serializer(self):
+        self.assertIsInstance(get_serializer(), JSONSerializer)
+        self.assertIsInstance(get_serializer("json"), JSONSerializer)
+        self.assertEqual(
+            get_serializer("auto").name, self.installed_serializers()[0].name
+        )
+        serializer = JSONSerializer()
+        self.assertIs(get_serializer(serializer), serializer)
+        self.assertRaises(InvalidArgumentError, get_serializer, "no_such")
+
+    def test_response_loads(self):
+        for serializer in self.installed_serializers():
+            res = Response(
+                method="get",
+                url="http://localhost:8529/_api/version",
+                status_code=200,
+                content=serializer.encode(DOCUMENT),
+                headers={},
+                loads=serializer.loads
+            )
+            self.assertEqual(res.body, DOCUMENT)
+
+    def test_raw_json(self):
+        self.assertEqual(raw_json(RawJSON(u'{"a": "caf\u00e9"}')),
+                         u'{"a": "caf\u00e9"}'.encode("utf-8"))
+        self.assertEqual(raw_json(b'{"a": 1}'), b'{"a": 1}')
+        self.assertEqual(raw_json(u'{"a": 1}'), b'{"a": 1}')
+        self.assertIsNone(raw_json(DOCUMENT))
+        for serializer in self.installed_serializers():
+            self.assertEqual(
+                serializer.encode_document(RawJSON(b'{"a":1}')), b'{"a":1}'
+            )
+            self.assertEqual(
+                serializer.loads(serializer.encode_document(DOCUMENT)),
+                DOCUMENT
+            )
+            # The document would span several JSON lines
+            self.assertRaises(
+                DocumentInvalidError,
+                serializer.encode_document,
+                b'{\n  "a": 1\n}'
+            )
+
+    def test_raw_json_batch_part(self):
+        part = encode_part(
+            1,
+            {"method": "post", "path": "/_api/document",
+             "data": RawJSON(b'{"_key":"a"}')},
+            "XXX",
+            JSONSerializer().dumps
+        )
+        self.assertTrue(part.endswith(b'\r\n\r\n{"_key":"a"}\r\n'))
+
+
+if __name__ == "__main__":
+    unittest.main()
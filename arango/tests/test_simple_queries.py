@@ -241,6 +241,74 @@ class SimpleQueriesTest(unittest.TestCase):
         )
         self.assertEqual(len(self.col), 6)
 
+    def test_get_many(self):
+        self.col.import_documents([
+            {"_key": "key{:02d}".format(i), "value": i} for i in range(20)
+        ])
+        keys = ["key05", "no_such_key", "key01", "key19", "key05", "key00"]
+        documents = self.col.get_many(keys, chunk_size=2, workers=3)
+        self.assertEqual(
+            [None if doc is None else doc["value"] for doc in documents],
+            [5, None, 1, 19, 5, 0]
+        )
+
+    def test_paginate(self):
+        self.col.import_documents([
+            {"_key": "key{:02d}".format(i), "value": i % 3, "odd": i % 2}
+            for i in range(20)
+        ])
+        for attribute, example in [("_key", None), ("value", {"odd": 1})]:
+            documents, token = [], None
+            while True:
+                page = self.col.paginate(
+                    limit=3, token=token, attribute=attribute,
+                    example=example
+                )
+                self.assertLessEqual(len(page["documents"]), 3)
+                documents.extend(page["documents"])
+                token = page["token"]
+                if token is None:
+                    break
+            expected = sorted(
+                (doc for doc in self.col.all()
+                 if example is None or doc["odd"] == 1),
+                key=lambda doc: (doc[attribute], doc["_key"])
+            )
+            self.assertEqual(
+                [doc["_key"] for doc in documents],
+                [doc["_key"] for doc in expected]
+            )
+
+    def test_scan(self):
+        self.col.import_documents([
+            {"_key": "key{:03d}".format(i), "value": i % 10}
+            for i in range(200)
+        ])
+        keys = sorted(doc["_key"] for doc in self.col.all())
+        documents = self.col.scan(partitions=4, batch_size=7)
+        self.assertEqual(sorted(doc["_key"] for doc in documents), keys)
+        ranges = self.col.scan(partitions=3, attribute="value", merge=False)
+        self.assertEqual(
+            sorted(doc["_key"] for docs in ranges for doc in docs),
+            keys
+        )
+
+    def test_scan_mixed_case_keys(self):
+        # AQL sorts "a3" before "B5" while Python sorts it after
+        self.col.import_documents([
+            {"_key": "{}{}".format(prefix, i), "value": value}
+            for i in range(50)
+            for prefix, value in (("a", i), ("B", "v{}".format(i)))
+        ])
+        keys = sorted(doc["_key"] for doc in self.col.all())
+        scanned = [doc["_key"] for doc in self.col.scan(partitions=5)]
+        self.assertEqual(len(scanned), len(set(scanned)))
+        self.assertEqual(sorted(scanned), keys)
+        # The values mix numbers and strings
+        documents = self.col.scan(partitions=5, attribute="value")
+        scanned = [doc["_key"] for doc in documents]
+        self.assertEqual(sorted(scanned), keys)
+
     def test_remove_by_keys(self):
         self.col.import_documents([
             {"_key": "key01", "value": 1},
@@ -1,6 +1,9 @@
 """Utility Functions."""
 
 import importlib
+from collections import deque
+from multiprocessing.pool import ThreadPool
+from threading import Event, Thread
 from re import sub
 from json import dumps
 from collections import Mapping, Iterable
@@ -8,6 +11,10 @@ try:
     urllib = importlib.import_module('urllib.parse')
 except ImportError:
     urllib = importlib.import_module('urllib')
+try:
+    from queue import Queue, Full
+except ImportError:
+    from Queue import Queue, Full
 try:
     builtins = importlib.import_module('__builtin__')
 except ImportError:
@@ -26,6 +33,23 @@ def is_string(obj):
     return isinstance(obj, base_str) if base_str else isinstance(obj, str)
 
 
+def is_stream(obj):
+    """Return True iff ``obj`` is an iterable to stream as a request body.
+
+    Strings, bytes, mappings, lists and tuples are sent as a whole.
+
+    :param obj: the object to check
+    :type obj: object
+    :returns: True iff ``obj`` is to be streamed
+    :rtype: bool
+    """
+    return (
+        isinstance(obj, Iterable) and
+        not is_string(obj) and
+        not isinstance(obj, (bytes, Mapping, list, tuple))
+    )
+
+
 def unicode_to_str(obj):
     """Convert any unicode in ``obj`` to str and return it.
 
@@ -98,7 +122,8 @@ def filter_keys(dictionary, filtered):
     return {k: v for k, v in dictionary.items() if k not in filtered}
 
 
-def stringify_request(method, path, params=None, headers=None, data=None):
+def stringify_request(method, path, params=None, headers=None, data=None,
+                      dumps=dumps):
     """Stringify the HTTP request into a string for batch requests.
 
     :param method: the HTTP method
@@ -111,6 +136,8 @@ def stringify_request(method, path, params=None, headers=None, data=None):
     :type headers: dict or None
     :param data: the request payload
     :type data: dict or None
+    :param dumps: the JSON serializer for the payload
+    :type dumps: callable
     :returns: the stringified request
     :rtype: str
     """
@@ -125,3 +152,116 @@ def stringify_request(method, path, params=None, headers=None, data=None):
     if data:
         request_string += "\r\n\r\n{}".format(dumps(data))
     return request_string
+
+
+def chunked(iterable, size):
+    """Split the items into lists of at most ``size`` items.
+
+    :param iterable: the items
+    :type iterable: collections.Iterable
+    :param size: the max number of items per list
+    :type size: int
+    :returns: the lists of items in their original order
+    :rtype: collections.Iterator
+    """
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def parallel_map(func, iterable, workers=1):
+    """Apply ``func`` to each item using a pool of threads.
+
+    The results are yielded in the order of the items. The iterable is
+    consumed lazily, with at most twice ``workers`` items in flight, so it
+    may be a generator over more items than fit in memory. With a single
+    worker, the items are processed one by one in the calling thread.
+
+    :param func: the function to apply to each item
+    :type func: callable
+    :param iterable: the items
+    :type iterable: collections.Iterable
+    :param workers: the number of threads
+    :type workers: int
+    :returns: the results in the order of the items
+    :rtype: collections.Iterator
+    """
+    if workers <= 1:
+        for item in iterable:
+            yield func(item)
+        return
+    pool = ThreadPool(workers)
+    try:
+        pending = deque()
+        for item in iterable:
+            pending.append(pool.apply_async(func, (item,)))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+    finally:
+        pool.terminate()
+
+
+def interleave(iterators, buffer_size=None):
+    """Consume each iterator in its own thread and yield the items merged.
+
+    The items are yielded in the order they are produced, so the items of
+    one iterator keep their order but are mixed with those of the others.
+    At most ``buffer_size`` items are held waiting for the consumer. If the
+    consumer stops early, the threads stop and close their iterators.
+
+    :param iterators: the iterators to consume
+    :type iterators: list
+    :param buffer_size: the max number of items produced ahead (defaults to
+        twice the number of iterators)
+    :type buffer_size: int or None
+    :returns: the items of all iterators
+    :rtype: collections.Iterator
+    :raises: Exception raised by any of the iterators
+    """
+    queue = Queue(buffer_size or 2 * len(iterators))
+    stopped = Event()
+
+    def put(message):
+        while not stopped.is_set():
+            try:
+                queue.put(message, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def consume(iterator):
+        try:
+            for item in iterator:
+                if not put((True, item)):
+                    return
+            put((False, None))
+        except Exception as exception:
+            put((False, exception))
+        finally:
+            if hasattr(iterator, "close"):
+                iterator.close()
+
+    for iterator in iterators:
+        thread = Thread(target=consume, args=(iter(iterator),))
+        thread.daemon = True
+        thread.start()
+    try:
+        remaining = len(iterators)
+        while remaining:
+            is_item, value = queue.get()
+            if is_item:
+                yield value
+            elif value is None:
+                remaining -= 1
+            else:
+                raise value
+    finally:
+        stopped.set()
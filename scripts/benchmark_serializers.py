@@ -0,0 +1,59 @@
+"""Compare the JSON serializers on typical ArangoDB document shapes.
+
+Usage: python scripts/benchmark_serializers.py [iterations]
+"""
+
+from __future__ import print_function
+
+import sys
+from timeit import timeit
+
+from arango.serializers import SERIALIZERS
+
+FLAT = {
+    "_key": "12345", "_id": "users/12345", "_rev": "1234567890",
+    "name": "John Doe", "age": 42, "active": True, "score": 3.14,
+}
+NESTED = {
+    "_key": "67890",
+    "profile": {"address": {"city": "Cologne", "zip": "50667"},
+                "tags": ["a", "b", "c"], "scores": list(range(20))},
+    "friends": [{"_id": "users/{}".format(i), "since": 2000 + i}
+                for i in range(10)],
+}
+LONG_TEXT = {"_key": "text", "body": u"Lorem ipsum dolor sit amet é " * 500}
+BATCH = [dict(FLAT, _key=str(i)) for i in range(1000)]
+
+SHAPES = [
+    ("flat", FLAT),
+    ("nested", NESTED),
+    ("long text", LONG_TEXT),
+    ("batch of 1000", BATCH),
+]
+
+
+def main(iterations):
+    serializers = []
+    for name, serializer_class in SERIALIZERS:
+        try:
+            serializers.append(serializer_class())
+        except ImportError:
+            print("{}: not installed".format(name))
+
+    for shape_name, obj in SHAPES:
+        print("\n{} ({} iterations)".format(shape_name, iterations))
+        for serializer in serializers:
+            encoded = serializer.encode(obj)
+            dumps_time = timeit(lambda: serializer.encode(obj),
+                                number=iterations)
+            loads_time = timeit(lambda: serializer.loads(encoded),
+                                number=iterations)
+            print("  {:<10} dumps {:8.1f} MB/s   loads {:8.1f} MB/s".format(
+                serializer.name,
+                len(encoded) * iterations / dumps_time / 1e6,
+                len(encoded) * iterations / loads_time / 1e6,
+            ))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
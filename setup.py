@@ -12,5 +12,6 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     install_requires=["requests", "nose"],
+    extras_require={"async": ["aiohttp"]},
     test_suite="nose",
 )